@@ -25,6 +25,9 @@ from routes.svp_status_routes import svp_status_bp
 from routes.coversheet_routes import coversheet_bp
 from routes.selected_entities_routes import selected_entities_bp
 from routes.basic_info_routes import basic_info_bp
+from routes.dashboard_routes import dashboard_bp
+from routes.entity_visit_routes import entity_visits_bp
+from routes.travel_budget_routes import travel_budget_bp
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -118,6 +121,9 @@ app.register_blueprint(svp_status_bp)
 app.register_blueprint(coversheet_bp)
 app.register_blueprint(selected_entities_bp)
 app.register_blueprint(basic_info_bp)
+app.register_blueprint(dashboard_bp)
+app.register_blueprint(entity_visits_bp)
+app.register_blueprint(travel_budget_bp)
 
 
 @app.route("/health", methods=["GET"])
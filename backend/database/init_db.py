@@ -122,7 +122,7 @@ def create_svp_plans_table():
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS svp_plans (
                 id SERIAL PRIMARY KEY,
-                plan_code VARCHAR(50) NOT NULL,
+                plan_code VARCHAR(50) NOT NULL UNIQUE,
                 plan_for TEXT,
                 plan_period TEXT,
                 plan_name TEXT,
@@ -131,6 +131,7 @@ def create_svp_plans_table():
                 status VARCHAR(50) DEFAULT 'In Progress',
                 team_name TEXT,
                 needs_attention TEXT,
+                version INTEGER NOT NULL DEFAULT 0,
                 created_at TIMESTAMP DEFAULT NOW()
             )
         ''')
@@ -147,6 +148,34 @@ def create_svp_plans_table():
         return False
 
 
+def add_unique_plan_code_to_svp_plans():
+    """Safe migration: give duplicate plan codes their id-derived code (first plan keeps it), then add the unique
+    index on plan_code (same name as the UNIQUE constraint in create_svp_plans_table)."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            """UPDATE public.svp_plans p
+               SET plan_code = 'PSV-' || lpad(p.id::text, GREATEST(6, length(p.id::text)), '0')
+               WHERE EXISTS (SELECT 1 FROM public.svp_plans o WHERE o.plan_code = p.plan_code AND o.id < p.id)"""
+        )
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS svp_plans_plan_code_key ON public.svp_plans (plan_code)"
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: add_unique_plan_code_to_svp_plans migration: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return False
+
+
 def create_svp_plan_access_table():
     """Create the svp_plan_access table for per-user last-accessed plan tracking."""
     conn = get_db_connection()
@@ -189,7 +218,8 @@ def create_svp_plan_sections_table():
                 plan_id INTEGER NOT NULL REFERENCES public.svp_plans(id) ON DELETE CASCADE,
                 section_id VARCHAR(50) NOT NULL,
                 name TEXT NOT NULL,
-                status VARCHAR(50) DEFAULT 'Not Started'
+                status VARCHAR(50) DEFAULT 'Not Started',
+                UNIQUE(plan_id, section_id)
             )
         ''')
         conn.commit()
@@ -240,7 +270,8 @@ def create_entities_table():
 
 
 def create_svp_plan_entities_table():
-    """Create the svp_plan_entities table for entities associated with plans."""
+    """Create the svp_plan_entities table for entities associated with plans.
+    Only plan-specific state is stored; entity attributes are read from public.entities through entity_id."""
     conn = get_db_connection()
     if not conn:
         print("❌ Failed to connect to database")
@@ -251,17 +282,11 @@ def create_svp_plan_entities_table():
             CREATE TABLE IF NOT EXISTS public.svp_plan_entities (
                 id SERIAL PRIMARY KEY,
                 plan_id INTEGER NOT NULL REFERENCES public.svp_plans(id) ON DELETE CASCADE,
+                entity_id INTEGER NOT NULL REFERENCES public.entities(id),
                 entity_number VARCHAR(50) NOT NULL,
-                entity_name TEXT NOT NULL,
-                city VARCHAR(100),
-                state VARCHAR(2),
-                midpoint_current_pp DATE,
-                active_grant_no_site_visit BOOLEAN DEFAULT FALSE,
-                active_grant_1_year_pp BOOLEAN DEFAULT FALSE,
-                active_new_grant BOOLEAN DEFAULT FALSE,
                 status VARCHAR(50) DEFAULT 'Not in Plan',
-                recent_site_visit_dates TEXT,
                 visit_started BOOLEAN DEFAULT FALSE,
+                has_basic_info BOOLEAN NOT NULL DEFAULT FALSE,
                 created_at TIMESTAMP DEFAULT NOW(),
                 UNIQUE(plan_id, entity_number)
             )
@@ -299,6 +324,118 @@ def add_visit_started_to_svp_plan_entities():
         return False
 
 
+def add_version_to_svp_plans():
+    """Safe migration: add version column to svp_plans if missing. Bumped on every plan/entity write so clients can detect changes."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "ALTER TABLE public.svp_plans ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 0"
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: add_version_to_svp_plans migration: {e}")
+        if conn:
+            conn.close()
+        return False
+
+
+def add_unique_section_to_svp_plan_sections():
+    """Safe migration: remove duplicate (plan_id, section_id) rows, keeping the newest, then add the unique index
+    used by section status upserts (same name as the UNIQUE constraint in create_svp_plan_sections_table)."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            """DELETE FROM public.svp_plan_sections s
+               USING public.svp_plan_sections newer
+               WHERE newer.plan_id = s.plan_id AND newer.section_id = s.section_id AND newer.id > s.id"""
+        )
+        removed = cursor.rowcount
+        cursor.execute(
+            """CREATE UNIQUE INDEX IF NOT EXISTS svp_plan_sections_plan_id_section_id_key
+               ON public.svp_plan_sections (plan_id, section_id)"""
+        )
+        conn.commit()
+        if removed:
+            print(f"Removed {removed} duplicate svp_plan_sections rows")
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: add_unique_section_to_svp_plan_sections migration: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return False
+
+
+PLAN_ENTITY_COPIED_COLUMNS = (
+    "entity_name", "city", "state", "midpoint_current_pp", "active_grant_no_site_visit",
+    "active_grant_1_year_pp", "active_new_grant", "recent_site_visit_dates",
+)
+
+
+def normalize_svp_plan_entities():
+    """Safe migration: link svp_plan_entities to the entities pool via entity_id (backfilled from entity_number) and drop the
+    entity attributes that used to be copied into every plan. Plan rows whose entity_number is missing from the pool are
+    first added to entities from their copied values, so no row is left without an entity."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "ALTER TABLE public.svp_plan_entities ADD COLUMN IF NOT EXISTS entity_id INTEGER REFERENCES public.entities(id)"
+        )
+        cursor.execute(
+            """SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'public' AND table_name = 'svp_plan_entities' AND column_name = 'entity_name'"""
+        )
+        if cursor.fetchone():
+            columns = ", ".join(PLAN_ENTITY_COPIED_COLUMNS)
+            cursor.execute(
+                f"""INSERT INTO public.entities (entity_number, {columns})
+                    SELECT DISTINCT ON (pe.entity_number) pe.entity_number, {", ".join("pe." + c for c in PLAN_ENTITY_COPIED_COLUMNS)}
+                    FROM public.svp_plan_entities pe
+                    WHERE NOT EXISTS (SELECT 1 FROM public.entities e WHERE e.entity_number = pe.entity_number)
+                    ORDER BY pe.entity_number, pe.id DESC
+                    ON CONFLICT (entity_number) DO NOTHING"""
+            )
+            if cursor.rowcount:
+                print(f"Added {cursor.rowcount} entities missing from the pool")
+        cursor.execute(
+            """UPDATE public.svp_plan_entities pe SET entity_id = e.id
+               FROM public.entities e
+               WHERE e.entity_number = pe.entity_number AND pe.entity_id IS NULL"""
+        )
+        cursor.execute("ALTER TABLE public.svp_plan_entities ALTER COLUMN entity_id SET NOT NULL")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS svp_plan_entities_entity_id ON public.svp_plan_entities (entity_id)"
+        )
+        cursor.execute(
+            "ALTER TABLE public.svp_plan_entities "
+            + ", ".join(f"DROP COLUMN IF EXISTS {c}" for c in PLAN_ENTITY_COPIED_COLUMNS)
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: normalize_svp_plan_entities migration: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return False
+
+
 def create_svp_entity_basic_info_table():
     """Create the svp_entity_basic_info table: one row per plan entity for Basic Information form data."""
     conn = get_db_connection()
@@ -389,11 +526,11 @@ def create_svp_entity_travel_plans_table():
             CREATE TABLE IF NOT EXISTS public.svp_entity_travel_plans (
                 id SERIAL PRIMARY KEY,
                 plan_entity_id INTEGER NOT NULL REFERENCES public.svp_plan_entities(id) ON DELETE CASCADE,
-                number_of_travelers VARCHAR(20),
+                number_of_travelers INTEGER,
                 travel_locations TEXT,
                 travel_dates TEXT,
                 travelers TEXT,
-                travel_cost VARCHAR(50),
+                travel_cost NUMERIC(12, 2),
                 status VARCHAR(50),
                 created_at TIMESTAMP DEFAULT NOW()
             )
@@ -410,6 +547,593 @@ def create_svp_entity_travel_plans_table():
         return False
 
 
+def convert_travel_plan_amounts():
+    """Safe migration: convert svp_entity_travel_plans.number_of_travelers to INTEGER and travel_cost to NUMERIC(12, 2)
+    so budgets can be summed in SQL. Legacy strings are parsed tolerantly by svp_parse_amount ("$1,250.00" -> 1250.00,
+    "3 people" -> 3); values without a number (or out of range) become NULL and are reported."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        # First number in the text, ignoring currency symbols and thousands separators; NULL when there is none
+        cursor.execute(r'''
+            CREATE OR REPLACE FUNCTION public.svp_parse_amount(v TEXT) RETURNS NUMERIC
+            LANGUAGE sql IMMUTABLE AS $$
+                SELECT substring(replace(v, ',', '') FROM '-?[0-9]+(?:\.[0-9]+)?')::numeric
+            $$
+        ''')
+        cursor.execute(
+            """SELECT column_name FROM information_schema.columns
+               WHERE table_schema = 'public' AND table_name = 'svp_entity_travel_plans'
+                 AND column_name IN ('number_of_travelers', 'travel_cost') AND data_type = 'character varying'"""
+        )
+        legacy = {r["column_name"] for r in cursor.fetchall()}
+        conversions = {
+            "number_of_travelers": ("INTEGER", "round(public.svp_parse_amount({c}))::integer", 1000000),
+            "travel_cost": ("NUMERIC(12, 2)", "round(public.svp_parse_amount({c}), 2)", 10000000000),
+        }
+        for column in sorted(legacy):
+            sql_type, expr, limit = conversions[column]
+            parsed = expr.format(c=column)
+            guarded = f"CASE WHEN abs(public.svp_parse_amount({column})) < {limit} THEN {parsed} END"
+            cursor.execute(
+                f"""SELECT COUNT(*) AS n FROM public.svp_entity_travel_plans
+                    WHERE NULLIF(btrim({column}), '') IS NOT NULL AND ({guarded}) IS NULL"""
+            )
+            unparsed = cursor.fetchone()["n"]
+            cursor.execute(
+                f"ALTER TABLE public.svp_entity_travel_plans ALTER COLUMN {column} TYPE {sql_type} USING {guarded}"
+            )
+            print(f"Converted svp_entity_travel_plans.{column} to {sql_type} ({unparsed} unparseable values set to NULL)")
+        cursor.execute(
+            """CREATE INDEX IF NOT EXISTS svp_entity_travel_plans_plan_entity_id
+               ON public.svp_entity_travel_plans (plan_entity_id)"""
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: convert_travel_plan_amounts migration: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return False
+
+
+def add_visit_range_indexes_to_svp_entity_basic_info():
+    """Safe migration: GiST index on the visit date range (calendar window and overlap queries) and btree indexes on the
+    assignee columns (assignee conflict checks). The range expression must match VISIT_RANGE_SQL in basic_info_repository."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            """CREATE INDEX IF NOT EXISTS svp_entity_basic_info_visit_range
+               ON public.svp_entity_basic_info
+               USING gist (daterange(start_date, GREATEST(start_date, COALESCE(end_date, start_date)), '[]'))
+               WHERE start_date IS NOT NULL"""
+        )
+        cursor.execute(
+            """CREATE INDEX IF NOT EXISTS svp_entity_basic_info_default_assignee
+               ON public.svp_entity_basic_info (default_assignee) WHERE start_date IS NOT NULL"""
+        )
+        cursor.execute(
+            """CREATE INDEX IF NOT EXISTS svp_entity_basic_info_optional_assignee
+               ON public.svp_entity_basic_info (optional_assignee_assignee) WHERE start_date IS NOT NULL"""
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: add_visit_range_indexes_to_svp_entity_basic_info migration: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return False
+
+
+def add_jsonb_gin_indexes_to_svp_entity_basic_info():
+    """Safe migration: jsonb_path_ops GIN index per JSONB list column, for containment (@>) searches across plans."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        for column in ("conducted_by", "reason_types", "areas_of_review", "participants", "additional_programs"):
+            cursor.execute(
+                f"""CREATE INDEX IF NOT EXISTS svp_entity_basic_info_{column}_gin
+                    ON public.svp_entity_basic_info USING gin ({column} jsonb_path_ops)"""
+            )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: add_jsonb_gin_indexes_to_svp_entity_basic_info migration: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return False
+
+
+def create_svp_plan_progress():
+    """Create svp_plan_progress (per-plan entity counters) and the statement-level triggers that keep it current.
+    Safe to re-run: tables/columns are added if missing and the counters are rebuilt from svp_plan_entities."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "ALTER TABLE public.svp_plan_entities ADD COLUMN IF NOT EXISTS has_basic_info BOOLEAN NOT NULL DEFAULT FALSE"
+        )
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS public.svp_plan_progress (
+                plan_id INTEGER PRIMARY KEY REFERENCES public.svp_plans(id) ON DELETE CASCADE,
+                total_entities INTEGER NOT NULL DEFAULT 0,
+                visit_started_entities INTEGER NOT NULL DEFAULT 0,
+                with_basic_info_entities INTEGER NOT NULL DEFAULT 0,
+                by_status JSONB NOT NULL DEFAULT '{}',
+                updated_at TIMESTAMP DEFAULT NOW()
+            )
+        ''')
+        # Adds two {status: count} objects, dropping zero counts
+        cursor.execute('''
+            CREATE OR REPLACE FUNCTION public.svp_jsonb_add_counts(a JSONB, b JSONB) RETURNS JSONB
+            LANGUAGE sql IMMUTABLE AS $$
+                SELECT COALESCE(jsonb_object_agg(key, total) FILTER (WHERE total <> 0), '{}'::jsonb)
+                FROM (
+                    SELECT key, SUM(value::int) AS total
+                    FROM (SELECT * FROM jsonb_each_text(COALESCE(a, '{}'::jsonb))
+                          UNION ALL
+                          SELECT * FROM jsonb_each_text(COALESCE(b, '{}'::jsonb))) e
+                    GROUP BY key
+                ) t
+            $$
+        ''')
+        # Applies signed entity rows [{plan_id, status, visit_started, has_basic_info, n}] to the counters
+        cursor.execute('''
+            CREATE OR REPLACE FUNCTION public.svp_plan_progress_apply(rows JSONB) RETURNS void
+            LANGUAGE sql AS $$
+                WITH src AS (
+                    SELECT * FROM jsonb_to_recordset(rows)
+                        AS r(plan_id INTEGER, status TEXT, visit_started BOOLEAN, has_basic_info BOOLEAN, n INTEGER)
+                ),
+                st AS (
+                    SELECT plan_id, COALESCE(status, '') AS status, SUM(n) AS n FROM src GROUP BY 1, 2
+                ),
+                d AS (
+                    SELECT src.plan_id,
+                           SUM(src.n) AS total,
+                           COALESCE(SUM(src.n) FILTER (WHERE src.visit_started), 0) AS visit_started,
+                           COALESCE(SUM(src.n) FILTER (WHERE src.has_basic_info), 0) AS with_basic_info,
+                           (SELECT COALESCE(jsonb_object_agg(st.status, st.n) FILTER (WHERE st.n <> 0), '{}'::jsonb)
+                            FROM st WHERE st.plan_id = src.plan_id) AS by_status
+                    FROM src GROUP BY src.plan_id
+                )
+                INSERT INTO public.svp_plan_progress AS pr
+                    (plan_id, total_entities, visit_started_entities, with_basic_info_entities, by_status, updated_at)
+                SELECT d.plan_id, d.total, d.visit_started, d.with_basic_info, d.by_status, NOW()
+                FROM d JOIN public.svp_plans p ON p.id = d.plan_id
+                WHERE d.total <> 0 OR d.visit_started <> 0 OR d.with_basic_info <> 0 OR d.by_status <> '{}'::jsonb
+                ON CONFLICT (plan_id) DO UPDATE SET
+                    total_entities = pr.total_entities + EXCLUDED.total_entities,
+                    visit_started_entities = pr.visit_started_entities + EXCLUDED.visit_started_entities,
+                    with_basic_info_entities = pr.with_basic_info_entities + EXCLUDED.with_basic_info_entities,
+                    by_status = public.svp_jsonb_add_counts(pr.by_status, EXCLUDED.by_status),
+                    updated_at = NOW()
+            $$
+        ''')
+        cursor.execute('''
+            CREATE OR REPLACE FUNCTION public.svp_plan_progress_on_entities() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    PERFORM public.svp_plan_progress_apply((SELECT jsonb_agg(r) FROM (
+                        SELECT plan_id, status, visit_started, has_basic_info, 1 AS n FROM new_rows) r));
+                ELSIF TG_OP = 'DELETE' THEN
+                    PERFORM public.svp_plan_progress_apply((SELECT jsonb_agg(r) FROM (
+                        SELECT plan_id, status, visit_started, has_basic_info, -1 AS n FROM old_rows) r));
+                ELSE
+                    PERFORM public.svp_plan_progress_apply((SELECT jsonb_agg(r) FROM (
+                        SELECT plan_id, status, visit_started, has_basic_info, 1 AS n FROM new_rows
+                        UNION ALL
+                        SELECT plan_id, status, visit_started, has_basic_info, -1 AS n FROM old_rows) r));
+                END IF;
+                RETURN NULL;
+            END
+            $$
+        ''')
+        cursor.execute('''
+            CREATE OR REPLACE FUNCTION public.svp_plan_entities_basic_info_flag() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    UPDATE public.svp_plan_entities pe SET has_basic_info = TRUE
+                    FROM new_rows n WHERE pe.id = n.plan_entity_id AND NOT pe.has_basic_info;
+                ELSE
+                    UPDATE public.svp_plan_entities pe SET has_basic_info = FALSE
+                    FROM old_rows o WHERE pe.id = o.plan_entity_id AND pe.has_basic_info;
+                END IF;
+                RETURN NULL;
+            END
+            $$
+        ''')
+        triggers = [
+            ("svp_plan_entities_progress_ins", "INSERT", "svp_plan_entities", "NEW TABLE AS new_rows",
+             "svp_plan_progress_on_entities"),
+            ("svp_plan_entities_progress_upd", "UPDATE", "svp_plan_entities", "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+             "svp_plan_progress_on_entities"),
+            ("svp_plan_entities_progress_del", "DELETE", "svp_plan_entities", "OLD TABLE AS old_rows",
+             "svp_plan_progress_on_entities"),
+            ("svp_entity_basic_info_flag_ins", "INSERT", "svp_entity_basic_info", "NEW TABLE AS new_rows",
+             "svp_plan_entities_basic_info_flag"),
+            ("svp_entity_basic_info_flag_del", "DELETE", "svp_entity_basic_info", "OLD TABLE AS old_rows",
+             "svp_plan_entities_basic_info_flag"),
+        ]
+        for name, event, table, referencing, function in triggers:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name} ON public.{table}")
+            cursor.execute(
+                f"CREATE TRIGGER {name} AFTER {event} ON public.{table} REFERENCING {referencing} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION public.{function}()"
+            )
+        # Backfill / repair: rebuild every plan's counters from the current rows
+        cursor.execute(
+            """UPDATE public.svp_plan_entities pe
+               SET has_basic_info = EXISTS (SELECT 1 FROM public.svp_entity_basic_info bi WHERE bi.plan_entity_id = pe.id)
+               WHERE has_basic_info IS DISTINCT FROM
+                     EXISTS (SELECT 1 FROM public.svp_entity_basic_info bi WHERE bi.plan_entity_id = pe.id)"""
+        )
+        cursor.execute("DELETE FROM public.svp_plan_progress")
+        cursor.execute(
+            """INSERT INTO public.svp_plan_progress
+                   (plan_id, total_entities, visit_started_entities, with_basic_info_entities, by_status)
+               SELECT c.plan_id, c.total, c.visit_started, c.with_basic_info, s.by_status
+               FROM (
+                   SELECT plan_id, COUNT(*) AS total,
+                          COUNT(*) FILTER (WHERE visit_started) AS visit_started,
+                          COUNT(*) FILTER (WHERE has_basic_info) AS with_basic_info
+                   FROM public.svp_plan_entities GROUP BY plan_id
+               ) c
+               JOIN (
+                   SELECT plan_id, jsonb_object_agg(status, n) AS by_status
+                   FROM (SELECT plan_id, COALESCE(status, '') AS status, COUNT(*) AS n
+                         FROM public.svp_plan_entities GROUP BY 1, 2) t
+                   GROUP BY plan_id
+               ) s ON s.plan_id = c.plan_id"""
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: create_svp_plan_progress migration: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return False
+
+
+def create_svp_dashboard_views():
+    """Create the dashboard materialized views (plan summary per status/team/period/plan_for and visits per start month),
+    their unique indexes (required by REFRESH MATERIALIZED VIEW CONCURRENTLY) and svp_dashboard_refresh (last refresh time per view)."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS public.svp_dashboard_refresh (
+                view_name VARCHAR(100) PRIMARY KEY,
+                refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            )
+        ''')
+        cursor.execute('''
+            CREATE MATERIALIZED VIEW IF NOT EXISTS public.svp_dashboard_plan_summary AS
+            SELECT COALESCE(p.status, '') AS status,
+                   COALESCE(p.team_name, '') AS team_name,
+                   COALESCE(p.plan_period, '') AS plan_period,
+                   COALESCE(p.plan_for, '') AS plan_for,
+                   COUNT(*) AS plans,
+                   COALESCE(SUM(pr.total_entities), 0) AS entities,
+                   COALESCE(SUM((pr.by_status->>'Complete')::int), 0) AS complete_entities,
+                   COALESCE(SUM(pr.visit_started_entities), 0) AS visit_started_entities,
+                   COALESCE(SUM(pr.with_basic_info_entities), 0) AS with_basic_info_entities
+            FROM public.svp_plans p
+            LEFT JOIN public.svp_plan_progress pr ON pr.plan_id = p.id
+            GROUP BY 1, 2, 3, 4
+        ''')
+        cursor.execute(
+            """CREATE UNIQUE INDEX IF NOT EXISTS svp_dashboard_plan_summary_key
+               ON public.svp_dashboard_plan_summary (status, team_name, plan_period, plan_for)"""
+        )
+        cursor.execute('''
+            CREATE MATERIALIZED VIEW IF NOT EXISTS public.svp_dashboard_visit_months AS
+            SELECT COALESCE(p.status, '') AS status,
+                   COALESCE(p.team_name, '') AS team_name,
+                   COALESCE(p.plan_period, '') AS plan_period,
+                   COALESCE(p.plan_for, '') AS plan_for,
+                   date_trunc('month', bi.start_date)::date AS month,
+                   COUNT(*) AS visits
+            FROM public.svp_entity_basic_info bi
+            JOIN public.svp_plan_entities pe ON pe.id = bi.plan_entity_id
+            JOIN public.svp_plans p ON p.id = pe.plan_id
+            WHERE bi.start_date IS NOT NULL
+            GROUP BY 1, 2, 3, 4, 5
+        ''')
+        cursor.execute(
+            """CREATE UNIQUE INDEX IF NOT EXISTS svp_dashboard_visit_months_key
+               ON public.svp_dashboard_visit_months (status, team_name, plan_period, plan_for, month)"""
+        )
+        cursor.execute(
+            """INSERT INTO public.svp_dashboard_refresh (view_name)
+               VALUES ('svp_dashboard_plan_summary'), ('svp_dashboard_visit_months')
+               ON CONFLICT (view_name) DO NOTHING"""
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: create_svp_dashboard_views migration: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return False
+
+
+def add_grant_period_to_entities():
+    """Safe migration: add the grant source columns the eligibility flags are recomputed from
+    (see repositories/entity_flags_repository.py). NULL means unknown; the seeded flags are kept for those entities."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+            ALTER TABLE public.entities
+                ADD COLUMN IF NOT EXISTS current_pp_start DATE,
+                ADD COLUMN IF NOT EXISTS current_pp_end DATE,
+                ADD COLUMN IF NOT EXISTS grant_award_date DATE
+        ''')
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: add_grant_period_to_entities migration: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return False
+
+
+def create_entity_site_visits():
+    """Create entity_site_visits (structured visit history per entity) and the SQL functions/triggers that record a visit
+    when a plan entity with basic info dates is Complete and derive entities.recent_site_visit_dates and
+    active_grant_no_site_visit from the history. Legacy text is parsed by backfill_entity_site_visit_history()."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS public.entity_site_visits (
+                id SERIAL PRIMARY KEY,
+                entity_id INTEGER NOT NULL REFERENCES public.entities(id) ON DELETE CASCADE,
+                start_date DATE NOT NULL,
+                end_date DATE NOT NULL,
+                visit_type TEXT,
+                source VARCHAR(20) NOT NULL,
+                plan_entity_id INTEGER REFERENCES public.svp_plan_entities(id) ON DELETE SET NULL,
+                created_at TIMESTAMP DEFAULT NOW(),
+                CHECK (end_date >= start_date)
+            )
+        ''')
+        cursor.execute(
+            """CREATE INDEX IF NOT EXISTS entity_site_visits_entity_start
+               ON public.entity_site_visits (entity_id, start_date DESC)"""
+        )
+        cursor.execute(
+            """CREATE UNIQUE INDEX IF NOT EXISTS entity_site_visits_plan_entity_key
+               ON public.entity_site_visits (plan_entity_id) WHERE plan_entity_id IS NOT NULL"""
+        )
+        # Years without a visit before active_grant_no_site_visit is set (app_config key site_visit_lookback_years, default 3)
+        cursor.execute('''
+            CREATE OR REPLACE FUNCTION public.svp_site_visit_lookback_years() RETURNS INTEGER
+            LANGUAGE sql STABLE AS $$
+                SELECT COALESCE((SELECT (value #>> '{}')::int FROM public.app_config
+                                 WHERE key = 'site_visit_lookback_years' AND value #>> '{}' ~ '^[0-9]+$'), 3)
+            $$
+        ''')
+        # Set once an entity has structured history; from then on its display text is derived only from the history
+        cursor.execute(
+            "ALTER TABLE public.entities ADD COLUMN IF NOT EXISTS has_site_visit_history BOOLEAN NOT NULL DEFAULT FALSE"
+        )
+        # Derive display text (latest three visits) and the no-recent-visit flag for the given entities (NULL = all).
+        # Plans read both through svp_plan_entities.entity_id. Entities that never had history keep their legacy text,
+        # and their flag is only derived when that text is empty (unparsed text may record a visit). Entities without a grant
+        # period (current_pp_end) keep their flag too.
+        cursor.execute('''
+            CREATE OR REPLACE FUNCTION public.svp_refresh_entity_visit_rollups(ids INTEGER[]) RETURNS INTEGER
+            LANGUAGE plpgsql AS $$
+            DECLARE
+                changed INTEGER;
+            BEGIN
+                UPDATE public.entities e
+                SET recent_site_visit_dates = r.display_text,
+                    has_site_visit_history = r.has_history,
+                    active_grant_no_site_visit = CASE WHEN r.flag_known THEN r.no_recent_visit
+                                                      ELSE e.active_grant_no_site_visit END
+                FROM (
+                    SELECT h.id, h.has_history, h.no_recent_visit,
+                           CASE WHEN h.display IS NOT NULL THEN h.display
+                                WHEN h.has_history THEN NULL
+                                ELSE h.legacy_text END AS display_text,
+                           h.has_grant_period AND (h.has_history OR COALESCE(h.legacy_text, '') = '') AS flag_known
+                    FROM (
+                        SELECT x.id, x.recent_site_visit_dates AS legacy_text,
+                               (SELECT string_agg(
+                                           to_char(v.start_date, 'MM/DD/YYYY')
+                                           || CASE WHEN v.end_date > v.start_date THEN ' - ' || to_char(v.end_date, 'MM/DD/YYYY') ELSE '' END
+                                           || COALESCE(' (' || NULLIF(v.visit_type, '') || ')', ''),
+                                           '; ' ORDER BY v.start_date DESC, v.id DESC)
+                                FROM (SELECT * FROM public.entity_site_visits v WHERE v.entity_id = x.id
+                                      ORDER BY v.start_date DESC, v.id DESC LIMIT 3) v) AS display,
+                               x.has_site_visit_history
+                                   OR EXISTS (SELECT 1 FROM public.entity_site_visits v WHERE v.entity_id = x.id) AS has_history,
+                               NOT EXISTS (SELECT 1 FROM public.entity_site_visits v
+                                           WHERE v.entity_id = x.id
+                                             AND v.start_date >= CURRENT_DATE - make_interval(years => public.svp_site_visit_lookback_years())
+                               ) AND x.current_pp_end >= CURRENT_DATE AS no_recent_visit,
+                               x.current_pp_end IS NOT NULL AS has_grant_period
+                        FROM public.entities x WHERE ids IS NULL OR x.id = ANY(ids)
+                    ) h
+                ) r
+                WHERE e.id = r.id
+                  AND (e.recent_site_visit_dates IS DISTINCT FROM r.display_text
+                       OR e.has_site_visit_history IS DISTINCT FROM r.has_history
+                       OR (r.flag_known AND e.active_grant_no_site_visit IS DISTINCT FROM r.no_recent_visit));
+                GET DIAGNOSTICS changed = ROW_COUNT;
+                RETURN changed;
+            END
+            $$
+        ''')
+        # Record (or drop) the basic-info visit of each given plan entity: one visit per Complete entity with a start date
+        cursor.execute('''
+            CREATE OR REPLACE FUNCTION public.svp_sync_entity_site_visits(ids INTEGER[]) RETURNS void
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF COALESCE(cardinality(ids), 0) = 0 THEN
+                    RETURN;
+                END IF;
+                DELETE FROM public.entity_site_visits v
+                WHERE v.plan_entity_id = ANY(ids)
+                  AND NOT EXISTS (SELECT 1 FROM public.svp_plan_entities pe
+                                  JOIN public.svp_entity_basic_info bi ON bi.plan_entity_id = pe.id
+                                  WHERE pe.id = v.plan_entity_id AND pe.status = 'Complete' AND bi.start_date IS NOT NULL);
+                INSERT INTO public.entity_site_visits (entity_id, start_date, end_date, visit_type, source, plan_entity_id)
+                SELECT e.id, bi.start_date, GREATEST(bi.start_date, COALESCE(bi.end_date, bi.start_date)),
+                       NULLIF(bi.site_visit_type_primary, ''), 'basic_info', pe.id
+                FROM public.svp_plan_entities pe
+                JOIN public.svp_entity_basic_info bi ON bi.plan_entity_id = pe.id
+                JOIN public.entities e ON e.id = pe.entity_id
+                WHERE pe.id = ANY(ids) AND pe.status = 'Complete' AND bi.start_date IS NOT NULL
+                ON CONFLICT (plan_entity_id) WHERE plan_entity_id IS NOT NULL DO UPDATE SET
+                    entity_id = EXCLUDED.entity_id, start_date = EXCLUDED.start_date,
+                    end_date = EXCLUDED.end_date, visit_type = EXCLUDED.visit_type;
+                PERFORM public.svp_refresh_entity_visit_rollups(ARRAY(
+                    SELECT DISTINCT pe.entity_id FROM public.svp_plan_entities pe WHERE pe.id = ANY(ids)));
+            END
+            $$
+        ''')
+        cursor.execute('''
+            CREATE OR REPLACE FUNCTION public.svp_site_visits_on_entities() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                PERFORM public.svp_sync_entity_site_visits(ARRAY(
+                    SELECT n.id FROM new_rows n JOIN old_rows o ON o.id = n.id
+                    WHERE n.status IS DISTINCT FROM o.status AND 'Complete' IN (n.status, o.status)));
+                RETURN NULL;
+            END
+            $$
+        ''')
+        cursor.execute('''
+            CREATE OR REPLACE FUNCTION public.svp_site_visits_on_basic_info() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    PERFORM public.svp_sync_entity_site_visits(ARRAY(SELECT plan_entity_id FROM new_rows));
+                ELSE
+                    PERFORM public.svp_sync_entity_site_visits(ARRAY(
+                        SELECT n.plan_entity_id FROM new_rows n JOIN old_rows o ON o.id = n.id
+                        WHERE (n.start_date, n.end_date, n.site_visit_type_primary)
+                              IS DISTINCT FROM (o.start_date, o.end_date, o.site_visit_type_primary)));
+                END IF;
+                RETURN NULL;
+            END
+            $$
+        ''')
+        triggers = [
+            ("svp_plan_entities_site_visits_upd", "UPDATE", "svp_plan_entities", "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+             "svp_site_visits_on_entities"),
+            ("svp_entity_basic_info_site_visits_ins", "INSERT", "svp_entity_basic_info", "NEW TABLE AS new_rows",
+             "svp_site_visits_on_basic_info"),
+            ("svp_entity_basic_info_site_visits_upd", "UPDATE", "svp_entity_basic_info", "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+             "svp_site_visits_on_basic_info"),
+        ]
+        for name, event, table, referencing, function in triggers:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name} ON public.{table}")
+            cursor.execute(
+                f"CREATE TRIGGER {name} AFTER {event} ON public.{table} REFERENCING {referencing} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION public.{function}()"
+            )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: create_entity_site_visits migration: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return False
+
+
+def add_needs_attention_scan_support():
+    """Safe migration for the needs_attention scanner (repositories/plan_attention_repository.py): track when a section's
+    status last changed, and index each deadline predicate the scanner runs as a range query."""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "ALTER TABLE public.svp_plan_sections ADD COLUMN IF NOT EXISTS status_changed_at TIMESTAMP NOT NULL DEFAULT NOW()"
+        )
+        cursor.execute('''
+            CREATE OR REPLACE FUNCTION public.svp_plan_sections_status_changed() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF NEW.status IS DISTINCT FROM OLD.status THEN
+                    NEW.status_changed_at := NOW();
+                END IF;
+                RETURN NEW;
+            END
+            $$
+        ''')
+        cursor.execute("DROP TRIGGER IF EXISTS svp_plan_sections_status_changed ON public.svp_plan_sections")
+        cursor.execute(
+            """CREATE TRIGGER svp_plan_sections_status_changed BEFORE UPDATE OF status ON public.svp_plan_sections
+               FOR EACH ROW EXECUTE FUNCTION public.svp_plan_sections_status_changed()"""
+        )
+        cursor.execute(
+            """CREATE INDEX IF NOT EXISTS svp_plan_sections_in_progress_since
+               ON public.svp_plan_sections (status_changed_at) WHERE status = 'In Progress'"""
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS entities_midpoint_current_pp ON public.entities (midpoint_current_pp)"
+        )
+        cursor.execute(
+            """CREATE INDEX IF NOT EXISTS svp_entity_basic_info_visit_end
+               ON public.svp_entity_basic_info (COALESCE(end_date, start_date)) WHERE start_date IS NOT NULL"""
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: add_needs_attention_scan_support migration: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+        return False
+
+
 def create_menu_tables():
     """Create menu_item and menu_item_child tables for left sidebar menu."""
     conn = get_db_connection()
@@ -903,6 +1627,21 @@ def seed_entities_data():
         return False
 
 
+def backfill_entity_site_visit_history():
+    """Parse legacy entities.recent_site_visit_dates text into entity_site_visits (entities without history only),
+    record visits of completed plan entities and derive the display text/flags. Safe to re-run."""
+    from repositories.entity_visit_repository import backfill_entity_site_visits
+    result = backfill_entity_site_visits()
+    if result is None:
+        print("Warning: entity site visit backfill failed")
+        return False
+    print(
+        f"✅ Entity site visit history backfilled: {result['legacy_visits']} visits from text, "
+        f"{len(result['unparsed'])} unparsed, {result['entities_updated']} entities updated"
+    )
+    return True
+
+
 if __name__ == '__main__':
     print("Creating database tables...")
     # Core tables
@@ -917,9 +1656,21 @@ if __name__ == '__main__':
     create_entities_table()
     create_svp_plan_entities_table()
     add_visit_started_to_svp_plan_entities()
+    normalize_svp_plan_entities()
+    add_version_to_svp_plans()
+    add_unique_section_to_svp_plan_sections()
+    add_unique_plan_code_to_svp_plans()
     create_svp_entity_basic_info_table()
     create_basic_info_assignee_table()
     create_svp_entity_travel_plans_table()
+    convert_travel_plan_amounts()
+    add_visit_range_indexes_to_svp_entity_basic_info()
+    add_jsonb_gin_indexes_to_svp_entity_basic_info()
+    create_svp_plan_progress()
+    create_svp_dashboard_views()
+    add_grant_period_to_entities()
+    create_entity_site_visits()
+    add_needs_attention_scan_support()
     
     # Menu and navigation tables
     create_menu_tables()
@@ -941,5 +1692,6 @@ if __name__ == '__main__':
     # Seed assignees and entities
     seed_basic_info_assignees()
     seed_entities_data()
+    backfill_entity_site_visit_history()
     
     print("\n✅ Database initialization complete!")
@@ -1,10 +1,22 @@
 """Basic Information page repository: get/upsert basic info and travel plans for a plan entity; fetch assignee options."""
 import json
 import logging
+import re
+from decimal import ROUND_HALF_UP, Decimal
+
+from psycopg2.extras import execute_values
 
 from config.database import get_db_connection
-from repositories.svp_plan_repository import get_svp_plan_by_id
-from repositories.selected_entities_repository import get_plan_entities
+from repositories.grid_query import TEXT, build_filter_clause
+from repositories.svp_plan_repository import _plan_row_from_svp_plans, _sections_from_db_rows
+from repositories.selected_entities_repository import (
+    ENTITY_JOIN,
+    _all_plan_entities_complete,
+    _bump_plan_version,
+    _entity_row_to_dict,
+    _int_ids,
+    _set_section_status,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,48 +44,60 @@ def get_assignees():
             conn.close()
 
 
-def _plan_entity_id_from_entity_id(plan_id, entity_id):
-    """Resolve plan_entity_id: entity_id from API is svp_plan_entities.id (or entity_number as fallback). Verify it belongs to plan_id."""
+def _lookup_plan_entity_id(plan_id, entity_id):
+    """Resolve plan_entity_id with one keyed lookup: entity_id is svp_plan_entities.id, or entity_number as fallback
+    (an id match wins). Served by the primary key and the (plan_id, entity_number) unique index.
+    Returns (plan_entity_id, None) or (None, reason)."""
     plan_id_str = str(plan_id).strip()
     entity_id_str = str(entity_id).strip() if entity_id is not None else ""
     if not entity_id_str:
-        logger.warning("_plan_entity_id_from_entity_id: empty entity_id (plan_id=%s)", plan_id_str)
-        return None
-    entities = get_plan_entities(plan_id_str)
-    if not entities:
-        logger.warning("_plan_entity_id_from_entity_id: no entities for plan_id=%s", plan_id_str)
-        return None
-    entity_ids = [str(e.get("id")) for e in entities]
-    # Match by svp_plan_entities.id (compare as string; id from DB may be int or str in dict)
-    entity = next((e for e in entities if str(e.get("id")) == entity_id_str), None)
-    # Fallback: match by entity_number (in case frontend or URL uses entity_number)
-    if entity is None:
-        entity = next((e for e in entities if (e.get("entity_number") or "").strip() == entity_id_str), None)
-    if entity is None:
-        logger.warning(
-            "_plan_entity_id_from_entity_id: entity_id=%s not in plan_id=%s (plan has entity ids: %s)",
-            entity_id_str, plan_id_str, entity_ids
+        return None, "entity_id is missing"
+    plan_match = "p.id = %s" if plan_id_str.isdigit() else "p.plan_code = %s"
+    entity_id_int = int(entity_id_str) if entity_id_str.isdigit() else None
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None, "database connection unavailable"
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute(
+            """SELECT p.id AS plan_id, pe.id
+               FROM public.svp_plans p
+               LEFT JOIN LATERAL (
+                   SELECT id FROM public.svp_plan_entities
+                   WHERE plan_id = p.id AND (id = %s OR entity_number = %s)
+                   ORDER BY id = %s DESC LIMIT 1
+               ) pe ON TRUE
+               WHERE """ + plan_match,
+            (entity_id_int, entity_id_str, entity_id_int, int(plan_id_str) if plan_id_str.isdigit() else plan_id_str),
         )
-        return None
-    return int(entity["id"])
+        row = cursor.fetchone()
+        cursor.close()
+        if not row:
+            return None, f"plan {plan_id_str!r} not found"
+        if row["id"] is None:
+            return None, f"entity_id {entity_id_str!r} not in plan"
+        return int(row["id"]), None
+    except Exception as e:
+        logger.exception("_lookup_plan_entity_id: error %s", e)
+        return None, "lookup failed"
+    finally:
+        if conn:
+            conn.close()
+
+
+def _plan_entity_id_from_entity_id(plan_id, entity_id):
+    """Resolve plan_entity_id: entity_id from API is svp_plan_entities.id (or entity_number as fallback). Verify it belongs to plan_id."""
+    plan_entity_id, reason = _lookup_plan_entity_id(plan_id, entity_id)
+    if plan_entity_id is None:
+        logger.warning("_plan_entity_id_from_entity_id: plan_id=%s entity_id=%s: %s", plan_id, entity_id, reason)
+    return plan_entity_id
 
 
 def get_plan_entity_id_or_reason(plan_id, entity_id):
     """Resolve plan_entity_id; if not found return (None, reason_string) for 404 detail."""
-    plan_id_str = str(plan_id).strip()
-    entity_id_str = str(entity_id).strip() if entity_id is not None else ""
-    if not entity_id_str:
-        return None, "entity_id is missing"
-    entities = get_plan_entities(plan_id_str)
-    if not entities:
-        return None, "plan has no entities"
-    entity_ids = [str(e.get("id")) for e in entities]
-    entity = next((e for e in entities if str(e.get("id")) == entity_id_str), None)
-    if entity is None:
-        entity = next((e for e in entities if (e.get("entity_number") or "").strip() == entity_id_str), None)
-    if entity is None:
-        return None, f"entity_id {entity_id_str!r} not in plan (plan has entity ids: {entity_ids})"
-    return int(entity["id"]), None
+    return _lookup_plan_entity_id(plan_id, entity_id)
 
 
 def _row_to_basic_info_dict(row):
@@ -111,7 +135,7 @@ def _travel_row_to_dict(row):
         "travel_locations": row.get("travel_locations"),
         "travel_dates": row.get("travel_dates"),
         "travelers": row.get("travelers"),
-        "travel_cost": row.get("travel_cost"),
+        "travel_cost": float(row["travel_cost"]) if row.get("travel_cost") is not None else None,
         "status": row.get("status"),
     }
 
@@ -170,21 +194,72 @@ def get_travel_plans(plan_entity_id):
             conn.close()
 
 
-def get_basic_info(plan_id, entity_id):
-    """Return full basic info payload for the given plan and entity. Merges DB row (if any) with plan + entity context."""
+# One plan entity with its plan, sections, basic info row (from table or CTE "bi") and travel plans as JSON
+_BASIC_INFO_CONTEXT_SELECT = """SELECT row_to_json(p) AS plan,
+          (SELECT json_agg(json_build_object('section_id', s.section_id, 'name', s.name, 'status', s.status))
+           FROM public.svp_plan_sections s WHERE s.plan_id = p.id) AS sections,
+          pe.id, pe.plan_id, pe.entity_number, e.entity_name, e.city, e.state, e.midpoint_current_pp,
+          e.active_grant_no_site_visit, e.active_grant_1_year_pp, e.active_new_grant, pe.status,
+          e.recent_site_visit_dates, pe.visit_started,
+          CASE WHEN bi.id IS NULL THEN NULL ELSE row_to_json(bi) END AS basic_info,
+          (SELECT COALESCE(json_agg(json_build_object(
+                      'id', t.id, 'number_of_travelers', t.number_of_travelers,
+                      'travel_locations', t.travel_locations, 'travel_dates', t.travel_dates,
+                      'travelers', t.travelers, 'travel_cost', t.travel_cost, 'status', t.status
+                  ) ORDER BY t.id), '[]'::json)
+           FROM public.svp_entity_travel_plans t WHERE t.plan_entity_id = pe.id) AS travel_plans
+   FROM public.svp_plans p
+   JOIN public.svp_plan_entities pe ON pe.plan_id = p.id
+   """ + ENTITY_JOIN + """
+   LEFT JOIN {basic_info} bi ON bi.plan_entity_id = pe.id"""
+
+
+def _context_from_row(row):
+    """Split a _BASIC_INFO_CONTEXT_SELECT row into (plan_dict, entity_dict, basic_info_row, travel_plans)."""
+    row = dict(row)
+    plan = _plan_row_from_svp_plans(row["plan"])
+    plan["sections"] = _sections_from_db_rows(row["sections"])
+    entity = _entity_row_to_dict(row)
+    travel_plans = [_travel_row_to_dict(tp) for tp in (row["travel_plans"] or [])]
+    return plan, entity, row["basic_info"], travel_plans
+
+
+def _load_basic_info_context(plan_id, entity_id):
+    """Fetch one plan entity with its plan, sections, basic info row and travel plans in a single query.
+    Returns (plan_dict, entity_dict, basic_info_row, travel_plans) or None if the plan/entity pair does not exist."""
     plan_id_str = str(plan_id).strip()
     entity_id_str = str(entity_id).strip()
-    plan = get_svp_plan_by_id(plan_id_str)
-    if plan is None:
+    if not entity_id_str.isdigit():
         return None
-    entities = get_plan_entities(plan_id_str)
-    entity = next((e for e in entities if str(e.get("id")) == entity_id_str), None)
-    if entity is None:
+    plan_match = "p.id = %s" if plan_id_str.isdigit() else "p.plan_code = %s"
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute(
+            _BASIC_INFO_CONTEXT_SELECT.format(basic_info="public.svp_entity_basic_info")
+            + " WHERE " + plan_match + " AND pe.id = %s",
+            (int(plan_id_str) if plan_id_str.isdigit() else plan_id_str, int(entity_id_str)),
+        )
+        row = cursor.fetchone()
+        cursor.close()
+        return _context_from_row(row) if row else None
+    except Exception as e:
+        logger.exception("_load_basic_info_context: error %s", e)
         return None
+    finally:
+        if conn:
+            conn.close()
 
-    plan_entity_id = int(entity_id_str)
-    db_row = get_basic_info_row(plan_entity_id)
-    travel_plans = get_travel_plans(plan_entity_id)
+
+def _build_basic_info_payload(plan_id, entity_id, context):
+    """Build the API payload from (plan, entity, basic_info_row, travel_plans): defaults overlaid with stored values."""
+    plan_id_str = str(plan_id).strip()
+    entity_id_str = str(entity_id).strip()
+    plan, entity, db_row, travel_plans = context
 
     tracking_number = f"SV-{plan_id_str}-{entity_id_str}"
     city = (entity.get("city") or "").strip()
@@ -237,6 +312,66 @@ def get_basic_info(plan_id, entity_id):
     return base
 
 
+def get_basic_info(plan_id, entity_id):
+    """Return full basic info payload for the given plan and entity. Merges DB row (if any) with plan + entity context."""
+    context = _load_basic_info_context(plan_id, entity_id)
+    if context is None:
+        return None
+    return _build_basic_info_payload(plan_id, entity_id, context)
+
+
+def get_basic_info_summary(plan_id_int):
+    """Return one compact Basic Information row per plan entity (dates, assignee, prioritization, status, travel plan count
+    and total travel cost, None when no travel plan has a cost) from a single LEFT JOIN of svp_plan_entities with svp_entity_basic_info and svp_entity_travel_plans. None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute(
+            """SELECT pe.id, pe.entity_number, e.entity_name, pe.status, pe.visit_started,
+                      bi.id AS basic_info_id, bi.start_date, bi.end_date, bi.default_assignee, bi.prioritization,
+                      bi.tracking_number, COUNT(t.id) AS travel_plan_count, SUM(t.travel_cost) AS travel_cost
+               FROM public.svp_plan_entities pe
+               JOIN public.entities e ON e.id = pe.entity_id
+               LEFT JOIN public.svp_entity_basic_info bi ON bi.plan_entity_id = pe.id
+               LEFT JOIN public.svp_entity_travel_plans t ON t.plan_entity_id = pe.id
+               WHERE pe.plan_id = %s
+               GROUP BY pe.id, e.id, bi.id
+               ORDER BY pe.entity_number""",
+            (plan_id_int,),
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+        return [
+            {
+                "id": str(r["id"]),
+                "entity_number": r["entity_number"] or "",
+                "entity_name": r["entity_name"] or "",
+                "status": r["status"] or "Not in Plan",
+                "complete": r["status"] == "Complete",
+                "visit_started": bool(r["visit_started"]),
+                "has_basic_info": r["basic_info_id"] is not None,
+                "start_date": r["start_date"].strftime("%Y-%m-%d") if r["start_date"] else None,
+                "end_date": r["end_date"].strftime("%Y-%m-%d") if r["end_date"] else None,
+                "default_assignee": r["default_assignee"],
+                "prioritization": r["prioritization"],
+                "tracking_number": r["tracking_number"],
+                "travel_plan_count": int(r["travel_plan_count"]),
+                "travel_cost": float(r["travel_cost"]) if r["travel_cost"] is not None else None,
+            }
+            for r in rows
+        ]
+    except Exception as e:
+        logger.exception("get_basic_info_summary: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
 def _date_or_none(s):
     """Parse YYYY-MM-DD string to date or None."""
     if s is None or (isinstance(s, str) and not s.strip()):
@@ -250,29 +385,153 @@ def _date_or_none(s):
         return None
 
 
-def _merge_payload_with_row(payload, existing_row):
-    """Merge payload into existing row so only keys present in payload overwrite. Ignore 'action'."""
-    out = dict(existing_row) if existing_row else {}
-    skip = {"action", "plan", "entity", "grant_label", "site_visit_initiated_for", "travel_plans"}
-    for key, value in payload.items():
-        if key in skip:
+def _text_or_none(value):
+    """Strip a text field; empty becomes None."""
+    if value is None:
+        return None
+    return str(value).strip() or None
+
+
+# First number in a free-text amount, like svp_parse_amount in init_db ("$1,250.00" -> 1250.00, "3 people" -> 3)
+_AMOUNT_RE = re.compile(r"-?[0-9]+(?:\.[0-9]+)?")
+
+
+def _amount_or_none(value):
+    """Parse a travel amount (number or text) to Decimal rounded to cents; None when there is no number."""
+    if value is None or isinstance(value, bool):
+        return None
+    match = _AMOUNT_RE.search(str(value).replace(",", ""))
+    if not match:
+        return None
+    amount = Decimal(match.group(0)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return amount if abs(amount) < 10 ** 10 else None
+
+
+def _count_or_none(value):
+    """Parse a traveler count (number or text) to int; None when there is no number."""
+    amount = _amount_or_none(value)
+    if amount is None or abs(amount) >= 10 ** 6:
+        return None
+    return int(amount.to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _json_list(value):
+    """JSONB list column value: lists are stored as JSON, anything else as []."""
+    return json.dumps(value if isinstance(value, list) else [])
+
+
+# Writable svp_entity_basic_info columns -> normalizer for the payload value (with the SQL cast for the placeholder)
+BASIC_INFO_COLUMNS = {
+    "start_date": (_date_or_none, "::date"),
+    "end_date": (_date_or_none, "::date"),
+    "conducted_by": (_json_list, "::jsonb"),
+    "location": (_text_or_none, ""),
+    "location_other": (_text_or_none, ""),
+    "reason_types": (_json_list, "::jsonb"),
+    "reason_other": (_text_or_none, ""),
+    "justification": (_text_or_none, ""),
+    "site_visit_type_primary": (_text_or_none, ""),
+    "site_visit_type_primary_other": (_text_or_none, ""),
+    "site_visit_type_secondary": (_text_or_none, ""),
+    "site_visit_type_secondary_other": (_text_or_none, ""),
+    "areas_of_review": (_json_list, "::jsonb"),
+    "areas_of_review_other": (_text_or_none, ""),
+    "default_assignee": (_text_or_none, ""),
+    "optional_assignee_role": (_text_or_none, ""),
+    "optional_assignee_team": (_text_or_none, ""),
+    "optional_assignee_assignee": (_text_or_none, ""),
+    "participants": (_json_list, "::jsonb"),
+    "prioritization": (_text_or_none, ""),
+    "additional_programs": (_json_list, "::jsonb"),
+    "tracking_number": (_text_or_none, ""),
+}
+
+
+def _partial_upsert_sql(columns):
+    """INSERT ... ON CONFLICT DO UPDATE statement (as CTE "bi") that writes only the given columns, returning the row."""
+    names = ", ".join(["plan_entity_id"] + columns + ["updated_at"])
+    values = ", ".join(["%s"] + [f"%s{BASIC_INFO_COLUMNS[c][1]}" for c in columns] + ["NOW()"])
+    updates = ", ".join([f"{c} = EXCLUDED.{c}" for c in columns] + ["updated_at = NOW()"])
+    return (
+        f"INSERT INTO public.svp_entity_basic_info ({names}) VALUES ({values}) "
+        f"ON CONFLICT (plan_entity_id) DO UPDATE SET {updates} RETURNING *"
+    )
+
+
+# Writable svp_entity_travel_plans columns -> normalizer for the payload value (with the SQL cast for the placeholder)
+TRAVEL_PLAN_COLUMNS = {
+    "number_of_travelers": (_count_or_none, "::integer"),
+    "travel_locations": (_text_or_none, ""),
+    "travel_dates": (_text_or_none, ""),
+    "travelers": (_text_or_none, ""),
+    "travel_cost": (_amount_or_none, "::numeric"),
+    "status": (_text_or_none, ""),
+}
+TRAVEL_PLAN_FIELDS = tuple(TRAVEL_PLAN_COLUMNS)
+_TRAVEL_PLAN_TEMPLATE = "(%s, " + ", ".join(f"%s{TRAVEL_PLAN_COLUMNS[f][1]}" for f in TRAVEL_PLAN_FIELDS) + ")"
+
+
+def _sync_travel_plans(cursor, plan_entity_id, travel_plans_payload):
+    """Make the entity's travel plans match the payload by id: update changed rows, insert rows without a known id,
+    delete rows missing from the payload. Untouched rows keep their ids and are not rewritten. Uses the caller's transaction."""
+    cursor.execute(
+        "SELECT id, " + ", ".join(TRAVEL_PLAN_FIELDS) + " FROM public.svp_entity_travel_plans WHERE plan_entity_id = %s",
+        (plan_entity_id,),
+    )
+    existing = {r["id"]: tuple(r[f] for f in TRAVEL_PLAN_FIELDS) for r in cursor.fetchall()}
+    keep_ids = set()
+    updates = []
+    inserts = []
+    for tp in travel_plans_payload:
+        if not isinstance(tp, dict):
             continue
-        out[key] = value
-    return out
+        values = tuple(TRAVEL_PLAN_COLUMNS[f][0](tp.get(f)) for f in TRAVEL_PLAN_FIELDS)
+        tp_id = str(tp.get("id") or "").strip()
+        tp_id = int(tp_id) if tp_id.isdigit() else None
+        if tp_id in existing and tp_id not in keep_ids:
+            keep_ids.add(tp_id)
+            if existing[tp_id] != values:
+                updates.append((tp_id,) + values)
+        else:
+            inserts.append((plan_entity_id,) + values)
+
+    removed = [i for i in existing if i not in keep_ids]
+    if removed:
+        cursor.execute(
+            "DELETE FROM public.svp_entity_travel_plans WHERE plan_entity_id = %s AND id = ANY(%s)",
+            (plan_entity_id, removed),
+        )
+    if updates:
+        execute_values(
+            cursor,
+            "UPDATE public.svp_entity_travel_plans t SET "
+            + ", ".join(f"{f} = v.{f}" for f in TRAVEL_PLAN_FIELDS)
+            + " FROM (VALUES %s) AS v(id, " + ", ".join(TRAVEL_PLAN_FIELDS) + ") WHERE t.id = v.id",
+            updates,
+            template=_TRAVEL_PLAN_TEMPLATE,
+        )
+    if inserts:
+        execute_values(
+            cursor,
+            "INSERT INTO public.svp_entity_travel_plans (plan_entity_id, " + ", ".join(TRAVEL_PLAN_FIELDS) + ") VALUES %s",
+            inserts,
+            template=_TRAVEL_PLAN_TEMPLATE,
+        )
 
 
 def upsert_basic_info(plan_id, entity_id, payload, plan_entity_id=None):
-    """Insert or update svp_entity_basic_info and optionally replace travel_plans. Returns updated full payload or None.
-    Merges payload with existing row so only provided fields overwrite.
+    """Insert or update svp_entity_basic_info and optionally sync travel_plans. Returns updated full payload or None.
+    Only columns present in payload are written, so concurrent edits to other fields are kept; the response is built
+    from the upsert's RETURNING row in the same statement (no read before or after). The payload includes assignee_conflicts:
+    other visits overlapping the saved dates for the same assignee(s) (a warning; the save is not rejected).
     When plan_entity_id is provided (e.g. from route after resolution), skip resolution."""
     if plan_entity_id is None:
         plan_entity_id = _plan_entity_id_from_entity_id(plan_id, entity_id)
         if plan_entity_id is None:
             return None
 
-    existing = get_basic_info_row(plan_entity_id)
-    existing_dict = _row_to_basic_info_dict(existing) if existing else {}
-    merged = _merge_payload_with_row(payload, existing_dict)
+    columns = [c for c in BASIC_INFO_COLUMNS if c in payload]
+    params = [plan_entity_id] + [BASIC_INFO_COLUMNS[c][0](payload.get(c)) for c in columns]
 
     conn = None
     try:
@@ -281,110 +540,29 @@ def upsert_basic_info(plan_id, entity_id, payload, plan_entity_id=None):
             raise RuntimeError("Database connection unavailable")
         cursor = conn.cursor()
 
-        start_date = _date_or_none(merged.get("start_date"))
-        end_date = _date_or_none(merged.get("end_date"))
-        conducted_by = merged.get("conducted_by")
-        if not isinstance(conducted_by, list):
-            conducted_by = []
-        location = (merged.get("location") or "").strip() or None
-        location_other = (merged.get("location_other") or "").strip() or None
-        reason_types = merged.get("reason_types")
-        if not isinstance(reason_types, list):
-            reason_types = []
-        reason_other = (merged.get("reason_other") or "").strip() or None
-        justification = (merged.get("justification") or "").strip() or None
-        site_visit_type_primary = (merged.get("site_visit_type_primary") or "").strip() or None
-        site_visit_type_primary_other = (merged.get("site_visit_type_primary_other") or "").strip() or None
-        site_visit_type_secondary = (merged.get("site_visit_type_secondary") or "").strip() or None
-        site_visit_type_secondary_other = (merged.get("site_visit_type_secondary_other") or "").strip() or None
-        areas_of_review = merged.get("areas_of_review")
-        if not isinstance(areas_of_review, list):
-            areas_of_review = []
-        areas_of_review_other = (merged.get("areas_of_review_other") or "").strip() or None
-        default_assignee = (merged.get("default_assignee") or "").strip() or None
-        optional_assignee_role = (merged.get("optional_assignee_role") or "").strip() or None
-        optional_assignee_team = (merged.get("optional_assignee_team") or "").strip() or None
-        optional_assignee_assignee = (merged.get("optional_assignee_assignee") or "").strip() or None
-        participants = merged.get("participants")
-        if not isinstance(participants, list):
-            participants = []
-        prioritization = (merged.get("prioritization") or "").strip() or None
-        additional_programs = merged.get("additional_programs")
-        if not isinstance(additional_programs, list):
-            additional_programs = []
-        tracking_number = (merged.get("tracking_number") or "").strip() or None
+        # Sync travel plans if provided (before the upsert so the returned payload includes them)
+        travel_plans_payload = payload.get("travel_plans")
+        if isinstance(travel_plans_payload, list):
+            _sync_travel_plans(cursor, plan_entity_id, travel_plans_payload)
 
         cursor.execute(
-            """
-            INSERT INTO public.svp_entity_basic_info (
-                plan_entity_id, start_date, end_date, conducted_by, location, location_other,
-                reason_types, reason_other, justification, site_visit_type_primary, site_visit_type_primary_other,
-                site_visit_type_secondary, site_visit_type_secondary_other, areas_of_review, areas_of_review_other,
-                default_assignee, optional_assignee_role, optional_assignee_team, optional_assignee_assignee,
-                participants, prioritization, additional_programs, tracking_number, updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW()
-            )
-            ON CONFLICT (plan_entity_id) DO UPDATE SET
-                start_date = EXCLUDED.start_date,
-                end_date = EXCLUDED.end_date,
-                conducted_by = EXCLUDED.conducted_by,
-                location = EXCLUDED.location,
-                location_other = EXCLUDED.location_other,
-                reason_types = EXCLUDED.reason_types,
-                reason_other = EXCLUDED.reason_other,
-                justification = EXCLUDED.justification,
-                site_visit_type_primary = EXCLUDED.site_visit_type_primary,
-                site_visit_type_primary_other = EXCLUDED.site_visit_type_primary_other,
-                site_visit_type_secondary = EXCLUDED.site_visit_type_secondary,
-                site_visit_type_secondary_other = EXCLUDED.site_visit_type_secondary_other,
-                areas_of_review = EXCLUDED.areas_of_review,
-                areas_of_review_other = EXCLUDED.areas_of_review_other,
-                default_assignee = EXCLUDED.default_assignee,
-                optional_assignee_role = EXCLUDED.optional_assignee_role,
-                optional_assignee_team = EXCLUDED.optional_assignee_team,
-                optional_assignee_assignee = EXCLUDED.optional_assignee_assignee,
-                participants = EXCLUDED.participants,
-                prioritization = EXCLUDED.prioritization,
-                additional_programs = EXCLUDED.additional_programs,
-                tracking_number = EXCLUDED.tracking_number,
-                updated_at = NOW()
-            """,
-            (
-                plan_entity_id, start_date, end_date, json.dumps(conducted_by), location, location_other,
-                json.dumps(reason_types), reason_other, justification, site_visit_type_primary, site_visit_type_primary_other,
-                site_visit_type_secondary, site_visit_type_secondary_other, json.dumps(areas_of_review), areas_of_review_other,
-                default_assignee, optional_assignee_role, optional_assignee_team, optional_assignee_assignee,
-                json.dumps(participants), prioritization, json.dumps(additional_programs), tracking_number,
-            ),
+            "WITH bi AS (" + _partial_upsert_sql(columns) + ") "
+            + _BASIC_INFO_CONTEXT_SELECT.format(basic_info="bi") + " WHERE pe.id = %s",
+            params + [plan_entity_id],
         )
+        row = cursor.fetchone()
+        conflicts = []
+        if row and row["basic_info"]:
+            saved = row["basic_info"]
+            conflicts = _assignee_conflicts(
+                cursor, saved.get("start_date"), saved.get("end_date"),
+                [saved.get("default_assignee"), saved.get("optional_assignee_assignee")], plan_entity_id,
+            )
         conn.commit()
-
-        # Replace travel plans if provided
-        travel_plans_payload = payload.get("travel_plans")
-        if isinstance(travel_plans_payload, list):
-            cursor.execute("DELETE FROM public.svp_entity_travel_plans WHERE plan_entity_id = %s", (plan_entity_id,))
-            for tp in travel_plans_payload:
-                if not isinstance(tp, dict):
-                    continue
-                cursor.execute(
-                    """INSERT INTO public.svp_entity_travel_plans
-                       (plan_entity_id, number_of_travelers, travel_locations, travel_dates, travelers, travel_cost, status)
-                       VALUES (%s, %s, %s, %s, %s, %s, %s)""",
-                    (
-                        plan_entity_id,
-                        (tp.get("number_of_travelers") or "").strip() or None,
-                        (tp.get("travel_locations") or "").strip() or None,
-                        (tp.get("travel_dates") or "").strip() or None,
-                        (tp.get("travelers") or "").strip() or None,
-                        (tp.get("travel_cost") or "").strip() or None,
-                        (tp.get("status") or "").strip() or None,
-                    ),
-                )
-            conn.commit()
-
         cursor.close()
-        return get_basic_info(plan_id, entity_id)
+        if not row:
+            return None
+        return dict(_build_basic_info_payload(plan_id, entity_id, _context_from_row(row)), assignee_conflicts=conflicts)
     except Exception as e:
         logger.exception("upsert_basic_info: error %s", e)
         if conn:
@@ -393,3 +571,255 @@ def upsert_basic_info(plan_id, entity_id, payload, plan_entity_id=None):
     finally:
         if conn:
             conn.close()
+
+
+# Fields that can be applied to many entities at once (tracking_number stays per entity)
+BULK_BASIC_INFO_COLUMNS = [c for c in BASIC_INFO_COLUMNS if c != "tracking_number"]
+
+
+def bulk_apply_basic_info(plan_id_int, plan_entity_ids, fields, mark_complete=False):
+    """Apply the same Basic Information fields to many plan entities with one INSERT ... SELECT unnest(...) ON CONFLICT DO UPDATE.
+    Only the given fields are written. When mark_complete is True, the applied entities are set to Complete in the same transaction.
+    Returns {"results": [{"id", "result"}], "applied", "completed", "section_status"} or None on error.
+    Results: inserted | updated | not_in_plan | invalid."""
+    ids, invalid = _int_ids(plan_entity_ids)
+    columns = [c for c in BULK_BASIC_INFO_COLUMNS if c in (fields or {})]
+    values = [BASIC_INFO_COLUMNS[c][0](fields.get(c)) for c in columns]
+    names = ", ".join(["plan_entity_id"] + columns + ["updated_at"])
+    selects = ", ".join(["pe.id"] + [f"%s{BASIC_INFO_COLUMNS[c][1]}" for c in columns] + ["NOW()"])
+    updates = ", ".join([f"{c} = EXCLUDED.{c}" for c in columns] + ["updated_at = NOW()"])
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        cursor = conn.cursor()
+        outcome = {}
+        if ids:
+            cursor.execute(
+                f"""WITH src AS (SELECT unnest(%s::int[]) AS plan_entity_id),
+                       up AS (
+                           INSERT INTO public.svp_entity_basic_info ({names})
+                           SELECT {selects}
+                           FROM src JOIN public.svp_plan_entities pe ON pe.id = src.plan_entity_id AND pe.plan_id = %s
+                           ON CONFLICT (plan_entity_id) DO UPDATE SET {updates}
+                           RETURNING plan_entity_id, (xmax = 0) AS inserted
+                       )
+                    SELECT src.plan_entity_id, up.plan_entity_id IS NOT NULL AS applied, up.inserted
+                    FROM src LEFT JOIN up ON up.plan_entity_id = src.plan_entity_id""",
+                [ids] + values + [plan_id_int],
+            )
+            for r in cursor.fetchall():
+                if not r["applied"]:
+                    outcome[r["plan_entity_id"]] = "not_in_plan"
+                else:
+                    outcome[r["plan_entity_id"]] = "inserted" if r["inserted"] else "updated"
+        applied = [i for i in ids if outcome.get(i) in ("inserted", "updated")]
+        completed = 0
+        section_status = None
+        if mark_complete and applied:
+            cursor.execute(
+                """UPDATE public.svp_plan_entities SET status = 'Complete'
+                   WHERE plan_id = %s AND id = ANY(%s) AND status IS DISTINCT FROM 'Complete'""",
+                (plan_id_int, applied),
+            )
+            completed = cursor.rowcount
+            if completed and _all_plan_entities_complete(cursor, plan_id_int):
+                _set_section_status(cursor, plan_id_int, "identified_site_visits", "Complete")
+                section_status = "Complete"
+            if completed:
+                _bump_plan_version(cursor, plan_id_int)
+        conn.commit()
+        cursor.close()
+        logger.info(
+            "bulk_apply_basic_info: plan_id=%s applied=%s completed=%s fields=%s",
+            plan_id_int, len(applied), completed, columns,
+        )
+        results = [{"id": str(i), "result": outcome.get(i, "not_in_plan")} for i in ids]
+        results += [{"id": v, "result": "invalid"} for v in invalid]
+        return {"results": results, "applied": len(applied), "completed": completed, "section_status": section_status}
+    except Exception as e:
+        logger.exception("bulk_apply_basic_info: error %s", e)
+        if conn:
+            conn.rollback()
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+# Visit date range; must match the expression of the svp_entity_basic_info_visit_range GiST index (see init_db).
+# end_date before start_date (or missing) collapses to the single start day.
+VISIT_RANGE_SQL = "daterange(bi.start_date, GREATEST(bi.start_date, COALESCE(bi.end_date, bi.start_date)), '[]')"
+
+# One visit row per basic info record, with its plan and entity
+_VISIT_COLUMNS = """bi.plan_entity_id, bi.start_date, bi.end_date, bi.default_assignee, bi.optional_assignee_assignee,
+          bi.location, bi.site_visit_type_primary, bi.prioritization,
+          pe.plan_id, pe.entity_number, e.entity_name, pe.status AS entity_status,
+          p.plan_code, p.plan_name, p.team_name, p.status AS plan_status"""
+_VISIT_FROM = """
+   FROM public.svp_entity_basic_info bi
+   JOIN public.svp_plan_entities pe ON pe.id = bi.plan_entity_id
+   """ + ENTITY_JOIN + """
+   JOIN public.svp_plans p ON p.id = pe.plan_id"""
+_VISIT_SELECT = "SELECT " + _VISIT_COLUMNS + _VISIT_FROM
+
+# Calendar filters (query param -> column)
+CALENDAR_FILTER_COLUMNS = {
+    "team_name": ("p.team_name", TEXT),
+    "plan_status": ("p.status", TEXT),
+    "plan_code": ("p.plan_code", TEXT),
+    "entity_status": ("pe.status", TEXT),
+}
+
+
+def _visit_row_to_dict(row):
+    """Build API-style calendar visit from a _VISIT_SELECT row."""
+    return {
+        "plan_id": str(row["plan_id"]),
+        "plan_code": row["plan_code"] or "",
+        "plan_name": row["plan_name"] or "",
+        "team_name": row["team_name"] or "",
+        "plan_status": row["plan_status"] or "",
+        "plan_entity_id": str(row["plan_entity_id"]),
+        "entity_number": row["entity_number"] or "",
+        "entity_name": row["entity_name"] or "",
+        "entity_status": row["entity_status"] or "Not in Plan",
+        "start_date": row["start_date"].strftime("%Y-%m-%d") if row["start_date"] else None,
+        "end_date": row["end_date"].strftime("%Y-%m-%d") if row["end_date"] else None,
+        "default_assignee": row["default_assignee"],
+        "optional_assignee_assignee": row["optional_assignee_assignee"],
+        "location": row["location"],
+        "site_visit_type_primary": row["site_visit_type_primary"],
+        "prioritization": row["prioritization"],
+    }
+
+
+def _range_bounds(start_date, end_date):
+    """Normalize a visit window like VISIT_RANGE_SQL: (start, max(start, end or start)) as dates, or None without a start."""
+    start = _date_or_none(start_date)
+    if start is None:
+        return None
+    end = _date_or_none(end_date)
+    return start, max(start, end) if end else start
+
+
+def _assignee_conflicts(cursor, start_date, end_date, assignees, exclude_plan_entity_id=None):
+    """Return visits of non-canceled plans that overlap [start_date, end_date] and share one of the assignees
+    (as default_assignee or optional_assignee_assignee), one row per (visit, assignee). The range predicate uses the
+    GiST index and the assignee predicate the assignee indexes, so no full scan is needed."""
+    bounds = _range_bounds(start_date, end_date)
+    names = list(dict.fromkeys(n for n in (_text_or_none(a) for a in (assignees or [])) if n))
+    if bounds is None or not names:
+        return []
+    cursor.execute(
+        _VISIT_SELECT + """
+           CROSS JOIN LATERAL (SELECT DISTINCT unnest(ARRAY[bi.default_assignee, bi.optional_assignee_assignee]) AS assignee) a
+           WHERE bi.start_date IS NOT NULL
+             AND """ + VISIT_RANGE_SQL + """ && daterange(%s, %s, '[]')
+             AND (bi.default_assignee = ANY(%s) OR bi.optional_assignee_assignee = ANY(%s))
+             AND a.assignee = ANY(%s)
+             AND bi.plan_entity_id IS DISTINCT FROM %s
+             AND COALESCE(p.status, '') <> 'Canceled'
+           ORDER BY bi.start_date, bi.plan_entity_id, a.assignee""",
+        (bounds[0], bounds[1], names, names, names, exclude_plan_entity_id),
+    )
+    return [dict(_visit_row_to_dict(r), assignee=r["assignee"]) for r in cursor.fetchall()]
+
+
+def find_assignee_conflicts(start_date, end_date, assignees, exclude_plan_entity_id=None):
+    """Return overlapping visits for the assignees in the date window (see _assignee_conflicts), or None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        conflicts = _assignee_conflicts(cursor, start_date, end_date, assignees, exclude_plan_entity_id)
+        cursor.close()
+        return conflicts
+    except Exception as e:
+        logger.exception("find_assignee_conflicts: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+def get_visit_calendar(date_from, date_to, filters=None, assignee=None, limit=1000):
+    """Return visits whose date range overlaps [date_from, date_to] (inclusive), ordered by start date, via the GiST range index.
+    Optional CALENDAR_FILTER_COLUMNS filters and assignee (default or optional assignee). None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        where_sql, params = build_filter_clause(filters, CALENDAR_FILTER_COLUMNS)
+        name = _text_or_none(assignee)
+        if name:
+            where_sql += " AND (bi.default_assignee = %s OR bi.optional_assignee_assignee = %s)"
+            params += [name, name]
+        cursor.execute(
+            _VISIT_SELECT + " WHERE bi.start_date IS NOT NULL AND " + VISIT_RANGE_SQL + " && daterange(%s, %s, '[]')"
+            + where_sql + " ORDER BY bi.start_date, p.id, pe.entity_number LIMIT %s",
+            [date_from, date_to] + params + [limit],
+        )
+        visits = [_visit_row_to_dict(r) for r in cursor.fetchall()]
+        cursor.close()
+        return visits
+    except Exception as e:
+        logger.exception("get_visit_calendar: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+# JSONB list columns searchable by containment (each has a jsonb_path_ops GIN index, see init_db)
+SEARCH_JSONB_COLUMNS = ("conducted_by", "reason_types", "areas_of_review", "participants", "additional_programs")
+
+
+def search_site_visits(contains, date_from=None, date_to=None, filters=None, limit=50, offset=0):
+    """Search visits across plans by JSONB list values: contains maps a SEARCH_JSONB_COLUMNS column to values that must
+    all be present (one bi.<column> @> '[...]' predicate per column, answered by its GIN index). Optional date window
+    (overlap, via the visit range index) and CALENDAR_FILTER_COLUMNS filters. Newest visits first.
+    Returns {"total", "visits"} for one page, or None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        where_sql, params = build_filter_clause(filters, CALENDAR_FILTER_COLUMNS)
+        for column in SEARCH_JSONB_COLUMNS:
+            values = [str(v).strip() for v in (contains or {}).get(column) or [] if str(v).strip()]
+            if values:
+                where_sql += f" AND bi.{column} @> %s::jsonb"
+                params.append(json.dumps(values))
+        if date_from is not None and date_to is not None:
+            where_sql += " AND bi.start_date IS NOT NULL AND " + VISIT_RANGE_SQL + " && daterange(%s, %s, '[]')"
+            params += [date_from, date_to]
+        cursor.execute(
+            "SELECT " + _VISIT_COLUMNS + ", " + ", ".join(f"bi.{c}" for c in SEARCH_JSONB_COLUMNS)
+            + ", COUNT(*) OVER () AS total_count" + _VISIT_FROM + " WHERE TRUE" + where_sql
+            + " ORDER BY bi.start_date DESC NULLS LAST, bi.plan_entity_id LIMIT %s OFFSET %s",
+            params + [limit, offset],
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+        visits = []
+        for r in rows:
+            visit = _visit_row_to_dict(r)
+            visit.update({c: r[c] if isinstance(r[c], list) else [] for c in SEARCH_JSONB_COLUMNS})
+            visits.append(visit)
+        return {"total": int(rows[0]["total_count"]) if rows else 0, "visits": visits}
+    except Exception as e:
+        logger.exception("search_site_visits: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
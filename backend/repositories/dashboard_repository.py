@@ -0,0 +1,129 @@
+"""SVP dashboard repository: reads and refreshes the dashboard materialized views (see create_svp_dashboard_views in init_db)."""
+import logging
+
+from config.database import get_db_connection
+from repositories.grid_query import TEXT, _json_value, build_filter_clause
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_VIEWS = ("svp_dashboard_plan_summary", "svp_dashboard_visit_months")
+# Dashboard filters and breakdowns; both views carry these plan columns ('' for NULL)
+DASHBOARD_FILTER_COLUMNS = {
+    "status": ("d.status", TEXT),
+    "team_name": ("d.team_name", TEXT),
+    "plan_period": ("d.plan_period", TEXT),
+    "plan_for": ("d.plan_for", TEXT),
+}
+_SUMMARY_MEASURES = ("plans", "entities", "complete_entities", "visit_started_entities", "with_basic_info_entities")
+# Advisory lock key so only one process refreshes the views at a time
+_REFRESH_LOCK_SQL = "hashtext('svp_dashboard_refresh')"
+
+
+def _summary_row(row):
+    """Build one summary bucket: measures as ints plus completion_rate (complete/entities, None when no entities)."""
+    out = {m: int(row[m] or 0) for m in _SUMMARY_MEASURES}
+    out["completion_rate"] = round(out["complete_entities"] / out["entities"], 4) if out["entities"] else None
+    return out
+
+
+def refresh_dashboard_views():
+    """Refresh every dashboard view with REFRESH MATERIALIZED VIEW CONCURRENTLY (readers are never blocked) and record the time.
+    Returns {view_name: refreshed_at iso} or {} when another process holds the refresh lock; None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT pg_try_advisory_lock({_REFRESH_LOCK_SQL}) AS locked")
+        if not cursor.fetchone()["locked"]:
+            cursor.close()
+            return {}
+        try:
+            refreshed = {}
+            for view in DASHBOARD_VIEWS:
+                cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY public.{view}")
+                cursor.execute(
+                    """INSERT INTO public.svp_dashboard_refresh (view_name, refreshed_at) VALUES (%s, NOW())
+                       ON CONFLICT (view_name) DO UPDATE SET refreshed_at = EXCLUDED.refreshed_at
+                       RETURNING refreshed_at""",
+                    (view,),
+                )
+                refreshed[view] = cursor.fetchone()["refreshed_at"].isoformat()
+            logger.info("refresh_dashboard_views: refreshed %s", ", ".join(refreshed))
+            return refreshed
+        finally:
+            cursor.execute(f"SELECT pg_advisory_unlock({_REFRESH_LOCK_SQL})")
+            cursor.close()
+    except Exception as e:
+        logger.exception("refresh_dashboard_views: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+def get_dashboard_summary(filters=None, months_ahead=3):
+    """Return plan counts and entity completion per status/team_name/plan_period/plan_for (one GROUPING SETS query),
+    upcoming visit counts per start month for the next months_ahead months, and freshness
+    {"refreshed_at", "age_seconds"} of the oldest view. None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        where_sql, params = build_filter_clause(filters, DASHBOARD_FILTER_COLUMNS)
+        dims = list(DASHBOARD_FILTER_COLUMNS)
+        cursor.execute(
+            "SELECT " + ", ".join(f"d.{k}, GROUPING(d.{k}) AS g_{k}" for k in dims) + ", "
+            + ", ".join(f"SUM(d.{m}) AS {m}" for m in _SUMMARY_MEASURES)
+            + " FROM public.svp_dashboard_plan_summary d WHERE TRUE" + where_sql
+            + " GROUP BY GROUPING SETS (" + ", ".join(f"(d.{k})" for k in dims) + ", ())",
+            params,
+        )
+        result = {"totals": _summary_row({m: 0 for m in _SUMMARY_MEASURES})}
+        breakdowns = {k: [] for k in dims}
+        for row in cursor.fetchall():
+            grouped = [k for k in dims if row[f"g_{k}"] == 0]
+            if not grouped:
+                result["totals"] = _summary_row(row)
+                continue
+            key = grouped[0]
+            breakdowns[key].append(dict(_summary_row(row), value=row[key]))
+        for key, rows in breakdowns.items():
+            rows.sort(key=lambda r: (-r["plans"], r["value"]))
+            result["by_" + key] = rows
+
+        cursor.execute(
+            """SELECT d.month, SUM(d.visits) AS visits
+               FROM public.svp_dashboard_visit_months d
+               WHERE d.month >= date_trunc('month', CURRENT_DATE)::date
+                 AND d.month < (date_trunc('month', CURRENT_DATE) + make_interval(months => %s))::date"""
+            + where_sql + " GROUP BY d.month ORDER BY d.month",
+            [months_ahead] + params,
+        )
+        months = [{"month": r["month"].strftime("%Y-%m"), "visits": int(r["visits"])} for r in cursor.fetchall()]
+        result["upcoming_visits"] = {"months_ahead": months_ahead, "total": sum(m["visits"] for m in months), "months": months}
+
+        cursor.execute(
+            """SELECT MIN(refreshed_at) AS refreshed_at,
+                      EXTRACT(EPOCH FROM NOW() - MIN(refreshed_at)) AS age_seconds
+               FROM public.svp_dashboard_refresh WHERE view_name = ANY(%s)""",
+            (list(DASHBOARD_VIEWS),),
+        )
+        row = cursor.fetchone()
+        result["freshness"] = {
+            "refreshed_at": _json_value(row["refreshed_at"]) if row else None,
+            "age_seconds": int(row["age_seconds"]) if row and row["age_seconds"] is not None else None,
+        }
+        cursor.close()
+        return result
+    except Exception as e:
+        logger.exception("get_dashboard_summary: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
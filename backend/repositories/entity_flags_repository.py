@@ -0,0 +1,115 @@
+"""Entity eligibility flags repository: set-based recomputation of midpoint_current_pp, active_grant_1_year_pp,
+active_new_grant and active_grant_no_site_visit over the whole entities pool. Plans read the flags through
+svp_plan_entities.entity_id, so open plans only get their version bumped."""
+import logging
+
+from config.database import get_db_connection
+
+logger = logging.getLogger(__name__)
+
+# Grant project period covering today (columns added by add_grant_period_to_entities in init_db)
+_ACTIVE_SQL = "(x.current_pp_start <= CURRENT_DATE AND x.current_pp_end >= CURRENT_DATE)"
+
+# One UPDATE ... FROM per rule, in order. Each subquery yields (id, value) for the entities the rule can decide;
+# entities without the source columns keep their current value. Only rows whose value changes are written.
+ELIGIBILITY_RULES = (
+    (
+        "midpoint_current_pp",
+        """SELECT x.id, x.current_pp_start + (x.current_pp_end - x.current_pp_start) / 2 AS value
+           FROM public.entities x
+           WHERE x.current_pp_start IS NOT NULL AND x.current_pp_end >= x.current_pp_start""",
+    ),
+    (
+        "active_grant_1_year_pp",
+        f"""SELECT x.id, {_ACTIVE_SQL} AND x.current_pp_end - x.current_pp_start <= 366 AS value
+            FROM public.entities x
+            WHERE x.current_pp_start IS NOT NULL AND x.current_pp_end IS NOT NULL""",
+    ),
+    (
+        # New grant: first awarded within the current project period
+        "active_new_grant",
+        f"""SELECT x.id, {_ACTIVE_SQL} AND x.grant_award_date >= x.current_pp_start AS value
+            FROM public.entities x
+            WHERE x.current_pp_start IS NOT NULL AND x.current_pp_end IS NOT NULL AND x.grant_award_date IS NOT NULL""",
+    ),
+    (
+        # Same rule as svp_refresh_entity_visit_rollups (run on visit writes); re-run here because the lookback window moves daily.
+        # Entities with unparsed legacy visit text (no history, text kept) are skipped like entities without a grant period.
+        "active_grant_no_site_visit",
+        """SELECT x.id,
+                  NOT EXISTS (SELECT 1 FROM public.entity_site_visits v
+                              WHERE v.entity_id = x.id
+                                AND v.start_date >= CURRENT_DATE - make_interval(years => public.svp_site_visit_lookback_years())
+                  ) AND x.current_pp_end >= CURRENT_DATE AS value
+           FROM public.entities x
+           WHERE x.current_pp_end IS NOT NULL
+             AND (x.has_site_visit_history OR COALESCE(x.recent_site_visit_dates, '') = '')""",
+    ),
+)
+# Advisory lock key so only one recomputation runs at a time
+_RECOMPUTE_LOCK_SQL = "hashtext('svp_entity_flags_recompute')"
+
+
+def recompute_entity_flags(dry_run=False):
+    """Recompute every eligibility rule for all entities, then bump the version of plans that are not Complete/Canceled and
+    contain a changed entity. One transaction; dry_run rolls it back after counting.
+    Returns {"rules": {column: changed}, "entities_changed", "plan_entities_affected", "plans_updated", "dry_run"},
+    {} when another recomputation holds the lock, or None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT pg_try_advisory_xact_lock({_RECOMPUTE_LOCK_SQL}) AS locked")
+        if not cursor.fetchone()["locked"]:
+            conn.rollback()
+            cursor.close()
+            return {}
+        rules, changed_ids = {}, set()
+        for column, source_sql in ELIGIBILITY_RULES:
+            cursor.execute(
+                f"""UPDATE public.entities e SET {column} = r.value
+                    FROM ({source_sql}) r
+                    WHERE e.id = r.id AND e.{column} IS DISTINCT FROM r.value
+                    RETURNING e.id"""
+            )
+            ids = [row["id"] for row in cursor.fetchall()]
+            rules[column] = len(ids)
+            changed_ids.update(ids)
+
+        cursor.execute(
+            """WITH affected AS (
+                   SELECT pe.plan_id FROM public.svp_plan_entities pe
+                   JOIN public.svp_plans p ON p.id = pe.plan_id
+                   WHERE pe.entity_id = ANY(%s) AND COALESCE(p.status, '') NOT IN ('Complete', 'Canceled')
+               ), bumped AS (
+                   UPDATE public.svp_plans SET version = version + 1
+                   WHERE id IN (SELECT plan_id FROM affected) RETURNING id
+               )
+               SELECT (SELECT COUNT(*) FROM affected) AS plan_entities, (SELECT COUNT(*) FROM bumped) AS plans""",
+            (list(changed_ids),),
+        )
+        row = cursor.fetchone()
+        result = {
+            "rules": rules,
+            "entities_changed": len(changed_ids),
+            "plan_entities_affected": int(row["plan_entities"]),
+            "plans_updated": int(row["plans"]),
+            "dry_run": bool(dry_run),
+        }
+        if dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+        cursor.close()
+        logger.info("recompute_entity_flags: %s", result)
+        return result
+    except Exception as e:
+        logger.exception("recompute_entity_flags: error %s", e)
+        if conn:
+            conn.rollback()
+        return None
+    finally:
+        if conn:
+            conn.close()
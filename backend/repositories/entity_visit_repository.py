@@ -0,0 +1,196 @@
+"""Entity site visit history repository: structured visits per entity (entity_site_visits), legacy text backfill
+and "not visited in N years" lookups. Visits of completed plan entities are recorded by triggers (see init_db)."""
+import logging
+import re
+from datetime import datetime
+
+from psycopg2.extras import execute_values
+
+from config.database import get_db_connection
+
+logger = logging.getLogger(__name__)
+
+# One visit in legacy recent_site_visit_dates text: "02/10/2026 - 02/12/2026 (Program Requirement Verification/Diagnostic)".
+# End date and type are optional; ISO dates (2026-02-10) are accepted too.
+_DATE = r"\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{1,2}-\d{1,2}"
+_VISIT_TEXT_RE = re.compile(rf"({_DATE})(?:\s*(?:-|–|to)\s*({_DATE}))?(?:\s*\(([^)]*)\))?")
+
+
+def _parse_text_date(s):
+    """Parse MM/DD/YYYY or YYYY-MM-DD to date, or None if invalid."""
+    for fmt in ("%m/%d/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(s, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_site_visit_text(text):
+    """Parse legacy recent_site_visit_dates text into [(start_date, end_date, visit_type)].
+    Invalid dates are skipped; a missing or earlier end date becomes the start date."""
+    visits = []
+    for start_s, end_s, visit_type in _VISIT_TEXT_RE.findall(text or ""):
+        start = _parse_text_date(start_s)
+        if start is None:
+            continue
+        end = _parse_text_date(end_s) if end_s else None
+        visits.append((start, max(start, end) if end else start, visit_type.strip() or None))
+    return visits
+
+
+def _visit_row_to_dict(row):
+    """Build API-style visit from an entity_site_visits row (with plan_id/plan_code from the plan entity, if any)."""
+    return {
+        "id": str(row["id"]),
+        "start_date": row["start_date"].strftime("%Y-%m-%d"),
+        "end_date": row["end_date"].strftime("%Y-%m-%d"),
+        "visit_type": row["visit_type"],
+        "source": row["source"],
+        "plan_entity_id": str(row["plan_entity_id"]) if row["plan_entity_id"] is not None else None,
+        "plan_id": str(row["plan_id"]) if row["plan_id"] is not None else None,
+        "plan_code": row["plan_code"],
+    }
+
+
+def backfill_entity_site_visits():
+    """Parse recent_site_visit_dates of entities that have no visit history yet into legacy_text visits, record visits of
+    every Complete plan entity, then derive display text and active_grant_no_site_visit for all entities. Unparsed entities
+    keep both their text and their flag.
+    Returns {"legacy_visits", "unparsed": [entity_number, ...], "entities_updated"} or None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        cursor = conn.cursor()
+        cursor.execute(
+            """SELECT e.id, e.entity_number, e.recent_site_visit_dates FROM public.entities e
+               WHERE COALESCE(e.recent_site_visit_dates, '') <> ''
+                 AND NOT EXISTS (SELECT 1 FROM public.entity_site_visits v WHERE v.entity_id = e.id)"""
+        )
+        rows, unparsed = [], []
+        for r in cursor.fetchall():
+            visits = parse_site_visit_text(r["recent_site_visit_dates"])
+            if not visits:
+                unparsed.append(r["entity_number"])
+            rows.extend((r["id"], start, end, visit_type, "legacy_text") for start, end, visit_type in visits)
+        if rows:
+            execute_values(
+                cursor,
+                "INSERT INTO public.entity_site_visits (entity_id, start_date, end_date, visit_type, source) VALUES %s",
+                rows,
+            )
+        cursor.execute(
+            "SELECT public.svp_sync_entity_site_visits(ARRAY(SELECT id FROM public.svp_plan_entities WHERE status = 'Complete'))"
+        )
+        cursor.execute("SELECT public.svp_refresh_entity_visit_rollups(NULL) AS updated")
+        updated = int(cursor.fetchone()["updated"] or 0)
+        conn.commit()
+        cursor.close()
+        logger.info("backfill_entity_site_visits: legacy_visits=%d unparsed=%d updated=%d", len(rows), len(unparsed), updated)
+        return {"legacy_visits": len(rows), "unparsed": unparsed, "entities_updated": updated}
+    except Exception as e:
+        logger.exception("backfill_entity_site_visits: error %s", e)
+        if conn:
+            conn.rollback()
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+def get_entity_site_visits(entity_id):
+    """Return an entity's visit history, newest first, or None if the entity does not exist (or on error)."""
+    entity_id_str = str(entity_id).strip()
+    if not entity_id_str.isdigit():
+        return None
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute(
+            """SELECT e.id AS entity_id, e.entity_number, e.entity_name,
+                      sv.id, sv.start_date, sv.end_date, sv.visit_type, sv.source, sv.plan_entity_id, pe.plan_id, p.plan_code
+               FROM public.entities e
+               LEFT JOIN public.entity_site_visits sv ON sv.entity_id = e.id
+               LEFT JOIN public.svp_plan_entities pe ON pe.id = sv.plan_entity_id
+               LEFT JOIN public.svp_plans p ON p.id = pe.plan_id
+               WHERE e.id = %s
+               ORDER BY sv.start_date DESC, sv.id DESC""",
+            (int(entity_id_str),),
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+        if not rows:
+            return None
+        return {
+            "entity_id": str(rows[0]["entity_id"]),
+            "entity_number": rows[0]["entity_number"],
+            "entity_name": rows[0]["entity_name"],
+            "visits": [_visit_row_to_dict(r) for r in rows if r["id"] is not None],
+        }
+    except Exception as e:
+        logger.exception("get_entity_site_visits: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+def get_entities_not_visited(years=None, limit=50, offset=0):
+    """Return one page of entities with no visit starting in the last `years` years (default: the
+    site_visit_lookback_years setting), least recently visited first. The per-entity latest visit is a top-1 scan of
+    entity_site_visits (entity_id, start_date DESC). Returns {"years", "total", "entities"} or None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute(
+            """WITH cfg AS (SELECT COALESCE(%s, public.svp_site_visit_lookback_years()) AS years)
+               SELECT e.id, e.entity_number, e.entity_name, e.city, e.state, lv.start_date AS last_visit_date, cfg.years,
+                      COUNT(*) OVER () AS total_count
+               FROM cfg, public.entities e
+               LEFT JOIN LATERAL (
+                   SELECT v.start_date FROM public.entity_site_visits v
+                   WHERE v.entity_id = e.id ORDER BY v.start_date DESC LIMIT 1
+               ) lv ON TRUE
+               WHERE lv.start_date IS NULL OR lv.start_date < CURRENT_DATE - make_interval(years => cfg.years)
+               ORDER BY lv.start_date NULLS FIRST, e.entity_number
+               LIMIT %s OFFSET %s""",
+            (years, limit, offset),
+        )
+        rows = cursor.fetchall()
+        if rows:
+            years = rows[0]["years"]
+        elif years is None:
+            cursor.execute("SELECT public.svp_site_visit_lookback_years() AS years")
+            years = cursor.fetchone()["years"]
+        cursor.close()
+        return {
+            "years": int(years),
+            "total": int(rows[0]["total_count"]) if rows else 0,
+            "entities": [
+                {
+                    "id": str(r["id"]),
+                    "entity_number": r["entity_number"] or "",
+                    "entity_name": r["entity_name"] or "",
+                    "city": r["city"] or "",
+                    "state": r["state"] or "",
+                    "last_visit_date": r["last_visit_date"].strftime("%Y-%m-%d") if r["last_visit_date"] else None,
+                }
+                for r in rows
+            ],
+        }
+    except Exception as e:
+        logger.exception("get_entities_not_visited: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
@@ -0,0 +1,163 @@
+"""
+Shared SQL helpers for DataGrid-backed endpoints: whitelisted grid filters and GROUPING SETS facet counts.
+Column specs map an API key to (sql_expr, kind); only keys present in a spec ever reach SQL.
+"""
+from decimal import Decimal
+
+TEXT = "text"  # exact match, one or more values (= ANY)
+LIKE = "like"  # case-insensitive substring match; every value must match
+LIKE_ANY = "like_any"  # case-insensitive substring match; any value matches (checkbox groups)
+FLAG = "flag"  # boolean column, API values Yes/No (or true/false)
+
+
+def _flag_value(value):
+    """Parse Yes/No/true/false/1/0 to bool, or None if not recognizable."""
+    s = str(value).strip().lower()
+    if s in ("yes", "true", "1"):
+        return True
+    if s in ("no", "false", "0"):
+        return False
+    return None
+
+
+def _clean_values(raw):
+    """Normalize a filter value (scalar or list) to a list of non-empty strings, dropping 'All'."""
+    values = raw if isinstance(raw, (list, tuple, set)) else [raw]
+    out = []
+    for v in values:
+        if v is None:
+            continue
+        s = str(v).strip()
+        if s and s != "All":
+            out.append(s)
+    return out
+
+
+def build_filter_clause(filters, columns):
+    """Return (sql, params) where sql is a string of ' AND ...' predicates for the whitelisted filters.
+    Unknown keys, empty values and 'All' are ignored."""
+    clauses = []
+    params = []
+    for key, raw in (filters or {}).items():
+        spec = columns.get(key)
+        if spec is None:
+            continue
+        expr, kind = spec
+        values = _clean_values(raw)
+        if not values:
+            continue
+        if kind == LIKE:
+            for v in values:
+                clauses.append(f"{expr} ILIKE %s")
+                params.append(f"%{v}%")
+        elif kind == LIKE_ANY:
+            clauses.append(f"{expr} ILIKE ANY(%s)")
+            params.append([f"%{v}%" for v in values])
+        elif kind == FLAG:
+            flags = {b for b in (_flag_value(v) for v in values) if b is not None}
+            if len(flags) == 1:
+                clauses.append(f"COALESCE({expr}, FALSE) = %s")
+                params.append(flags.pop())
+        else:
+            clauses.append(f"{expr} = ANY(%s)")
+            params.append(values)
+    return "".join(" AND " + c for c in clauses), params
+
+
+def display_expr(expr, kind):
+    """SQL expression for a column as the API displays it (flags become 'Yes'/'No')."""
+    if kind == FLAG:
+        return f"CASE WHEN {expr} THEN 'Yes' ELSE 'No' END"
+    return expr
+
+
+def query_facet_counts(cursor, from_where_sql, params, facets):
+    """Count rows per value of each facet in one GROUPING SETS query.
+
+    from_where_sql is the 'FROM ... WHERE ...' part of the filtered row set; facets maps facet key -> (sql_expr, kind).
+    Returns {"total": int, "facets": {key: [{"value", "count"}, ...]}} with values ordered by count desc.
+    """
+    keys = list(facets.keys())
+    if not keys:
+        cursor.execute("SELECT COUNT(*) AS count " + from_where_sql, params)
+        row = cursor.fetchone()
+        return {"total": int(row["count"]) if row else 0, "facets": {}}
+    inner = ", ".join(f"{display_expr(*facets[k])} AS f{i}" for i, k in enumerate(keys))
+    outer = ", ".join(f"f{i}, GROUPING(f{i}) AS g{i}" for i in range(len(keys)))
+    sets = ", ".join(f"(f{i})" for i in range(len(keys)))
+    cursor.execute(
+        f"SELECT {outer}, COUNT(*) AS count FROM (SELECT {inner} {from_where_sql}) t "
+        f"GROUP BY GROUPING SETS ({sets}, ())",
+        params,
+    )
+    result = {"total": 0, "facets": {k: [] for k in keys}}
+    for row in cursor.fetchall():
+        count = int(row["count"])
+        grouped = [i for i in range(len(keys)) if row[f"g{i}"] == 0]
+        if not grouped:
+            result["total"] = count
+            continue
+        i = grouped[0]
+        value = row[f"f{i}"]
+        result["facets"][keys[i]].append({"value": "" if value is None else str(value), "count": count})
+    for values in result["facets"].values():
+        values.sort(key=lambda v: (-v["count"], v["value"]))
+    return result
+
+
+def select_facets(all_facets, requested=None):
+    """Restrict an ordered facet spec to the requested keys (all when requested is empty)."""
+    if not requested:
+        return dict(all_facets)
+    return {k: all_facets[k] for k in requested if k in all_facets}
+
+
+def _json_value(value):
+    """Make an aggregate value JSON-friendly (dates as YYYY-MM-DD, Decimals as int/float)."""
+    if value is None:
+        return None
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return value
+
+
+def group_predicate(expr, kind, value):
+    """Return (sql, params) selecting the rows of one group as reported by query_groups ('' is the empty/NULL group)."""
+    if kind == FLAG:
+        flag = _flag_value(value)
+        if flag is None:
+            return " AND FALSE", []
+        return f" AND COALESCE({expr}, FALSE) = %s", [flag]
+    s = "" if value is None else str(value)
+    if s == "":
+        return f" AND ({expr} IS NULL OR {expr} = '')", []
+    return f" AND {expr} = %s", [s]
+
+
+def query_groups(cursor, from_where_sql, params, group_spec, aggregates=None):
+    """Group the filtered row set by one column in SQL and return group headers.
+
+    group_spec is (sql_expr, kind); aggregates maps name -> SQL aggregate expression.
+    Returns [{"key", "count", "aggregates": {name: value}}] ordered by key (empty group last).
+    """
+    aggregates = aggregates or {}
+    key_expr = display_expr(*group_spec)
+    if group_spec[1] != FLAG:
+        key_expr = f"COALESCE({key_expr}, '')"
+    agg_sql = "".join(f", {sql} AS a{i}" for i, sql in enumerate(aggregates.values()))
+    cursor.execute(
+        f"SELECT {key_expr} AS group_key, COUNT(*) AS count{agg_sql} {from_where_sql} "
+        f"GROUP BY 1 ORDER BY ({key_expr}) = '', 1",
+        params,
+    )
+    names = list(aggregates.keys())
+    groups = []
+    for row in cursor.fetchall():
+        groups.append({
+            "key": row["group_key"],
+            "count": int(row["count"]),
+            "aggregates": {name: _json_value(row[f"a{i}"]) for i, name in enumerate(names)},
+        })
+    return groups
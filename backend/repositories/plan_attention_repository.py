@@ -0,0 +1,82 @@
+"""Plan attention repository: deadline scan that writes svp_plans.needs_attention for every plan in one batched update.
+Each check is a range query on an index added by add_needs_attention_scan_support (init_db)."""
+import logging
+
+from config.database import get_db_connection
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock key so only one scan runs at a time
+_SCAN_LOCK_SQL = "hashtext('svp_plan_attention_scan')"
+
+
+def scan_plan_attention(midpoint_days=30, stalled_days=14):
+    """Recompute needs_attention for all plans from three checks on open (not Complete/Canceled) plans:
+    entities not Complete whose midpoint_current_pp falls within the next midpoint_days days, visits whose end date
+    (start date when no end) has passed while the entity is not Complete, and sections In Progress for more than
+    stalled_days days. Writes e.g. "Midpoint in 30d: 2; Overdue visits: 1; Stalled: Basic Information" ('' when
+    nothing is due) and bumps version only for plans whose summary changed.
+    Returns {"plans_updated", "plans_flagged"}, {} when another scan holds the lock, or None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT pg_try_advisory_xact_lock({_SCAN_LOCK_SQL}) AS locked")
+        if not cursor.fetchone()["locked"]:
+            conn.rollback()
+            cursor.close()
+            return {}
+        cursor.execute(
+            """WITH midpoint AS (
+                   SELECT pe.plan_id, COUNT(*) AS n FROM public.entities e
+                   JOIN public.svp_plan_entities pe ON pe.entity_id = e.id
+                   WHERE e.midpoint_current_pp BETWEEN CURRENT_DATE AND CURRENT_DATE + %(midpoint_days)s
+                     AND pe.status IS DISTINCT FROM 'Complete'
+                   GROUP BY pe.plan_id
+               ), overdue AS (
+                   SELECT pe.plan_id, COUNT(*) AS n FROM public.svp_entity_basic_info bi
+                   JOIN public.svp_plan_entities pe ON pe.id = bi.plan_entity_id
+                   WHERE bi.start_date IS NOT NULL AND COALESCE(bi.end_date, bi.start_date) < CURRENT_DATE
+                     AND pe.status IS DISTINCT FROM 'Complete'
+                   GROUP BY pe.plan_id
+               ), stalled AS (
+                   SELECT s.plan_id, string_agg(s.name, ', ' ORDER BY s.name) AS names FROM public.svp_plan_sections s
+                   WHERE s.status = 'In Progress' AND s.status_changed_at < NOW() - make_interval(days => %(stalled_days)s)
+                   GROUP BY s.plan_id
+               ), summary AS (
+                   SELECT p.id,
+                          CASE WHEN COALESCE(p.status, '') IN ('Complete', 'Canceled') THEN ''
+                               ELSE concat_ws('; ', 'Midpoint in ' || %(midpoint_days)s || 'd: ' || m.n,
+                                                    'Overdue visits: ' || o.n,
+                                                    'Stalled: ' || st.names)
+                          END AS needs_attention
+                   FROM public.svp_plans p
+                   LEFT JOIN midpoint m ON m.plan_id = p.id
+                   LEFT JOIN overdue o ON o.plan_id = p.id
+                   LEFT JOIN stalled st ON st.plan_id = p.id
+               ), upd AS (
+                   UPDATE public.svp_plans p SET needs_attention = s.needs_attention, version = p.version + 1
+                   FROM summary s
+                   WHERE p.id = s.id AND COALESCE(p.needs_attention, '') <> s.needs_attention
+                   RETURNING p.id
+               )
+               SELECT (SELECT COUNT(*) FROM upd) AS plans_updated,
+                      (SELECT COUNT(*) FROM summary WHERE needs_attention <> '') AS plans_flagged""",
+            {"midpoint_days": int(midpoint_days), "stalled_days": int(stalled_days)},
+        )
+        row = cursor.fetchone()
+        conn.commit()
+        cursor.close()
+        result = {"plans_updated": int(row["plans_updated"]), "plans_flagged": int(row["plans_flagged"])}
+        logger.info("scan_plan_attention: %s", result)
+        return result
+    except Exception as e:
+        logger.exception("scan_plan_attention: error %s", e)
+        if conn:
+            conn.rollback()
+        return None
+    finally:
+        if conn:
+            conn.close()
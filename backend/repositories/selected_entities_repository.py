@@ -2,9 +2,57 @@
 import logging
 
 from config.database import get_db_connection
+from repositories.grid_query import (
+    TEXT,
+    LIKE,
+    FLAG,
+    build_filter_clause,
+    group_predicate,
+    query_facet_counts,
+    query_groups,
+    select_facets,
+)
+from repositories.svp_plan_repository import PLAN_PROGRESS_JOIN, PROGRESS_COLUMNS, _progress_from_row
 
 logger = logging.getLogger(__name__)
 
+# Plan entities grid filters (query param -> column; plan state on svp_plan_entities pe, entity attributes on entities e)
+# and the columns that get facet counts
+ENTITY_FILTER_COLUMNS = {
+    "state": ("e.state", TEXT),
+    "status": ("pe.status", TEXT),
+    "active_grant_no_site_visit": ("e.active_grant_no_site_visit", FLAG),
+    "active_grant_1_year_pp": ("e.active_grant_1_year_pp", FLAG),
+    "active_new_grant": ("e.active_new_grant", FLAG),
+    "visit_started": ("pe.visit_started", FLAG),
+    "entity_number": ("pe.entity_number", LIKE),
+    "entity_name": ("e.entity_name", LIKE),
+    "city": ("e.city", LIKE),
+}
+ENTITY_FACETS = {
+    key: ENTITY_FILTER_COLUMNS[key]
+    for key in ("state", "status", "active_grant_no_site_visit", "active_grant_1_year_pp", "active_new_grant", "visit_started")
+}
+# Group-by columns for the grouped grid views; assignee comes from the entity's Basic Information row
+ENTITY_GROUP_COLUMNS = dict(ENTITY_FACETS, assignee=("bi.default_assignee", TEXT))
+# Per-group aggregates available through ?aggregate= (count is always returned)
+ENTITY_AGGREGATES = {
+    "visit_started": "COUNT(*) FILTER (WHERE pe.visit_started)",
+    "complete": "COUNT(*) FILTER (WHERE pe.status = 'Complete')",
+    "with_basic_info": "COUNT(bi.id)",
+    "earliest_start_date": "MIN(bi.start_date)",
+    "latest_end_date": "MAX(bi.end_date)",
+}
+# svp_plan_entities keeps plan-specific state only; entity attributes are always read from the entities pool
+ENTITY_JOIN = "JOIN public.entities e ON e.id = pe.entity_id"
+_PLAN_ENTITY_COLUMNS = """pe.id, pe.plan_id, pe.entity_number, e.entity_name, e.city, e.state, e.midpoint_current_pp,
+    e.active_grant_no_site_visit, e.active_grant_1_year_pp, e.active_new_grant, pe.status, e.recent_site_visit_dates,
+    pe.visit_started"""
+_PLAN_ENTITY_GRID_FROM = """FROM public.svp_plan_entities pe
+    """ + ENTITY_JOIN + """
+    LEFT JOIN public.svp_entity_basic_info bi ON bi.plan_entity_id = pe.id
+    WHERE pe.plan_id = %s"""
+
 
 def _entity_row_to_dict(row):
     """Convert entity row to API-style dict."""
@@ -56,15 +104,36 @@ def _available_entity_row_to_dict(row):
 
 
 def _sync_plan_site_visits_count(cursor, plan_id_int):
-    """Set plan's site_visits to the count of entities in svp_plan_entities for this plan."""
+    """Set plan's site_visits to its entity count (read from the trigger-maintained svp_plan_progress row) and bump the plan version."""
     cursor.execute(
-        """UPDATE public.svp_plans SET site_visits = (
-            SELECT COUNT(*)::text FROM public.svp_plan_entities WHERE plan_id = %s
-        ) WHERE id = %s""",
+        """UPDATE public.svp_plans SET site_visits = COALESCE(
+            (SELECT total_entities FROM public.svp_plan_progress WHERE plan_id = %s), 0
+        )::text, version = version + 1 WHERE id = %s""",
         (plan_id_int, plan_id_int),
     )
 
 
+def _bump_plan_version(cursor, plan_id_int):
+    """Increment svp_plans.version after a change to the plan or its entities."""
+    cursor.execute("UPDATE public.svp_plans SET version = version + 1 WHERE id = %s", (plan_id_int,))
+
+
+def _plan_delta(cursor, plan_id_int):
+    """Return the plan's version, site_visits and entity counts ({"plan": {...}, "counts": {...}}) for delta responses."""
+    cursor.execute(
+        "SELECT p.id, p.version, p.site_visits, " + PROGRESS_COLUMNS + " FROM public.svp_plans p "
+        + PLAN_PROGRESS_JOIN.format("p") + " WHERE p.id = %s",
+        (plan_id_int,),
+    )
+    row = cursor.fetchone()
+    if not row:
+        return {"plan": None, "counts": None}
+    return {
+        "plan": {"id": str(row["id"]), "version": int(row["version"] or 0), "site_visits": str(row["site_visits"] or "0")},
+        "counts": _progress_from_row(row),
+    }
+
+
 SECTION_NAMES = {"cover_sheet": "Cover Sheet", "selected_entities": "Selected Entities", "identified_site_visits": "Identified Site Visits"}
 
 
@@ -76,34 +145,24 @@ def _set_section_status_in_progress(cursor, plan_id_int, section_id):
 def _set_section_status(cursor, plan_id_int, section_id, status):
     """Set a plan section's status. Inserts row if missing."""
     cursor.execute(
-        "UPDATE public.svp_plan_sections SET status = %s WHERE plan_id = %s AND section_id = %s",
-        (status, plan_id_int, section_id),
+        """INSERT INTO public.svp_plan_sections (plan_id, section_id, name, status) VALUES (%s, %s, %s, %s)
+           ON CONFLICT (plan_id, section_id) DO UPDATE SET status = EXCLUDED.status""",
+        (plan_id_int, section_id, SECTION_NAMES.get(section_id, section_id), status),
     )
-    if cursor.rowcount == 0:
-        section_name = SECTION_NAMES.get(section_id, section_id)
-        cursor.execute(
-            "INSERT INTO public.svp_plan_sections (plan_id, section_id, name, status) VALUES (%s, %s, %s, %s)",
-            (plan_id_int, section_id, section_name, status),
-        )
 
 
 def _all_plan_entities_complete(cursor, plan_id_int):
-    """Return True if plan has at least one entity and all have status = 'Complete'."""
+    """Return True if plan has at least one entity and all have status = 'Complete' (from svp_plan_progress counters)."""
     cursor.execute(
-        """SELECT COUNT(*) AS total,
-                  COUNT(*) FILTER (WHERE status = 'Complete') AS complete
-           FROM public.svp_plan_entities WHERE plan_id = %s""",
+        """SELECT total_entities AS total, COALESCE((by_status->>'Complete')::int, 0) AS complete
+           FROM public.svp_plan_progress WHERE plan_id = %s""",
         (plan_id_int,),
     )
     row = cursor.fetchone()
     if not row:
         return False
-    try:
-        total = int(row["total"])
-        complete = int(row["complete"]) if row.get("complete") is not None else 0
-    except (TypeError, ValueError):
-        return False
-    return total > 0 and total == complete
+    total = int(row["total"] or 0)
+    return total > 0 and total == int(row["complete"] or 0)
 
 
 def _resolve_plan_id_int(cursor, plan_id_str):
@@ -128,10 +187,8 @@ def get_plan_entities(plan_id):
         try:
             if plan_id_str.isdigit():
                 cursor.execute(
-                    """SELECT id, plan_id, entity_number, entity_name, city, state, midpoint_current_pp,
-                       active_grant_no_site_visit, active_grant_1_year_pp, active_new_grant, status, recent_site_visit_dates,
-                       visit_started
-                       FROM public.svp_plan_entities WHERE plan_id = %s ORDER BY entity_number""",
+                    "SELECT " + _PLAN_ENTITY_COLUMNS + " FROM public.svp_plan_entities pe " + ENTITY_JOIN
+                    + " WHERE pe.plan_id = %s ORDER BY pe.entity_number",
                     (int(plan_id_str),)
                 )
             else:
@@ -141,10 +198,8 @@ def get_plan_entities(plan_id):
                     cursor.close()
                     return []
                 cursor.execute(
-                    """SELECT id, plan_id, entity_number, entity_name, city, state, midpoint_current_pp,
-                       active_grant_no_site_visit, active_grant_1_year_pp, active_new_grant, status, recent_site_visit_dates,
-                       visit_started
-                       FROM public.svp_plan_entities WHERE plan_id = %s ORDER BY entity_number""",
+                    "SELECT " + _PLAN_ENTITY_COLUMNS + " FROM public.svp_plan_entities pe " + ENTITY_JOIN
+                    + " WHERE pe.plan_id = %s ORDER BY pe.entity_number",
                     (row["id"],)
                 )
             rows = cursor.fetchall()
@@ -162,6 +217,108 @@ def get_plan_entities(plan_id):
             conn.close()
 
 
+def get_plan_entity_facets(plan_id, filters=None, facets=None):
+    """Return plan entity counts per state, status and eligibility flag for the current filter set (one GROUPING SETS query).
+    Shape: {"total": int, "facets": {key: [{"value", "count"}]}}. None if plan not found or on error."""
+    plan_id_str = str(plan_id).strip()
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        plan_id_int = _resolve_plan_id_int(cursor, plan_id_str)
+        if plan_id_int is None:
+            cursor.close()
+            return None
+        where_sql, params = build_filter_clause(filters, ENTITY_FILTER_COLUMNS)
+        result = query_facet_counts(
+            cursor,
+            "FROM public.svp_plan_entities pe " + ENTITY_JOIN + " WHERE pe.plan_id = %s" + where_sql,
+            [plan_id_int] + params,
+            select_facets(ENTITY_FACETS, facets),
+        )
+        cursor.close()
+        return result
+    except Exception as e:
+        logger.exception("get_plan_entity_facets: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+def get_plan_entity_groups(plan_id, group_by, aggregates=None, filters=None):
+    """Return group headers for the plan's entities grouped by group_by (see ENTITY_GROUP_COLUMNS), computed in SQL.
+    aggregates is a list of ENTITY_AGGREGATES names. Returns {"total", "groups": [{"key", "count", "aggregates"}]} or None."""
+    plan_id_str = str(plan_id).strip()
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        plan_id_int = _resolve_plan_id_int(cursor, plan_id_str)
+        if plan_id_int is None:
+            cursor.close()
+            return None
+        where_sql, params = build_filter_clause(filters, ENTITY_FILTER_COLUMNS)
+        groups = query_groups(
+            cursor,
+            _PLAN_ENTITY_GRID_FROM + where_sql,
+            [plan_id_int] + params,
+            ENTITY_GROUP_COLUMNS[group_by],
+            {name: ENTITY_AGGREGATES[name] for name in (aggregates or []) if name in ENTITY_AGGREGATES},
+        )
+        cursor.close()
+        return {"total": sum(g["count"] for g in groups), "groups": groups}
+    except Exception as e:
+        logger.exception("get_plan_entity_groups: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+def get_plan_entity_group_rows(plan_id, group_by, group_value, filters=None, limit=50, offset=0):
+    """Return one page of the plan's entities in a single group (lazy loading of a group's rows).
+    Returns {"total", "entities"} where total is the group size, or None if plan not found or on error."""
+    plan_id_str = str(plan_id).strip()
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        plan_id_int = _resolve_plan_id_int(cursor, plan_id_str)
+        if plan_id_int is None:
+            cursor.close()
+            return None
+        where_sql, params = build_filter_clause(filters, ENTITY_FILTER_COLUMNS)
+        group_sql, group_params = group_predicate(*ENTITY_GROUP_COLUMNS[group_by], group_value)
+        cursor.execute(
+            "SELECT " + _PLAN_ENTITY_COLUMNS + ", COUNT(*) OVER () AS total_count "
+            + _PLAN_ENTITY_GRID_FROM + where_sql + group_sql
+            + " ORDER BY pe.entity_number LIMIT %s OFFSET %s",
+            [plan_id_int] + params + group_params + [limit, offset],
+        )
+        rows = [dict(r) for r in cursor.fetchall()]
+        cursor.close()
+        return {
+            "total": int(rows[0]["total_count"]) if rows else 0,
+            "entities": [_entity_row_to_dict(r) for r in rows],
+        }
+    except Exception as e:
+        logger.exception("get_plan_entity_group_rows: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
 def get_available_entities(plan_id, search_params=None):
     """Get entities not yet in plan (from entities table) for Add Grants modal."""
     plan_id_str = str(plan_id).strip()
@@ -259,8 +416,9 @@ def get_entity_by_id(entity_id):
             conn.close()
 
 
-def add_entity_to_plan(plan_id, entity_id):
-    """Add an entity to a plan by copying from entities table to svp_plan_entities."""
+def add_entity_to_plan(plan_id, entity_id, delta=False):
+    """Add an entity to a plan (svp_plan_entities row referencing the entities pool row).
+    Returns the full entity list, or with delta=True {"entity", "added", "plan", "counts"} (row from RETURNING, no re-read)."""
     plan_id_str = str(plan_id).strip()
     entity_id_str = str(entity_id).strip()
     conn = None
@@ -275,12 +433,7 @@ def add_entity_to_plan(plan_id, entity_id):
                 conn.rollback()
                 cursor.close()
                 return None
-            cursor.execute(
-                """SELECT entity_number, entity_name, city, state, midpoint_current_pp,
-                   active_grant_no_site_visit, active_grant_1_year_pp, active_new_grant, recent_site_visit_dates
-                   FROM public.entities WHERE id = %s""",
-                (int(entity_id_str),)
-            )
+            cursor.execute("SELECT id, entity_number FROM public.entities WHERE id = %s", (int(entity_id_str),))
             entity_row = cursor.fetchone()
             if not entity_row:
                 conn.rollback()
@@ -288,38 +441,41 @@ def add_entity_to_plan(plan_id, entity_id):
                 return None
             entity = dict(entity_row)
             cursor.execute(
-                """INSERT INTO public.svp_plan_entities
-                   (plan_id, entity_number, entity_name, city, state, midpoint_current_pp,
-                    active_grant_no_site_visit, active_grant_1_year_pp, active_new_grant, status, recent_site_visit_dates)
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                   ON CONFLICT (plan_id, entity_number) DO NOTHING
-                   RETURNING id""",
-                (
-                    plan_id_int,
-                    entity["entity_number"],
-                    entity["entity_name"],
-                    entity.get("city"),
-                    entity.get("state"),
-                    entity.get("midpoint_current_pp"),
-                    entity.get("active_grant_no_site_visit", False),
-                    entity.get("active_grant_1_year_pp", False),
-                    entity.get("active_new_grant", False),
-                    "Not in Plan",
-                    entity.get("recent_site_visit_dates"),
-                )
+                """WITH pe AS (
+                       INSERT INTO public.svp_plan_entities (plan_id, entity_id, entity_number, status)
+                       VALUES (%s, %s, %s, %s)
+                       ON CONFLICT (plan_id, entity_number) DO NOTHING
+                       RETURNING *
+                   )
+                   SELECT """ + _PLAN_ENTITY_COLUMNS + " FROM pe " + ENTITY_JOIN,
+                (plan_id_int, entity["id"], entity["entity_number"], "Not in Plan"),
             )
             result = cursor.fetchone()
             if result:
                 _sync_plan_site_visits_count(cursor, plan_id_int)
                 _set_section_status_in_progress(cursor, plan_id_int, "selected_entities")
+                delta_out = dict(_plan_delta(cursor, plan_id_int), entity=_entity_row_to_dict(dict(result)), added=True) if delta else None
                 conn.commit()
                 cursor.close()
                 logger.info("add_entity_to_plan: success plan_id=%s entity_id=%s", plan_id_str, entity_id_str)
-                return get_plan_entities(plan_id_str)
+                return delta_out if delta else get_plan_entities(plan_id_str)
             else:
+                delta_out = None
+                if delta:
+                    cursor.execute(
+                        "SELECT " + _PLAN_ENTITY_COLUMNS + " FROM public.svp_plan_entities pe " + ENTITY_JOIN
+                        + " WHERE pe.plan_id = %s AND pe.entity_number = %s",
+                        (plan_id_int, entity["entity_number"]),
+                    )
+                    existing = cursor.fetchone()
+                    delta_out = dict(
+                        _plan_delta(cursor, plan_id_int),
+                        entity=_entity_row_to_dict(dict(existing)) if existing else None,
+                        added=False,
+                    )
                 conn.rollback()
                 cursor.close()
-                return get_plan_entities(plan_id_str)
+                return delta_out if delta else get_plan_entities(plan_id_str)
         except Exception as e:
             logger.exception("add_entity_to_plan: error %s", e)
             conn.rollback()
@@ -334,6 +490,107 @@ def add_entity_to_plan(plan_id, entity_id):
             conn.close()
 
 
+def _int_ids(values):
+    """Split raw ids into (valid ints in first-seen order, invalid raw values as strings)."""
+    valid, invalid, seen = [], [], set()
+    for v in values or []:
+        s = str(v).strip()
+        if s.isdigit():
+            i = int(s)
+            if i not in seen:
+                seen.add(i)
+                valid.append(i)
+        else:
+            invalid.append(s)
+    return valid, invalid
+
+
+def batch_update_plan_entities(plan_id, add_entity_ids=None, remove_plan_entity_ids=None):
+    """Add entities (public.entities ids) to and/or remove plan entities (svp_plan_entities ids) from a plan in one transaction.
+    Uses one set-based INSERT ... SELECT ... ON CONFLICT DO NOTHING and one DELETE; site_visits count and section status are updated once.
+    Returns {"add": [{"entity_id", "result", "plan_entity_id"?}], "remove": [{"id", "result"}], "site_visits"} or None if plan not found/error.
+    Results: added | already_in_plan | not_found | invalid (add); removed | not_found | invalid (remove)."""
+    plan_id_str = str(plan_id).strip()
+    add_ids, add_invalid = _int_ids(add_entity_ids)
+    remove_ids, remove_invalid = _int_ids(remove_plan_entity_ids)
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        cursor = conn.cursor()
+        try:
+            plan_id_int = _resolve_plan_id_int(cursor, plan_id_str)
+            if plan_id_int is None:
+                conn.rollback()
+                cursor.close()
+                return None
+            add_results = {}
+            if add_ids:
+                cursor.execute(
+                    """WITH src AS (
+                           SELECT id AS entity_id, entity_number FROM public.entities WHERE id = ANY(%s)
+                       ), ins AS (
+                           INSERT INTO public.svp_plan_entities (plan_id, entity_id, entity_number, status)
+                           SELECT %s, entity_id, entity_number, 'Not in Plan'
+                           FROM src
+                           ON CONFLICT (plan_id, entity_number) DO NOTHING
+                           RETURNING id, entity_number
+                       )
+                       SELECT src.entity_id, ins.id AS plan_entity_id
+                       FROM src LEFT JOIN ins ON ins.entity_number = src.entity_number""",
+                    (add_ids, plan_id_int),
+                )
+                for r in cursor.fetchall():
+                    if r["plan_entity_id"] is not None:
+                        add_results[r["entity_id"]] = {"result": "added", "plan_entity_id": str(r["plan_entity_id"])}
+                    else:
+                        add_results[r["entity_id"]] = {"result": "already_in_plan"}
+            removed = set()
+            if remove_ids:
+                cursor.execute(
+                    "DELETE FROM public.svp_plan_entities WHERE plan_id = %s AND id = ANY(%s) RETURNING id",
+                    (plan_id_int, remove_ids),
+                )
+                removed = {r["id"] for r in cursor.fetchall()}
+            added_count = sum(1 for r in add_results.values() if r["result"] == "added")
+            if added_count or removed:
+                _sync_plan_site_visits_count(cursor, plan_id_int)
+            if added_count:
+                _set_section_status_in_progress(cursor, plan_id_int, "selected_entities")
+            cursor.execute("SELECT site_visits FROM public.svp_plans WHERE id = %s", (plan_id_int,))
+            plan_row = cursor.fetchone()
+            conn.commit()
+            cursor.close()
+            logger.info(
+                "batch_update_plan_entities: plan_id=%s added=%d removed=%d",
+                plan_id_str, added_count, len(removed),
+            )
+            add_out = [
+                dict({"entity_id": str(i)}, **add_results.get(i, {"result": "not_found"})) for i in add_ids
+            ] + [{"entity_id": v, "result": "invalid"} for v in add_invalid]
+            remove_out = [
+                {"id": str(i), "result": "removed" if i in removed else "not_found"} for i in remove_ids
+            ] + [{"id": v, "result": "invalid"} for v in remove_invalid]
+            return {
+                "add": add_out,
+                "remove": remove_out,
+                "site_visits": str(plan_row["site_visits"] or "0") if plan_row else "0",
+            }
+        except Exception as e:
+            logger.exception("batch_update_plan_entities: error %s", e)
+            conn.rollback()
+        cursor.close()
+        return None
+    except Exception:
+        if conn:
+            conn.rollback()
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
 def remove_entity_from_plan(plan_id, entity_id):
     """Remove an entity from a plan."""
     plan_id_str = str(plan_id).strip()
@@ -375,8 +632,90 @@ def remove_entity_from_plan(plan_id, entity_id):
             conn.close()
 
 
-def update_entity_status(plan_id, entity_id, status=None, visit_started=None):
-    """Update entity status and/or visit_started in svp_plan_entities."""
+def bulk_update_entity_status(plan_id, plan_entity_ids=None, filters=None, status=None, visit_started=None):
+    """Apply status and/or visit_started to many plan entities with one UPDATE.
+    Targets plan_entity_ids when given, otherwise every plan entity matching filters (ENTITY_FILTER_COLUMNS; {} = whole plan).
+    Rows already holding the requested values are left untouched. The identified_site_visits section rollup runs once.
+    Returns {"updated", "entities": [changed rows only], "section_status"} or None if plan not found/error."""
+    plan_id_str = str(plan_id).strip()
+    if status is None and visit_started is None:
+        return None
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        cursor = conn.cursor()
+        try:
+            plan_id_int = _resolve_plan_id_int(cursor, plan_id_str)
+            if plan_id_int is None:
+                conn.rollback()
+                cursor.close()
+                return None
+            updates, changed, params = [], [], []
+            if status is not None:
+                updates.append("status = %s")
+                changed.append("pe.status IS DISTINCT FROM %s")
+                params.append(status)
+            if visit_started is not None:
+                updates.append("visit_started = %s")
+                changed.append("pe.visit_started IS DISTINCT FROM %s")
+                params.append(bool(visit_started))
+            where_sql = " FROM public.entities e WHERE e.id = pe.entity_id AND pe.plan_id = %s"
+            where_params = [plan_id_int]
+            if plan_entity_ids is not None:
+                ids, _ = _int_ids(plan_entity_ids)
+                where_sql += " AND pe.id = ANY(%s)"
+                where_params.append(ids)
+            else:
+                filter_sql, filter_params = build_filter_clause(filters, ENTITY_FILTER_COLUMNS)
+                where_sql += filter_sql
+                where_params.extend(filter_params)
+            cursor.execute(
+                "UPDATE public.svp_plan_entities pe SET " + ", ".join(updates)
+                + where_sql + " AND (" + " OR ".join(changed) + ")"
+                + " RETURNING " + _PLAN_ENTITY_COLUMNS,
+                params + where_params + params,
+            )
+            rows = [dict(r) for r in cursor.fetchall()]
+            section_status = None
+            if rows and visit_started is not None and bool(visit_started):
+                section_status = "In Progress"
+            if rows and status == "Complete" and _all_plan_entities_complete(cursor, plan_id_int):
+                section_status = "Complete"
+            if section_status:
+                _set_section_status(cursor, plan_id_int, "identified_site_visits", section_status)
+            if rows:
+                _bump_plan_version(cursor, plan_id_int)
+            conn.commit()
+            cursor.close()
+            logger.info(
+                "bulk_update_entity_status: plan_id=%s updated=%d status=%s visit_started=%s",
+                plan_id_str, len(rows), status, visit_started,
+            )
+            rows.sort(key=lambda r: r.get("entity_number") or "")
+            return {
+                "updated": len(rows),
+                "entities": [_entity_row_to_dict(r) for r in rows],
+                "section_status": section_status,
+            }
+        except Exception as e:
+            logger.exception("bulk_update_entity_status: error %s", e)
+            conn.rollback()
+        cursor.close()
+        return None
+    except Exception:
+        if conn:
+            conn.rollback()
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+def update_entity_status(plan_id, entity_id, status=None, visit_started=None, delta=False):
+    """Update entity status and/or visit_started in svp_plan_entities.
+    Returns the full entity list, or with delta=True {"entity", "section_status", "plan", "counts"} (row from RETURNING, no re-read)."""
     plan_id_str = str(plan_id).strip()
     entity_id_str = str(entity_id).strip()
     conn = None
@@ -404,16 +743,31 @@ def update_entity_status(plan_id, entity_id, status=None, visit_started=None):
                 return get_plan_entities(plan_id_str)
             params.extend([plan_id_int, int(entity_id_str)])
             cursor.execute(
-                "UPDATE public.svp_plan_entities SET " + ", ".join(updates) + " WHERE plan_id = %s AND id = %s",
+                "UPDATE public.svp_plan_entities pe SET " + ", ".join(updates)
+                + " FROM public.entities e WHERE e.id = pe.entity_id AND pe.plan_id = %s AND pe.id = %s"
+                " RETURNING " + _PLAN_ENTITY_COLUMNS,
                 params
             )
-            updated = cursor.rowcount > 0
+            updated_row = cursor.fetchone()
+            updated = updated_row is not None
+            section_status = None
             # If visit_started is being set to True, mark "Identified Site Visits" section as In Progress
             if updated and visit_started is not None and bool(visit_started):
                 _set_section_status_in_progress(cursor, plan_id_int, "identified_site_visits")
+                section_status = "In Progress"
             # If status was set to 'Complete', check if all plan entities are complete; if so, set section to Complete
             if updated and status == "Complete" and _all_plan_entities_complete(cursor, plan_id_int):
                 _set_section_status(cursor, plan_id_int, "identified_site_visits", "Complete")
+                section_status = "Complete"
+            delta_out = None
+            if updated:
+                _bump_plan_version(cursor, plan_id_int)
+                if delta:
+                    delta_out = dict(
+                        _plan_delta(cursor, plan_id_int),
+                        entity=_entity_row_to_dict(dict(updated_row)),
+                        section_status=section_status,
+                    )
             conn.commit()
             cursor.close()
             if updated:
@@ -421,7 +775,7 @@ def update_entity_status(plan_id, entity_id, status=None, visit_started=None):
                     "update_entity_status: success plan_id=%s entity_id=%s status=%s visit_started=%s",
                     plan_id_str, entity_id_str, status, visit_started,
                 )
-                return get_plan_entities(plan_id_str)
+                return delta_out if delta else get_plan_entities(plan_id_str)
             return None
         except Exception as e:
             logger.exception("update_entity_status: error %s", e)
@@ -4,7 +4,7 @@ import logging
 from datetime import datetime
 
 from config.database import get_db_connection
-from repositories.svp_plan_repository import DEFAULT_SECTIONS
+from repositories.svp_plan_repository import DEFAULT_SECTIONS, PLAN_COLUMNS, _write_plan_returning
 
 logger = logging.getLogger(__name__)
 
@@ -238,6 +238,9 @@ def create_svp_plan(payload):
     plan_for, plan_period, plan_name, team_name = _create_plan_payload_from_request(payload)
     logger.info("create_svp_plan: plan_for=%r plan_period=%r plan_name=%r", plan_for, plan_period, plan_name)
 
+    # One statement: take the next id from the sequence, derive plan_code from it, insert the plan and its sections
+    section_values = ", ".join(["(%s, %s, %s)"] * len(DEFAULT_SECTIONS))
+    section_params = [v for sec in DEFAULT_SECTIONS for v in (sec["id"], sec["name"], sec["status"])]
     conn = None
     try:
         conn = get_db_connection()
@@ -245,43 +248,34 @@ def create_svp_plan(payload):
             return None
         cursor = conn.cursor()
         try:
-            cursor.execute(
-                """INSERT INTO public.svp_plans (plan_code, plan_for, plan_period, plan_name, plan_description, site_visits, status, team_name, needs_attention)
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) RETURNING id""",
-                ("PSV-000000", plan_for, plan_period, plan_name, "", "0", "In Progress", team_name, "")
+            plan = _write_plan_returning(
+                cursor,
+                f"""n AS (SELECT nextval(pg_get_serial_sequence('public.svp_plans', 'id')) AS id),
+                   p AS (
+                       INSERT INTO public.svp_plans
+                           (id, plan_code, plan_for, plan_period, plan_name, plan_description, site_visits, status, team_name, needs_attention)
+                       SELECT n.id, 'PSV-' || lpad(n.id::text, GREATEST(6, length(n.id::text)), '0'),
+                              %s, %s, %s, '', '0', 'In Progress', %s, ''
+                       FROM n
+                       RETURNING {PLAN_COLUMNS}
+                   ),
+                   s AS (
+                       INSERT INTO public.svp_plan_sections (plan_id, section_id, name, status)
+                       SELECT p.id, d.section_id, d.name, d.status
+                       FROM p CROSS JOIN (VALUES {section_values}) AS d(section_id, name, status)
+                       ON CONFLICT (plan_id, section_id) DO UPDATE SET name = EXCLUDED.name, status = EXCLUDED.status
+                       RETURNING plan_id, section_id, name, status
+                   )""",
+                [plan_for, plan_period, plan_name, team_name] + section_params,
             )
-            row = cursor.fetchone()
-            if not row:
+            if plan is None:
                 conn.rollback()
                 cursor.close()
                 return None
-            new_id = row["id"]
-            plan_code = "PSV-" + str(new_id).zfill(6)
-            cursor.execute(
-                "UPDATE public.svp_plans SET plan_code = %s WHERE id = %s",
-                (plan_code, new_id)
-            )
-            for sec in DEFAULT_SECTIONS:
-                cursor.execute(
-                    "INSERT INTO public.svp_plan_sections (plan_id, section_id, name, status) VALUES (%s, %s, %s, %s)",
-                    (new_id, sec["id"], sec["name"], sec["status"])
-                )
             conn.commit()
             cursor.close()
-            logger.info("create_svp_plan: success id=%s plan_code=%s", new_id, plan_code)
-            return {
-                "id": str(new_id),
-                "plan_code": plan_code,
-                "plan_for": plan_for,
-                "plan_period": plan_period,
-                "plan_name": plan_name,
-                "plan_description": "",
-                "site_visits": "0",
-                "status": "In Progress",
-                "team_name": team_name,
-                "needs_attention": "",
-                "sections": list(DEFAULT_SECTIONS),
-            }
+            logger.info("create_svp_plan: success id=%s plan_code=%s", plan["id"], plan["plan_code"])
+            return plan
         except Exception as e:
             logger.exception("create_svp_plan: failed %s", e)
             if conn:
@@ -1,10 +1,68 @@
-"""SVP List page repository: list plans, record access."""
-from repositories.svp_plan_repository import _plan_row_from_svp_plans
+"""SVP List page repository: list plans, record access, facet counts."""
+import logging
+
+from repositories.svp_plan_repository import (
+    PLAN_PROGRESS_JOIN,
+    PLAN_SECTIONS_JOIN,
+    PROGRESS_COLUMNS,
+    _plan_row_from_svp_plans,
+)
+from repositories.grid_query import (
+    TEXT,
+    LIKE,
+    LIKE_ANY,
+    FLAG,
+    build_filter_clause,
+    group_predicate,
+    query_facet_counts,
+    query_groups,
+    select_facets,
+)
 from config.database import get_db_connection
 
+logger = logging.getLogger(__name__)
+
+# Plans grid filters (query param -> svp_plans column) and the columns that get facet counts
+PLAN_FILTER_COLUMNS = {
+    "status": ("p.status", TEXT),
+    "team_name": ("p.team_name", TEXT),
+    "plan_period": ("p.plan_period", TEXT),
+    "plan_for": ("p.plan_for", TEXT),
+    "plan_code": ("p.plan_code", LIKE),
+    "plan_name": ("p.plan_name", LIKE),
+    # Substring filters matching the list page's client-side filtering (search modal and grid column filters),
+    # so facet counts follow the filters the user has applied
+    "plan_for_like": ("p.plan_for", LIKE),
+    "plan_for_program": ("p.plan_for", LIKE_ANY),
+    "plan_for_division": ("p.plan_for", LIKE_ANY),
+    "plan_period_like": ("p.plan_period", LIKE),
+    "team_name_like": ("p.team_name", LIKE),
+    "site_visits_like": ("p.site_visits", LIKE),
+    "needs_attention_like": ("p.needs_attention", LIKE),
+    "needs_attention": ("COALESCE(p.needs_attention, '') <> ''", FLAG),
+}
+PLAN_FACETS = {key: PLAN_FILTER_COLUMNS[key] for key in ("status", "team_name", "plan_period", "plan_for")}
+# Group-by columns for the grouped plans grid and per-group aggregates available through ?aggregate=
+PLAN_GROUP_COLUMNS = dict(PLAN_FACETS)
+PLAN_AGGREGATES = {
+    "site_visits": "SUM(CASE WHEN p.site_visits ~ '^[0-9]+$' THEN p.site_visits::integer ELSE 0 END)",
+    "complete": "COUNT(*) FILTER (WHERE p.status = 'Complete')",
+    "needs_attention": "COUNT(*) FILTER (WHERE COALESCE(p.needs_attention, '') <> '')",
+}
+
 
-def get_svp_plans(username=None):
-    """Return SVP plans list from public.svp_plans. When username is set, left-joins svp_plan_access to include last_accessed_at for that user."""
+# Plan list columns; sections and progress come from PLAN_SECTIONS_JOIN / PLAN_PROGRESS_JOIN on alias p
+_LIST_COLUMNS = (
+    "p.id, p.plan_code, p.plan_for, p.plan_period, p.plan_name, p.plan_description, "
+    "p.site_visits, p.status, p.team_name, p.needs_attention, sec.sections, " + PROGRESS_COLUMNS
+)
+_LIST_JOINS = PLAN_SECTIONS_JOIN.format("p") + " " + PLAN_PROGRESS_JOIN.format("p")
+
+
+def get_svp_plans(username=None, ids=None):
+    """Return SVP plans list from public.svp_plans with real section statuses and progress counters, in one query.
+    When username is set, left-joins svp_plan_access to include last_accessed_at for that user.
+    When ids is given (numeric ids and/or plan codes), only those plans are returned."""
     conn = None
     try:
         conn = get_db_connection()
@@ -13,20 +71,22 @@ def get_svp_plans(username=None):
         conn.autocommit = True
         cursor = conn.cursor()
         try:
-            if username and str(username).strip():
-                cursor.execute(
-                    """SELECT p.id, p.plan_code, p.plan_for, p.plan_period, p.plan_name, p.plan_description,
-                              p.site_visits, p.status, p.team_name, p.needs_attention, a.last_accessed_at
-                       FROM public.svp_plans p
-                       LEFT JOIN public.svp_plan_access a ON a.plan_id = p.id AND a.username = %s
-                       ORDER BY p.id""",
-                    (str(username).strip(),)
+            username = str(username or "").strip()
+            sql = "SELECT " + _LIST_COLUMNS
+            params = []
+            if username:
+                sql += ", a.last_accessed_at FROM public.svp_plans p " + _LIST_JOINS + (
+                    " LEFT JOIN public.svp_plan_access a ON a.plan_id = p.id AND a.username = %s"
                 )
+                params.append(username)
             else:
-                cursor.execute(
-                    "SELECT id, plan_code, plan_for, plan_period, plan_name, plan_description, site_visits, status, team_name, needs_attention "
-                    "FROM public.svp_plans ORDER BY id"
-                )
+                sql += " FROM public.svp_plans p " + _LIST_JOINS
+            if ids is not None:
+                numeric = [int(i) for i in ids if str(i).isdigit()]
+                codes = [str(i) for i in ids if not str(i).isdigit()]
+                sql += " WHERE (p.id = ANY(%s) OR p.plan_code = ANY(%s))"
+                params.extend([numeric, codes])
+            cursor.execute(sql + " ORDER BY p.id", params)
             rows = cursor.fetchall()
             cursor.close()
             return [_plan_row_from_svp_plans(dict(row)) for row in rows] if rows else []
@@ -88,3 +148,92 @@ def record_plan_access(username, plan_id):
     finally:
         if conn:
             conn.close()
+
+
+def get_svp_plan_facets(filters=None, facets=None):
+    """Return plan counts per status, team, period and plan_for for the current filter set (one GROUPING SETS query).
+    Shape: {"total": int, "facets": {key: [{"value", "count"}]}}. None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        where_sql, params = build_filter_clause(filters, PLAN_FILTER_COLUMNS)
+        result = query_facet_counts(
+            cursor,
+            "FROM public.svp_plans p WHERE TRUE" + where_sql,
+            params,
+            select_facets(PLAN_FACETS, facets),
+        )
+        cursor.close()
+        return result
+    except Exception as e:
+        logger.exception("get_svp_plan_facets: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+def get_svp_plan_groups(group_by, aggregates=None, filters=None):
+    """Return group headers for plans grouped by group_by (see PLAN_GROUP_COLUMNS), computed in SQL.
+    Returns {"total", "groups": [{"key", "count", "aggregates"}]} or None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        where_sql, params = build_filter_clause(filters, PLAN_FILTER_COLUMNS)
+        groups = query_groups(
+            cursor,
+            "FROM public.svp_plans p WHERE TRUE" + where_sql,
+            params,
+            PLAN_GROUP_COLUMNS[group_by],
+            {name: PLAN_AGGREGATES[name] for name in (aggregates or []) if name in PLAN_AGGREGATES},
+        )
+        cursor.close()
+        return {"total": sum(g["count"] for g in groups), "groups": groups}
+    except Exception as e:
+        logger.exception("get_svp_plan_groups: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+def get_svp_plan_group_rows(group_by, group_value, filters=None, username=None, limit=50, offset=0):
+    """Return one page of plans in a single group (lazy loading of a group's rows), with last_accessed_at when username is set.
+    Returns {"total", "plans"} where total is the group size, or None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        where_sql, params = build_filter_clause(filters, PLAN_FILTER_COLUMNS)
+        group_sql, group_params = group_predicate(*PLAN_GROUP_COLUMNS[group_by], group_value)
+        cursor.execute(
+            "SELECT " + _LIST_COLUMNS + """, a.last_accessed_at, COUNT(*) OVER () AS total_count
+               FROM public.svp_plans p
+               LEFT JOIN public.svp_plan_access a ON a.plan_id = p.id AND a.username = %s
+               """ + _LIST_JOINS + """
+               WHERE TRUE""" + where_sql + group_sql + " ORDER BY p.id LIMIT %s OFFSET %s",
+            [str(username or "").strip()] + params + group_params + [limit, offset],
+        )
+        rows = [dict(r) for r in cursor.fetchall()]
+        cursor.close()
+        return {
+            "total": int(rows[0]["total_count"]) if rows else 0,
+            "plans": [_plan_row_from_svp_plans(r) for r in rows],
+        }
+    except Exception as e:
+        logger.exception("get_svp_plan_group_rows: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
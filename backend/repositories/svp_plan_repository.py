@@ -28,6 +28,19 @@ def _sections_from_db_rows(section_rows):
     return result
 
 
+def _progress_from_row(row):
+    """Build the plan's entity counters {"total", "complete", "visit_started", "with_basic_info", "by_status"}
+    from PROGRESS_COLUMNS (all zero when the plan has no svp_plan_progress row yet)."""
+    by_status = {k: int(v) for k, v in (row.get("progress_by_status") or {}).items()}
+    return {
+        "total": int(row.get("total_entities") or 0),
+        "complete": by_status.get("Complete", 0),
+        "visit_started": int(row.get("visit_started_entities") or 0),
+        "with_basic_info": int(row.get("with_basic_info_entities") or 0),
+        "by_status": by_status,
+    }
+
+
 def _plan_row_from_svp_plans(row):
     """Build API-style plan dict from svp_plans row (id INTEGER, plan_code VARCHAR). Optionally includes last_accessed_at from join."""
     plan_id = str(row["id"])
@@ -45,11 +58,100 @@ def _plan_row_from_svp_plans(row):
         "needs_attention": row.get("needs_attention") or "",
         "sections": list(DEFAULT_SECTIONS),
     }
+    if row.get("version") is not None:
+        out["version"] = int(row["version"])
+    if "sections" in row:
+        out["sections"] = _sections_from_db_rows(row["sections"])
+    if "total_entities" in row:
+        out["progress"] = _progress_from_row(row)
     if row.get("last_accessed_at") is not None:
         out["last_accessed_at"] = row["last_accessed_at"].isoformat() if hasattr(row["last_accessed_at"], "isoformat") else str(row["last_accessed_at"])
     return out
 
 
+# Plan columns returned by writes (RETURNING) and single-plan reads
+PLAN_COLUMNS = "id, plan_code, plan_for, plan_period, plan_name, plan_description, site_visits, status, team_name, needs_attention, version"
+
+# Per-plan entity counters kept current by triggers on svp_plan_entities (see create_svp_plan_progress in init_db).
+# PLAN_PROGRESS_JOIN is formatted with the plans table/alias it joins to.
+PROGRESS_COLUMNS = "pr.total_entities, pr.visit_started_entities, pr.with_basic_info_entities, pr.by_status AS progress_by_status"
+PLAN_PROGRESS_JOIN = "LEFT JOIN public.svp_plan_progress pr ON pr.plan_id = {}.id"
+
+# Tracked section rows per plan as one JSON array (column sec.sections), so plan lists get real statuses in one query.
+# Formatted like PLAN_PROGRESS_JOIN.
+PLAN_SECTIONS_JOIN = """LEFT JOIN LATERAL (
+    SELECT json_agg(json_build_object('section_id', t.section_id, 'name', t.name, 'status', t.status)) AS sections
+    FROM public.svp_plan_sections t WHERE t.plan_id = {}.id
+) sec ON TRUE"""
+
+
+def _plan_match(plan_id_str, alias=""):
+    """Return (sql, param) matching a plan by numeric id or plan_code."""
+    if plan_id_str.isdigit():
+        return f"{alias}id = %s", int(plan_id_str)
+    return f"{alias}plan_code = %s", plan_id_str
+
+
+def _write_plan_returning(cursor, ctes_sql, params):
+    """Run one write statement and build the updated plan from it, without a re-read on another connection.
+    ctes_sql defines CTE "p" (UPDATE/INSERT on public.svp_plans ... RETURNING PLAN_COLUMNS) and CTE "s" (section rows written,
+    RETURNING plan_id, section_id, name, status). Sections are s merged with the plan's untouched section rows,
+    since the statement's snapshot does not see its own CTE writes. Returns plan dict or None if p is empty."""
+    cursor.execute(
+        "WITH " + ctes_sql + """
+        SELECT p.*, """ + PROGRESS_COLUMNS + """,
+               (SELECT json_agg(json_build_object('section_id', x.section_id, 'name', x.name, 'status', x.status))
+                FROM (SELECT section_id, name, status FROM s
+                      UNION ALL
+                      SELECT t.section_id, t.name, t.status FROM public.svp_plan_sections t
+                      WHERE t.plan_id = p.id AND NOT EXISTS (SELECT 1 FROM s WHERE s.section_id = t.section_id)) x
+               ) AS sections
+        FROM p """ + PLAN_PROGRESS_JOIN.format("p"),
+        params,
+    )
+    row = cursor.fetchone()
+    if not row:
+        return None
+    return _plan_row_from_svp_plans(dict(row))
+
+
+def get_svp_plan_handle(plan_id):
+    """Return a lightweight plan handle {"id", "plan_code", "version", "plan_for", "plan_period", "site_visits"} by id or
+    plan_code in one query (no sections), or None if not found. The last three name the coversheet attachment folder."""
+    plan_id_str = str(plan_id).strip()
+    if not plan_id_str:
+        return None
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT id, plan_code, version, plan_for, plan_period, site_visits FROM public.svp_plans WHERE "
+            + ("id = %s" if plan_id_str.isdigit() else "plan_code = %s"),
+            (int(plan_id_str) if plan_id_str.isdigit() else plan_id_str,),
+        )
+        row = cursor.fetchone()
+        cursor.close()
+        if not row:
+            return None
+        return {
+            "id": str(row["id"]),
+            "plan_code": row["plan_code"] or "",
+            "version": int(row["version"] or 0),
+            "plan_for": row["plan_for"] or "",
+            "plan_period": row["plan_period"] or "",
+            "site_visits": str(row["site_visits"]) if row["site_visits"] is not None else "0",
+        }
+    except Exception:
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
 def get_svp_plan_by_id(plan_id):
     """Return a single SVP plan by id from public.svp_plans. None if not found. Uses autocommit so read always sees latest committed data."""
     plan_id_str = str(plan_id).strip()
@@ -61,36 +163,17 @@ def get_svp_plan_by_id(plan_id):
         conn.autocommit = True
         cursor = conn.cursor()
         try:
-            if plan_id_str.isdigit():
-                cursor.execute(
-                    "SELECT id, plan_code, plan_for, plan_period, plan_name, plan_description, site_visits, status, team_name, needs_attention "
-                    "FROM public.svp_plans WHERE id = %s",
-                    (int(plan_id_str),)
-                )
-            else:
-                cursor.execute(
-                    "SELECT id, plan_code, plan_for, plan_period, plan_name, plan_description, site_visits, status, team_name, needs_attention "
-                    "FROM public.svp_plans WHERE plan_code = %s",
-                    (plan_id_str,)
-                )
+            match_sql, match_param = _plan_match(plan_id_str, "svp_plans.")
+            cursor.execute(
+                "SELECT " + PLAN_COLUMNS + ", " + PROGRESS_COLUMNS + ", sec.sections FROM public.svp_plans "
+                + PLAN_PROGRESS_JOIN.format("svp_plans") + " " + PLAN_SECTIONS_JOIN.format("svp_plans") + " WHERE " + match_sql,
+                (match_param,)
+            )
             row = cursor.fetchone()
             if not row:
                 cursor.close()
                 return None
-            r = dict(row)
-            if r.get("plan_description") is None:
-                r["plan_description"] = ""
-            plan_dict = _plan_row_from_svp_plans(r)
-            try:
-                pid = int(r["id"])
-                cursor.execute(
-                    "SELECT section_id, name, status FROM public.svp_plan_sections WHERE plan_id = %s",
-                    (pid,)
-                )
-                section_rows = cursor.fetchall()
-                plan_dict["sections"] = _sections_from_db_rows([dict(s) for s in section_rows])
-            except Exception:
-                plan_dict["sections"] = list(DEFAULT_SECTIONS)
+            plan_dict = _plan_row_from_svp_plans(dict(row))
             cursor.close()
             return plan_dict
         except Exception:
@@ -105,11 +188,13 @@ def get_svp_plan_by_id(plan_id):
 
 
 def update_svp_plan_status(plan_id, status):
-    """Update a plan's status in svp_plans (e.g. to 'Complete'). When status is Complete, all plan sections are set to Complete. Returns updated plan dict or None."""
+    """Update a plan's status in svp_plans (e.g. to 'Complete'). When status is Complete, all plan sections are set to Complete.
+    Returns updated plan dict (built from RETURNING in the same statement) or None."""
     plan_id_str = str(plan_id).strip()
     status_str = (status or "").strip()
-    if not status_str:
+    if not status_str or not plan_id_str:
         return None
+    match_sql, match_param = _plan_match(plan_id_str)
     conn = None
     try:
         conn = get_db_connection()
@@ -117,35 +202,32 @@ def update_svp_plan_status(plan_id, status):
             return None
         cursor = conn.cursor()
         try:
-            if plan_id_str.isdigit():
-                cursor.execute(
-                    "UPDATE public.svp_plans SET status = %s WHERE id = %s",
-                    (status_str, int(plan_id_str)),
-                )
-                plan_id_int = int(plan_id_str) if cursor.rowcount > 0 else None
-            else:
-                cursor.execute(
-                    "UPDATE public.svp_plans SET status = %s WHERE plan_code = %s",
-                    (status_str, plan_id_str),
-                )
-                plan_id_int = None
-                if cursor.rowcount > 0:
-                    cursor.execute("SELECT id FROM public.svp_plans WHERE plan_code = %s", (plan_id_str,))
-                    row = cursor.fetchone()
-                    if row:
-                        plan_id_int = row["id"]
-            if plan_id_int is None:
+            # When plan is marked Complete, set all section statuses to Complete (inserting any missing section rows)
+            section_values = ", ".join(["(%s, %s)"] * len(DEFAULT_SECTIONS))
+            section_params = [v for sec in DEFAULT_SECTIONS for v in (sec["id"], sec["name"])]
+            plan = _write_plan_returning(
+                cursor,
+                f"""p AS (
+                       UPDATE public.svp_plans SET status = %s, version = version + 1 WHERE {match_sql}
+                       RETURNING {PLAN_COLUMNS}
+                   ),
+                   s AS (
+                       INSERT INTO public.svp_plan_sections (plan_id, section_id, name, status)
+                       SELECT p.id, d.section_id, d.name, 'Complete'
+                       FROM p CROSS JOIN (VALUES {section_values}) AS d(section_id, name)
+                       WHERE %s
+                       ON CONFLICT (plan_id, section_id) DO UPDATE SET status = EXCLUDED.status
+                       RETURNING plan_id, section_id, name, status
+                   )""",
+                [status_str, match_param] + section_params + [status_str.lower() == "complete"],
+            )
+            if plan is None:
+                conn.rollback()
                 cursor.close()
                 return None
-            # When plan is marked Complete, set all section statuses to Complete
-            if status_str.strip().lower() == "complete":
-                cursor.execute(
-                    "UPDATE public.svp_plan_sections SET status = %s WHERE plan_id = %s",
-                    ("Complete", plan_id_int),
-                )
             conn.commit()
             cursor.close()
-            return get_svp_plan_by_id(plan_id_str)
+            return plan
         except Exception:
             if conn:
                 conn.rollback()
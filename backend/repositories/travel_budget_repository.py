@@ -0,0 +1,131 @@
+"""Travel budget repository: travel plan cost and traveler rollups per plan, team and plan entity, aggregated in SQL
+(svp_entity_travel_plans.travel_cost is NUMERIC, number_of_travelers INTEGER; see convert_travel_plan_amounts in init_db)."""
+import logging
+
+from config.database import get_db_connection
+from repositories.grid_query import TEXT, build_filter_clause
+from repositories.selected_entities_repository import ENTITY_JOIN
+
+logger = logging.getLogger(__name__)
+
+# Rollup filters (query param -> column)
+TRAVEL_BUDGET_FILTER_COLUMNS = {
+    "status": ("p.status", TEXT),
+    "team_name": ("p.team_name", TEXT),
+    "plan_period": ("p.plan_period", TEXT),
+    "plan_for": ("p.plan_for", TEXT),
+    "travel_status": ("t.status", TEXT),
+}
+# Measures per bucket; travel plans without a cost count in unpriced_travel_plans and add nothing to total_cost
+_BUDGET_MEASURES_SQL = """COUNT(DISTINCT t.plan_entity_id) AS entities_with_travel,
+          COUNT(*) AS travel_plans,
+          COALESCE(SUM(t.number_of_travelers), 0) AS travelers,
+          COALESCE(SUM(t.travel_cost), 0) AS total_cost,
+          COUNT(*) FILTER (WHERE t.travel_cost IS NULL) AS unpriced_travel_plans"""
+
+
+def _budget_row(row):
+    """Build one rollup bucket from a row carrying the _BUDGET_MEASURES_SQL columns."""
+    return {
+        "entities_with_travel": int(row.get("entities_with_travel") or 0),
+        "travel_plans": int(row.get("travel_plans") or 0),
+        "travelers": int(row.get("travelers") or 0),
+        "total_cost": float(row.get("total_cost") or 0),
+        "unpriced_travel_plans": int(row.get("unpriced_travel_plans") or 0),
+    }
+
+
+def get_travel_budget_rollup(filters=None):
+    """Return travel budget totals, per team_name and per plan in one GROUPING SETS query over plans with travel plans.
+    Returns {"totals", "by_team_name": [{"team_name", ...}], "plans": [{"plan_id", "plan_code", "plan_name", "team_name",
+    "status", ...}]} (measures: entities_with_travel, travel_plans, travelers, total_cost, unpriced_travel_plans) or None."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        where_sql, params = build_filter_clause(filters, TRAVEL_BUDGET_FILTER_COLUMNS)
+        cursor.execute(
+            """SELECT COALESCE(p.team_name, '') AS team_name, p.id AS plan_id, p.plan_code, p.plan_name, p.status,
+                      GROUPING(COALESCE(p.team_name, '')) AS g_team, GROUPING(p.id) AS g_plan,
+                      """ + _BUDGET_MEASURES_SQL + """
+               FROM public.svp_entity_travel_plans t
+               JOIN public.svp_plan_entities pe ON pe.id = t.plan_entity_id
+               JOIN public.svp_plans p ON p.id = pe.plan_id
+               WHERE TRUE""" + where_sql + """
+               GROUP BY GROUPING SETS (
+                   (COALESCE(p.team_name, ''), p.id, p.plan_code, p.plan_name, p.status),
+                   (COALESCE(p.team_name, '')),
+                   ()
+               )""",
+            params,
+        )
+        result = {"totals": _budget_row({}), "by_team_name": [], "plans": []}
+        for row in cursor.fetchall():
+            if row["g_team"]:
+                result["totals"] = _budget_row(row)
+            elif row["g_plan"]:
+                result["by_team_name"].append(dict(_budget_row(row), team_name=row["team_name"]))
+            else:
+                result["plans"].append(dict(
+                    _budget_row(row),
+                    plan_id=str(row["plan_id"]),
+                    plan_code=row["plan_code"] or "",
+                    plan_name=row["plan_name"] or "",
+                    team_name=row["team_name"],
+                    status=row["status"] or "",
+                ))
+        cursor.close()
+        result["by_team_name"].sort(key=lambda r: (-r["total_cost"], r["team_name"]))
+        result["plans"].sort(key=lambda r: (r["team_name"], r["plan_code"]))
+        return result
+    except Exception as e:
+        logger.exception("get_travel_budget_rollup: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+def get_plan_travel_budget(plan_id_int):
+    """Return one plan's travel budget: {"totals", "entities": [{"id", "entity_number", "entity_name", ...measures}]},
+    one row per plan entity with travel plans (GROUPING SETS per entity plus the plan total). None on error."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return None
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute(
+            """SELECT pe.id, pe.entity_number, e.entity_name, GROUPING(pe.id) AS g_entity,
+                      """ + _BUDGET_MEASURES_SQL + """
+               FROM public.svp_plan_entities pe
+               """ + ENTITY_JOIN + """
+               JOIN public.svp_entity_travel_plans t ON t.plan_entity_id = pe.id
+               WHERE pe.plan_id = %s
+               GROUP BY GROUPING SETS ((pe.id, pe.entity_number, e.entity_name), ())""",
+            (plan_id_int,),
+        )
+        result = {"totals": _budget_row({}), "entities": []}
+        for row in cursor.fetchall():
+            if row["g_entity"]:
+                result["totals"] = _budget_row(row)
+            else:
+                result["entities"].append(dict(
+                    _budget_row(row),
+                    id=str(row["id"]),
+                    entity_number=row["entity_number"] or "",
+                    entity_name=row["entity_name"] or "",
+                ))
+        cursor.close()
+        result["entities"].sort(key=lambda r: r["entity_number"])
+        return result
+    except Exception as e:
+        logger.exception("get_plan_travel_budget: error %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
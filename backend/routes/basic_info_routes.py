@@ -1,18 +1,42 @@
 """Basic Information page API routes."""
 import logging
+from datetime import datetime
 from flask import Blueprint, jsonify, request
 
-from repositories.basic_info_repository import get_plan_entity_id_or_reason
+from repositories.basic_info_repository import (
+    BULK_BASIC_INFO_COLUMNS,
+    CALENDAR_FILTER_COLUMNS,
+    SEARCH_JSONB_COLUMNS,
+    get_plan_entity_id_or_reason,
+)
 from services.basic_info_service import (
+    bulk_apply_basic_info,
+    find_assignee_conflicts,
+    get_visit_calendar,
+    search_site_visits,
     get_basic_info,
     get_basic_info_options,
+    get_basic_info_summary,
     update_basic_info,
 )
+from utils.plan_loader import with_plan
+from utils.request_utils import filters_from_args, int_arg
 
 logger = logging.getLogger(__name__)
 
 basic_info_bp = Blueprint("basic_info", __name__, url_prefix="/api/svp")
 
+# Longest calendar window served by one request, in days
+MAX_CALENDAR_DAYS = 366
+
+
+def _date_arg(name):
+    """Parse a YYYY-MM-DD query param to a date, or None when missing/invalid."""
+    try:
+        return datetime.strptime((request.args.get(name) or "").strip(), "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
 
 @basic_info_bp.route("/plans/<plan_id>/entities/<entity_id>/basic-info", methods=["GET"])
 def api_svp_plan_entity_basic_info_get(plan_id, entity_id):
@@ -44,6 +68,115 @@ def api_svp_plan_entity_basic_info_patch(plan_id, entity_id):
         return jsonify({"error": "Failed to update basic information", "detail": detail}), 500
 
 
+@basic_info_bp.route("/plans/<plan_id>/basic-info/summary", methods=["GET"])
+@with_plan()
+def api_svp_plan_basic_info_summary(plan):
+    """Get one compact basic info row per plan entity (dates, assignee, prioritization, status, travel plan count)."""
+    try:
+        rows = get_basic_info_summary(plan["id"])
+        if rows is None:
+            return jsonify({"error": "Failed to load basic information summary"}), 500
+        return jsonify({"entities": rows}), 200
+    except Exception as e:
+        logger.exception("api_svp_plan_basic_info_summary: error %s", e)
+        return jsonify({"error": "Failed to load basic information summary"}), 500
+
+
+@basic_info_bp.route("/plans/<plan_id>/basic-info/bulk", methods=["POST"])
+@with_plan()
+def api_svp_plan_basic_info_bulk(plan):
+    """Apply the same basic info fields to many plan entities in one statement.
+    Body: { "ids": [planEntityId, ...], "fields": { "default_assignee": ..., "start_date": ..., ... }, "mark_complete"?: bool }."""
+    try:
+        body = request.get_json(silent=True) or {}
+        ids = body.get("ids")
+        fields = body.get("fields") or {}
+        if not isinstance(ids, list) or not ids:
+            return jsonify({"error": "ids must be a non-empty list"}), 400
+        if not isinstance(fields, dict):
+            return jsonify({"error": "fields must be an object"}), 400
+        unknown = [k for k in fields if k not in BULK_BASIC_INFO_COLUMNS]
+        if unknown:
+            return jsonify({"error": "Unsupported fields", "fields": unknown, "allowed": BULK_BASIC_INFO_COLUMNS}), 400
+        mark_complete = bool(body.get("mark_complete"))
+        if not fields and not mark_complete:
+            return jsonify({"error": "fields or mark_complete is required"}), 400
+        result = bulk_apply_basic_info(plan["id"], ids, fields, mark_complete=mark_complete)
+        if result is None:
+            return jsonify({"error": "Failed to update basic information"}), 500
+        return jsonify(result), 200
+    except Exception as e:
+        logger.exception("api_svp_plan_basic_info_bulk: error %s", e)
+        return jsonify({"error": "Failed to update basic information"}), 500
+
+
+@basic_info_bp.route("/calendar", methods=["GET"])
+def api_svp_calendar():
+    """Site visits overlapping a date window across plans. Query: from=, to= (YYYY-MM-DD, inclusive, at most a year apart),
+    optional assignee= and team_name/plan_status/plan_code/entity_status filters (repeat for multiple values), limit (max 5000)."""
+    try:
+        date_from, date_to = _date_arg("from"), _date_arg("to")
+        if date_from is None or date_to is None:
+            return jsonify({"error": "from and to are required (YYYY-MM-DD)"}), 400
+        if date_to < date_from or (date_to - date_from).days >= MAX_CALENDAR_DAYS:
+            return jsonify({"error": f"to must be on or after from and within {MAX_CALENDAR_DAYS} days"}), 400
+        filters = filters_from_args(request.args, CALENDAR_FILTER_COLUMNS)
+        limit = int_arg(request.args, "limit", 1000, minimum=1, maximum=5000)
+        visits = get_visit_calendar(date_from, date_to, filters=filters, assignee=request.args.get("assignee"), limit=limit)
+        if visits is None:
+            return jsonify({"error": "Failed to load calendar"}), 500
+        return jsonify({"from": date_from.isoformat(), "to": date_to.isoformat(), "visits": visits}), 200
+    except Exception as e:
+        logger.exception("api_svp_calendar: error %s", e)
+        return jsonify({"error": "Failed to load calendar"}), 500
+
+
+@basic_info_bp.route("/calendar/conflicts", methods=["GET"])
+def api_svp_calendar_conflicts():
+    """Visits that overlap start_date..end_date for the same assignee(s). Query: start_date=, optional end_date=,
+    assignee= (repeatable), optional exclude= plan entity id (the visit being edited)."""
+    try:
+        start_date = _date_arg("start_date")
+        if start_date is None:
+            return jsonify({"error": "start_date is required (YYYY-MM-DD)"}), 400
+        assignees = request.args.getlist("assignee")
+        if not any(a.strip() for a in assignees):
+            return jsonify({"error": "assignee is required"}), 400
+        exclude = (request.args.get("exclude") or "").strip()
+        conflicts = find_assignee_conflicts(
+            start_date, _date_arg("end_date"), assignees,
+            exclude_plan_entity_id=int(exclude) if exclude.isdigit() else None,
+        )
+        if conflicts is None:
+            return jsonify({"error": "Failed to check assignee conflicts"}), 500
+        return jsonify({"conflicts": conflicts}), 200
+    except Exception as e:
+        logger.exception("api_svp_calendar_conflicts: error %s", e)
+        return jsonify({"error": "Failed to check assignee conflicts"}), 500
+
+
+@basic_info_bp.route("/site-visits/search", methods=["GET"])
+def api_svp_site_visit_search():
+    """Search visits across plans by list fields (conducted_by, reason_types, areas_of_review, participants,
+    additional_programs; repeat a param to require several values). Optional from/to date window (both or neither),
+    team_name/plan_status/plan_code/entity_status filters, limit (default 50, max 500) and offset."""
+    try:
+        contains = filters_from_args(request.args, SEARCH_JSONB_COLUMNS)
+        date_from, date_to = _date_arg("from"), _date_arg("to")
+        if (date_from is None) != (date_to is None) or (date_from and date_to < date_from):
+            return jsonify({"error": "from and to must be given together (YYYY-MM-DD) with to on or after from"}), 400
+        filters = filters_from_args(request.args, CALENDAR_FILTER_COLUMNS)
+        limit = int_arg(request.args, "limit", 50, minimum=1, maximum=500)
+        offset = int_arg(request.args, "offset", 0)
+        result = search_site_visits(contains, date_from=date_from, date_to=date_to, filters=filters, limit=limit, offset=offset)
+        if result is None:
+            return jsonify({"error": "Failed to search site visits"}), 500
+        return jsonify(dict(result, limit=limit, offset=offset)), 200
+    except Exception as e:
+        logger.exception("api_svp_site_visit_search: error %s", e)
+        return jsonify({"error": "Failed to search site visits"}), 500
+
+
 @basic_info_bp.route("/basic-info/options", methods=["GET"])
 def api_svp_basic_info_options():
     """Get option lists for basic info form (dropdowns, checkboxes)."""
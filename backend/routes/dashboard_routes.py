@@ -0,0 +1,42 @@
+"""SVP dashboard API routes."""
+import logging
+from flask import Blueprint, jsonify, request
+
+from repositories.dashboard_repository import DASHBOARD_FILTER_COLUMNS
+from services.dashboard_service import get_dashboard, refresh_dashboard
+from utils.request_utils import filters_from_args, int_arg
+
+logger = logging.getLogger(__name__)
+
+dashboard_bp = Blueprint("dashboard", __name__, url_prefix="/api/svp")
+
+
+@dashboard_bp.route("/dashboard", methods=["GET"])
+def api_svp_dashboard():
+    """Return plan/entity completion per status, team_name, plan_period and plan_for plus upcoming visits per month,
+    read from materialized views. Optional filters named like the columns and months_ahead= (default 3, max 24)."""
+    try:
+        filters = filters_from_args(request.args, DASHBOARD_FILTER_COLUMNS)
+        months_ahead = int_arg(request.args, "months_ahead", 3, minimum=1, maximum=24)
+        result = get_dashboard(filters=filters, months_ahead=months_ahead)
+        if result is None:
+            return jsonify({"error": "Failed to load dashboard"}), 500
+        return jsonify(result), 200
+    except Exception as e:
+        logger.exception("api_svp_dashboard: error %s", e)
+        return jsonify({"error": "Failed to load dashboard"}), 500
+
+
+@dashboard_bp.route("/dashboard/refresh", methods=["POST"])
+def api_svp_dashboard_refresh():
+    """Refresh the dashboard views now. Returns 409 if another refresh is already running."""
+    try:
+        refreshed = refresh_dashboard()
+        if refreshed is None:
+            return jsonify({"error": "Failed to refresh dashboard"}), 500
+        if not refreshed:
+            return jsonify({"error": "Dashboard refresh already in progress"}), 409
+        return jsonify({"refreshed": refreshed}), 200
+    except Exception as e:
+        logger.exception("api_svp_dashboard_refresh: error %s", e)
+        return jsonify({"error": "Failed to refresh dashboard"}), 500
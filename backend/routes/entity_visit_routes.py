@@ -0,0 +1,40 @@
+"""Entity site visit history API routes."""
+import logging
+from flask import Blueprint, jsonify, request
+
+from services.entity_visit_service import get_entities_not_visited, get_entity_site_visits
+from utils.request_utils import int_arg
+
+logger = logging.getLogger(__name__)
+
+entity_visits_bp = Blueprint("entity_visits", __name__, url_prefix="/api/svp")
+
+
+@entity_visits_bp.route("/entities/<entity_id>/site-visits", methods=["GET"])
+def api_svp_entity_site_visits(entity_id):
+    """Return an entity's structured site visit history (newest first)."""
+    try:
+        result = get_entity_site_visits(entity_id)
+        if result is None:
+            return jsonify({"error": "Entity not found"}), 404
+        return jsonify(result), 200
+    except Exception as e:
+        logger.exception("api_svp_entity_site_visits: error %s", e)
+        return jsonify({"error": "Failed to load site visit history"}), 500
+
+
+@entity_visits_bp.route("/entities/not-visited", methods=["GET"])
+def api_svp_entities_not_visited():
+    """Return entities with no site visit in the last years= years (default: site_visit_lookback_years setting),
+    least recently visited first. Paginated with limit (default 50, max 500) and offset."""
+    try:
+        years = int_arg(request.args, "years", 0, minimum=0, maximum=50) if "years" in request.args else None
+        limit = int_arg(request.args, "limit", 50, minimum=1, maximum=500)
+        offset = int_arg(request.args, "offset", 0)
+        result = get_entities_not_visited(years=years, limit=limit, offset=offset)
+        if result is None:
+            return jsonify({"error": "Failed to load entities"}), 500
+        return jsonify(dict(result, limit=limit, offset=offset)), 200
+    except Exception as e:
+        logger.exception("api_svp_entities_not_visited: error %s", e)
+        return jsonify({"error": "Failed to load entities"}), 500
@@ -3,40 +3,85 @@ import logging
 from flask import Blueprint, jsonify, request
 
 from services.selected_entities_service import (
-    get_plan,
     get_entities,
+    get_entity_facets,
+    get_entity_groups,
+    get_entity_group_rows,
     get_available,
     add_entity,
     remove_entity,
+    batch_update_entities,
     update_entity_status,
+    bulk_update_entity_status,
 )
+from repositories.selected_entities_repository import ENTITY_FILTER_COLUMNS, ENTITY_GROUP_COLUMNS, ENTITY_AGGREGATES
+from utils.plan_loader import with_plan
+from utils.request_utils import csv_arg, filters_from_args, int_arg
 
 logger = logging.getLogger(__name__)
 
 selected_entities_bp = Blueprint("selected_entities", __name__, url_prefix="/api/svp")
 
 
+def _wants_delta():
+    """True when the client asked for a minimal mutation response (?response=delta) instead of the full entity list."""
+    return (request.args.get("response") or "").strip().lower() == "delta"
+
+
 @selected_entities_bp.route("/plans/<plan_id>/entities", methods=["GET"])
-def api_svp_plan_entities(plan_id):
-    """Get entities for a plan."""
+@with_plan()
+def api_svp_plan_entities(plan):
+    """Get entities for a plan. With group_by= returns group headers (count plus ?aggregate= values) computed in SQL;
+    adding group_value= returns one page (limit/offset) of that group's rows instead."""
     try:
-        plan = get_plan(plan_id)
-        if plan is None:
-            return jsonify({"error": "Plan not found"}), 404
-        entities = get_entities(plan_id)
-        return jsonify({"entities": entities}), 200
+        group_by = (request.args.get("group_by") or "").strip()
+        if not group_by:
+            entities = get_entities(plan["id"])
+            return jsonify({"entities": entities}), 200
+        if group_by not in ENTITY_GROUP_COLUMNS:
+            return jsonify({"error": "Unsupported group_by", "allowed": list(ENTITY_GROUP_COLUMNS)}), 400
+        aggregates = csv_arg(request.args, "aggregate")
+        unknown = [a for a in aggregates if a not in ENTITY_AGGREGATES]
+        if unknown:
+            return jsonify({"error": "Unsupported aggregate", "unknown": unknown, "allowed": list(ENTITY_AGGREGATES)}), 400
+        filters = filters_from_args(request.args, ENTITY_FILTER_COLUMNS)
+        if "group_value" in request.args:
+            group_value = request.args.get("group_value", "")
+            limit = int_arg(request.args, "limit", 50, minimum=1, maximum=500)
+            offset = int_arg(request.args, "offset", 0)
+            result = get_entity_group_rows(plan["id"], group_by, group_value, filters=filters, limit=limit, offset=offset)
+            if result is None:
+                return jsonify({"error": "Failed to load entities"}), 500
+            return jsonify(dict(result, group_by=group_by, group_value=group_value, limit=limit, offset=offset)), 200
+        result = get_entity_groups(plan["id"], group_by, aggregates=aggregates, filters=filters)
+        if result is None:
+            return jsonify({"error": "Failed to load entities"}), 500
+        return jsonify(dict(result, group_by=group_by)), 200
     except Exception as e:
         logger.exception("api_svp_plan_entities: error %s", e)
         return jsonify({"error": "Failed to load entities"}), 500
 
 
+@selected_entities_bp.route("/plans/<plan_id>/entities/facets", methods=["GET"])
+@with_plan()
+def api_svp_plan_entity_facets(plan):
+    """Return plan entity counts per facet value (state, status, eligibility flags, visit_started) for the current filters."""
+    try:
+        filters = filters_from_args(request.args, ENTITY_FILTER_COLUMNS)
+        result = get_entity_facets(plan["id"], filters=filters, facets=csv_arg(request.args, "facets"))
+        if result is None:
+            return jsonify({"error": "Failed to load entity facets"}), 500
+        return jsonify(result), 200
+    except Exception as e:
+        logger.exception("api_svp_plan_entity_facets: error %s", e)
+        return jsonify({"error": "Failed to load entity facets"}), 500
+
+
 @selected_entities_bp.route("/plans/<plan_id>/entities/available", methods=["GET"])
-def api_svp_plan_available_entities(plan_id):
+@with_plan()
+def api_svp_plan_available_entities(plan):
     """Get available entities not yet in plan (for Add Grants modal)."""
     try:
-        plan = get_plan(plan_id)
-        if plan is None:
-            return jsonify({"error": "Plan not found"}), 404
         search_params = {}
         entity_number = request.args.get("entity_number", "").strip()
         entity_name = request.args.get("entity_name", "").strip()
@@ -50,7 +95,7 @@ def api_svp_plan_available_entities(plan_id):
             search_params["city"] = city
         if state:
             search_params["state"] = state
-        entities = get_available(plan_id, search_params if search_params else None)
+        entities = get_available(plan["id"], search_params if search_params else None)
         return jsonify({"entities": entities}), 200
     except Exception as e:
         logger.exception("api_svp_plan_available_entities: error %s", e)
@@ -58,33 +103,83 @@ def api_svp_plan_available_entities(plan_id):
 
 
 @selected_entities_bp.route("/plans/<plan_id>/entities", methods=["POST"])
-def api_svp_plan_add_entity(plan_id):
-    """Add an entity to a plan."""
+@with_plan()
+def api_svp_plan_add_entity(plan):
+    """Add an entity to a plan. Returns the full entity list, or with ?response=delta only the added row,
+    the new plan version and entity counts."""
     try:
-        plan = get_plan(plan_id)
-        if plan is None:
-            return jsonify({"error": "Plan not found"}), 404
         body = request.get_json(silent=True) or {}
         entity_id = body.get("entityId")
         if not entity_id:
             return jsonify({"error": "entityId is required"}), 400
-        entities = add_entity(plan_id, entity_id)
+        delta = _wants_delta()
+        entities = add_entity(plan["id"], entity_id, delta=delta)
         if entities is None:
             return jsonify({"error": "Failed to add entity"}), 500
+        if delta:
+            return jsonify(entities), 200
         return jsonify({"entities": entities}), 200
     except Exception as e:
         logger.exception("api_svp_plan_add_entity: error %s", e)
         return jsonify({"error": "Failed to add entity"}), 500
 
 
+@selected_entities_bp.route("/plans/<plan_id>/entities/batch", methods=["POST"])
+@with_plan()
+def api_svp_plan_batch_entities(plan):
+    """Add and/or remove many entities in one transaction. Body: { "add": [entityId, ...], "remove": [planEntityId, ...] }."""
+    try:
+        body = request.get_json(silent=True) or {}
+        add_ids = body.get("add") or []
+        remove_ids = body.get("remove") or []
+        if not isinstance(add_ids, list) or not isinstance(remove_ids, list):
+            return jsonify({"error": "add and remove must be lists"}), 400
+        if not add_ids and not remove_ids:
+            return jsonify({"error": "add or remove is required"}), 400
+        result = batch_update_entities(plan["id"], add_entity_ids=add_ids, remove_plan_entity_ids=remove_ids)
+        if result is None:
+            return jsonify({"error": "Failed to update entities"}), 500
+        return jsonify(result), 200
+    except Exception as e:
+        logger.exception("api_svp_plan_batch_entities: error %s", e)
+        return jsonify({"error": "Failed to update entities"}), 500
+
+
+@selected_entities_bp.route("/plans/<plan_id>/entities", methods=["PATCH"])
+@with_plan()
+def api_svp_plan_bulk_update_entity_status(plan):
+    """Update status and/or visit_started for many plan entities in one UPDATE.
+    Body: { "status"?, "visit_started"?, "ids": [planEntityId, ...] } or { ..., "filter": { "status": [...], "state": [...] } }
+    (an empty filter targets every entity in the plan). Returns only the changed rows."""
+    try:
+        body = request.get_json(silent=True) or {}
+        status = body.get("status")
+        visit_started = body.get("visit_started")
+        if status is None and visit_started is None:
+            return jsonify({"error": "status or visit_started is required"}), 400
+        ids = body.get("ids")
+        filters = body.get("filter")
+        if ids is None and filters is None:
+            return jsonify({"error": "ids or filter is required"}), 400
+        if (ids is not None and not isinstance(ids, list)) or (filters is not None and not isinstance(filters, dict)):
+            return jsonify({"error": "ids must be a list and filter an object"}), 400
+        result = bulk_update_entity_status(
+            plan["id"], plan_entity_ids=ids, filters=filters, status=status, visit_started=visit_started
+        )
+        if result is None:
+            return jsonify({"error": "Failed to update entities"}), 500
+        return jsonify(result), 200
+    except Exception as e:
+        logger.exception("api_svp_plan_bulk_update_entity_status: error %s", e)
+        return jsonify({"error": "Failed to update entities"}), 500
+
+
 @selected_entities_bp.route("/plans/<plan_id>/entities/<entity_id>", methods=["DELETE"])
-def api_svp_plan_remove_entity(plan_id, entity_id):
+@with_plan()
+def api_svp_plan_remove_entity(plan, entity_id):
     """Remove an entity from a plan."""
     try:
-        plan = get_plan(plan_id)
-        if plan is None:
-            return jsonify({"error": "Plan not found"}), 404
-        deleted = remove_entity(plan_id, entity_id)
+        deleted = remove_entity(plan["id"], entity_id)
         if not deleted:
             return jsonify({"error": "Entity not found"}), 404
         return jsonify({"success": True}), 200
@@ -94,20 +189,22 @@ def api_svp_plan_remove_entity(plan_id, entity_id):
 
 
 @selected_entities_bp.route("/plans/<plan_id>/entities/<entity_id>", methods=["PATCH"])
-def api_svp_plan_update_entity_status(plan_id, entity_id):
-    """Update entity status and/or visit_started in a plan."""
+@with_plan()
+def api_svp_plan_update_entity_status(plan, entity_id):
+    """Update entity status and/or visit_started in a plan. Returns the full entity list, or with ?response=delta
+    only the changed row, the new plan version and entity counts."""
     try:
-        plan = get_plan(plan_id)
-        if plan is None:
-            return jsonify({"error": "Plan not found"}), 404
         body = request.get_json(silent=True) or {}
         status = body.get("status")
         visit_started = body.get("visit_started")
         if status is None and visit_started is None:
             return jsonify({"error": "status or visit_started is required"}), 400
-        entities = update_entity_status(plan_id, entity_id, status=status, visit_started=visit_started)
+        delta = _wants_delta()
+        entities = update_entity_status(plan["id"], entity_id, status=status, visit_started=visit_started, delta=delta)
         if entities is None:
             return jsonify({"error": "Failed to update entity"}), 500
+        if delta:
+            return jsonify(entities), 200
         return jsonify({"entities": entities}), 200
     except Exception as e:
         logger.exception("api_svp_plan_update_entity_status: error %s", e)
@@ -2,24 +2,84 @@
 import logging
 from flask import Blueprint, jsonify, request
 
-from services.svp_list_service import get_plans, record_access, get_config, cancel_plan
+from services.svp_list_service import (
+    get_plans,
+    get_plans_by_ids,
+    get_plan_facets,
+    get_plan_groups,
+    get_plan_group_rows,
+    record_access,
+    get_config,
+    cancel_plan,
+)
+from repositories.svp_list_repository import PLAN_FILTER_COLUMNS, PLAN_GROUP_COLUMNS, PLAN_AGGREGATES
+from utils.request_utils import csv_arg, filters_from_args, int_arg
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on plans fetched by one ?ids= multi-get
+MAX_PLAN_IDS = 200
+
 svp_list_bp = Blueprint("svp_list", __name__, url_prefix="/api/svp")
 
 
 @svp_list_bp.route("/plans", methods=["GET"])
 def api_svp_plans():
-    """Return site visit plans list. Optional query param username= for per-user last_accessed_at."""
+    """Return site visit plans list. Optional query param username= for per-user last_accessed_at.
+    With group_by= returns group headers (count plus ?aggregate= values) computed in SQL;
+    adding group_value= returns one page (limit/offset) of that group's plans instead.
+    With ids= (comma-separated or repeated ids/plan codes) returns just those plans plus not_found."""
     try:
         username = request.args.get("username") or None
-        plans = get_plans(username=username)
-        return jsonify({"plans": plans})
+        if "ids" in request.args:
+            ids = list(dict.fromkeys(csv_arg(request.args, "ids")))
+            if not ids:
+                return jsonify({"error": "ids must list at least one plan id"}), 400
+            if len(ids) > MAX_PLAN_IDS:
+                return jsonify({"error": f"At most {MAX_PLAN_IDS} ids per request"}), 400
+            return jsonify(get_plans_by_ids(ids, username=username))
+        group_by = (request.args.get("group_by") or "").strip()
+        if not group_by:
+            plans = get_plans(username=username)
+            return jsonify({"plans": plans})
+        if group_by not in PLAN_GROUP_COLUMNS:
+            return jsonify({"error": "Unsupported group_by", "allowed": list(PLAN_GROUP_COLUMNS)}), 400
+        aggregates = csv_arg(request.args, "aggregate")
+        unknown = [a for a in aggregates if a not in PLAN_AGGREGATES]
+        if unknown:
+            return jsonify({"error": "Unsupported aggregate", "unknown": unknown, "allowed": list(PLAN_AGGREGATES)}), 400
+        filters = filters_from_args(request.args, PLAN_FILTER_COLUMNS)
+        if "group_value" in request.args:
+            group_value = request.args.get("group_value", "")
+            limit = int_arg(request.args, "limit", 50, minimum=1, maximum=500)
+            offset = int_arg(request.args, "offset", 0)
+            result = get_plan_group_rows(group_by, group_value, filters=filters, username=username, limit=limit, offset=offset)
+            if result is None:
+                return jsonify({"error": "Failed to load SVP plans"}), 500
+            return jsonify(dict(result, group_by=group_by, group_value=group_value, limit=limit, offset=offset))
+        result = get_plan_groups(group_by, aggregates=aggregates, filters=filters)
+        if result is None:
+            return jsonify({"error": "Failed to load SVP plans"}), 500
+        return jsonify(dict(result, group_by=group_by))
     except Exception:
         return jsonify({"error": "Failed to load SVP plans"}), 500
 
 
+@svp_list_bp.route("/plans/facets", methods=["GET"])
+def api_svp_plan_facets():
+    """Return plan counts per facet value (status, team_name, plan_period, plan_for) for the current filters.
+    Filters are query params named like the columns (repeat for multiple values); optional facets=status,team_name."""
+    try:
+        filters = filters_from_args(request.args, PLAN_FILTER_COLUMNS)
+        result = get_plan_facets(filters=filters, facets=csv_arg(request.args, "facets"))
+        if result is None:
+            return jsonify({"error": "Failed to load plan facets"}), 500
+        return jsonify(result), 200
+    except Exception as e:
+        logger.exception("api_svp_plan_facets: error %s", e)
+        return jsonify({"error": "Failed to load plan facets"}), 500
+
+
 @svp_list_bp.route("/plans/<plan_id>/access", methods=["POST"])
 def api_svp_plan_record_access(plan_id):
     """Record that the current user accessed this plan (for recent-plans ordering). Body: { \"username\": \"...\" }."""
@@ -2,7 +2,8 @@
 import logging
 from flask import Blueprint, jsonify, request
 
-from services.svp_status_service import get_plan_by_id, update_plan_status, update_section_status
+from services.svp_status_service import update_plan_status, update_section_status
+from utils.plan_loader import with_plan
 
 logger = logging.getLogger(__name__)
 
@@ -10,12 +11,10 @@ svp_status_bp = Blueprint("svp_status", __name__, url_prefix="/api/svp")
 
 
 @svp_status_bp.route("/plans/<plan_id>", methods=["GET"])
-def api_svp_plan_by_id(plan_id):
+@with_plan(full=True)
+def api_svp_plan_by_id(plan):
     """Return a single site visit plan by id. Disable caching so clients always get latest data."""
     try:
-        plan = get_plan_by_id(plan_id)
-        if plan is None:
-            return jsonify({"error": "Plan not found"}), 404
         response = jsonify(plan)
         response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
         response.headers["Pragma"] = "no-cache"
@@ -25,12 +24,10 @@ def api_svp_plan_by_id(plan_id):
 
 
 @svp_status_bp.route("/plans/<plan_id>", methods=["PATCH"])
-def api_svp_plan_update(plan_id):
+@with_plan(full=True)
+def api_svp_plan_update(plan):
     """Update plan fields (e.g. status to 'Complete'). Body: { \"status\": \"Complete\" }."""
     try:
-        plan = get_plan_by_id(plan_id)
-        if plan is None:
-            return jsonify({"error": "Plan not found"}), 404
         body = request.get_json(silent=True) or {}
         status = body.get("status")
         if not status:
@@ -51,7 +48,7 @@ def api_svp_plan_update(plan_id):
                     }),
                     400,
                 )
-        updated = update_plan_status(plan_id, status)
+        updated = update_plan_status(plan["id"], status)
         if updated is None:
             return jsonify({"error": "Failed to update plan status"}), 500
         return jsonify(updated), 200
@@ -61,17 +58,15 @@ def api_svp_plan_update(plan_id):
 
 
 @svp_status_bp.route("/plans/<plan_id>/sections/<section_id>", methods=["PATCH"])
-def api_svp_plan_section(plan_id, section_id):
+@with_plan()
+def api_svp_plan_section(plan, section_id):
     """Update a plan section's status (e.g. selected_entities -> Complete)."""
     try:
-        plan = get_plan_by_id(plan_id)
-        if plan is None:
-            return jsonify({"error": "Plan not found"}), 404
         body = request.get_json(silent=True) or {}
         status = body.get("status")
         if not status:
             return jsonify({"error": "status is required"}), 400
-        updated = update_section_status(plan_id, section_id, status)
+        updated = update_section_status(plan["id"], section_id, status)
         if updated is None:
             return jsonify({"error": "Failed to update section status"}), 500
         return jsonify(updated), 200
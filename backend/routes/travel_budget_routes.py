@@ -0,0 +1,41 @@
+"""Travel budget API routes."""
+import logging
+from flask import Blueprint, jsonify, request
+
+from repositories.travel_budget_repository import TRAVEL_BUDGET_FILTER_COLUMNS
+from services.travel_budget_service import get_plan_travel_budget, get_travel_budget
+from utils.plan_loader import with_plan
+from utils.request_utils import filters_from_args
+
+logger = logging.getLogger(__name__)
+
+travel_budget_bp = Blueprint("travel_budget", __name__, url_prefix="/api/svp")
+
+
+@travel_budget_bp.route("/travel-budget", methods=["GET"])
+def api_svp_travel_budget():
+    """Return travel budget totals per team and per plan. Optional filters status, team_name, plan_period, plan_for
+    and travel_status (repeat for multiple values)."""
+    try:
+        filters = filters_from_args(request.args, TRAVEL_BUDGET_FILTER_COLUMNS)
+        result = get_travel_budget(filters=filters)
+        if result is None:
+            return jsonify({"error": "Failed to load travel budget"}), 500
+        return jsonify(result), 200
+    except Exception as e:
+        logger.exception("api_svp_travel_budget: error %s", e)
+        return jsonify({"error": "Failed to load travel budget"}), 500
+
+
+@travel_budget_bp.route("/plans/<plan_id>/travel-budget", methods=["GET"])
+@with_plan()
+def api_svp_plan_travel_budget(plan):
+    """Return one plan's travel budget total and per-entity breakdown."""
+    try:
+        result = get_plan_travel_budget(plan)
+        if result is None:
+            return jsonify({"error": "Failed to load travel budget"}), 500
+        return jsonify(result), 200
+    except Exception as e:
+        logger.exception("api_svp_plan_travel_budget: error %s", e)
+        return jsonify({"error": "Failed to load travel budget"}), 500
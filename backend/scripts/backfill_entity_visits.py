@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Backfill entity_site_visits from legacy recent_site_visit_dates text and completed plan entities,
+then re-derive the display text and active_grant_no_site_visit. Safe to re-run.
+Run from repo root: python backend/scripts/backfill_entity_visits.py
+Or from backend: python scripts/backfill_entity_visits.py
+"""
+import os
+import sys
+
+# Ensure backend is on path and .env is loaded
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+os.chdir(backend_dir)
+
+from repositories.entity_visit_repository import backfill_entity_site_visits
+
+def main():
+    result = backfill_entity_site_visits()
+    if result is None:
+        print("Backfill failed. Check the logs and DATABASE_URL.")
+        return 1
+    print(f"Visits parsed from text: {result['legacy_visits']}")
+    print(f"Entities updated: {result['entities_updated']}")
+    if result["unparsed"]:
+        print("Unparsed text for: " + ", ".join(result["unparsed"]))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -107,16 +107,9 @@ CREATE TABLE IF NOT EXISTS public.entities (
 CREATE TABLE IF NOT EXISTS public.svp_plan_entities (
     id SERIAL PRIMARY KEY,
     plan_id INTEGER NOT NULL REFERENCES public.svp_plans(id) ON DELETE CASCADE,
+    entity_id INTEGER NOT NULL REFERENCES public.entities(id),  -- entity attributes are read from public.entities
     entity_number VARCHAR(50) NOT NULL,
-    entity_name TEXT NOT NULL,
-    city VARCHAR(100),
-    state VARCHAR(2),
-    midpoint_current_pp DATE,
-    active_grant_no_site_visit BOOLEAN DEFAULT FALSE,
-    active_grant_1_year_pp BOOLEAN DEFAULT FALSE,
-    active_new_grant BOOLEAN DEFAULT FALSE,
     status VARCHAR(50) DEFAULT 'Not in Plan',
-    recent_site_visit_dates TEXT,
     visit_started BOOLEAN DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT NOW(),
     UNIQUE(plan_id, entity_number)
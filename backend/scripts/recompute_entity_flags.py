@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Recompute entity eligibility flags (midpoint_current_pp, active_grant_1_year_pp, active_new_grant,
+active_grant_no_site_visit) for all entities, e.g. nightly from cron.
+Run from repo root: python backend/scripts/recompute_entity_flags.py [--dry-run]
+Or from backend: python scripts/recompute_entity_flags.py [--dry-run]
+"""
+import argparse
+import os
+import sys
+
+# Ensure backend is on path and .env is loaded
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+os.chdir(backend_dir)
+
+from repositories.entity_flags_repository import recompute_entity_flags
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute entity eligibility flags.")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change, then roll back")
+    args = parser.parse_args()
+    result = recompute_entity_flags(dry_run=args.dry_run)
+    if result is None:
+        print("Recompute failed. Check the logs and DATABASE_URL.")
+        return 1
+    if not result:
+        print("Another recompute is already running; skipped.")
+        return 0
+    for column, changed in result["rules"].items():
+        print(f"{column}: {changed} entities changed")
+    print(f"Entities changed: {result['entities_changed']}")
+    print(f"Plan entities affected: {result['plan_entities_affected']} (in {result['plans_updated']} open plans)")
+    if result["dry_run"]:
+        print("Dry run: no changes were saved.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Refresh the SVP dashboard materialized views (REFRESH MATERIALIZED VIEW CONCURRENTLY), e.g. from cron.
+Run from repo root: python backend/scripts/refresh_dashboard.py
+Or from backend: python scripts/refresh_dashboard.py
+"""
+import os
+import sys
+
+# Ensure backend is on path and .env is loaded
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+os.chdir(backend_dir)
+
+from repositories.dashboard_repository import refresh_dashboard_views
+
+def main():
+    refreshed = refresh_dashboard_views()
+    if refreshed is None:
+        print("Dashboard refresh failed. Check the logs and DATABASE_URL.")
+        return 1
+    if not refreshed:
+        print("Another dashboard refresh is already running; skipped.")
+        return 0
+    for view, refreshed_at in refreshed.items():
+        print(f"{view}: refreshed at {refreshed_at}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
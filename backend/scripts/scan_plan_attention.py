@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Recompute svp_plans.needs_attention from the deadline scan (upcoming midpoints, overdue visits, stalled sections), e.g. from cron.
+Run from repo root: python backend/scripts/scan_plan_attention.py
+Or from backend: python scripts/scan_plan_attention.py
+"""
+import os
+import sys
+
+# Ensure backend is on path and .env is loaded
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+os.chdir(backend_dir)
+
+from services.plan_attention_service import scan_attention
+
+def main():
+    result = scan_attention()
+    if result is None:
+        print("Attention scan failed. Check the logs and DATABASE_URL.")
+        return 1
+    if not result:
+        print("Another attention scan is already running; skipped.")
+        return 0
+    print(f"Plans needing attention: {result['plans_flagged']}")
+    print(f"Plans updated: {result['plans_updated']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
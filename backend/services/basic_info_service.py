@@ -1,10 +1,16 @@
 """Basic Information page service: get basic info and options; update basic info (persisted to DB)."""
 from repositories.basic_info_repository import (
     get_basic_info as repo_get_basic_info,
+    get_basic_info_summary as repo_get_basic_info_summary,
+    bulk_apply_basic_info as repo_bulk_apply_basic_info,
     upsert_basic_info as repo_upsert_basic_info,
     get_assignees as repo_get_assignees,
+    get_visit_calendar as repo_get_visit_calendar,
+    find_assignee_conflicts as repo_find_assignee_conflicts,
+    search_site_visits as repo_search_site_visits,
 )
 from services.selected_entities_service import update_entity_status as update_plan_entity_status
+from utils.cache import facet_cache
 
 # Static option lists for dropdowns/checkboxes (phase 1; can move to app_config or static_data later)
 DEFAULT_OPTIONS = {
@@ -66,6 +72,11 @@ def get_basic_info(plan_id, entity_id):
     return repo_get_basic_info(plan_id, entity_id)
 
 
+def get_basic_info_summary(plan_id):
+    """Return compact basic info rows for every entity in the plan (numeric plan id), or None on error."""
+    return repo_get_basic_info_summary(int(plan_id))
+
+
 def get_basic_info_options():
     """Return option lists for dropdowns and checkboxes. Assignees are fetched from DB (basic_info_assignee)."""
     options = DEFAULT_OPTIONS.copy()
@@ -80,5 +91,28 @@ def update_basic_info(plan_id, entity_id, payload, plan_entity_id=None):
     When action is mark_complete, also set the plan entity status to 'Complete' so Identified Site Visits shows it."""
     updated = repo_upsert_basic_info(plan_id, entity_id, payload, plan_entity_id=plan_entity_id)
     if updated and payload.get("action") == "mark_complete":
-        update_plan_entity_status(plan_id, entity_id, status="Complete")
+        update_plan_entity_status(plan_id, entity_id, status="Complete", delta=True)
     return updated
+
+
+def bulk_apply_basic_info(plan_id, plan_entity_ids, fields, mark_complete=False):
+    """Apply the same basic info fields to many plan entities (numeric plan id); optionally mark them all Complete."""
+    result = repo_bulk_apply_basic_info(int(plan_id), plan_entity_ids, fields, mark_complete=mark_complete)
+    if result and result.get("completed"):
+        facet_cache.invalidate("entity_facets")
+    return result
+
+
+def get_visit_calendar(date_from, date_to, filters=None, assignee=None, limit=1000):
+    """Return site visits overlapping the date window (inclusive), optionally filtered by plan/entity columns and assignee."""
+    return repo_get_visit_calendar(date_from, date_to, filters=filters, assignee=assignee, limit=limit)
+
+
+def find_assignee_conflicts(start_date, end_date, assignees, exclude_plan_entity_id=None):
+    """Return other visits overlapping the dates for any of the assignees (e.g. to warn before saving basic info)."""
+    return repo_find_assignee_conflicts(start_date, end_date, assignees, exclude_plan_entity_id=exclude_plan_entity_id)
+
+
+def search_site_visits(contains, date_from=None, date_to=None, filters=None, limit=50, offset=0):
+    """Return one page of visits whose JSONB list fields contain the given values ({"total", "visits"})."""
+    return repo_search_site_visits(contains, date_from=date_from, date_to=date_to, filters=filters, limit=limit, offset=offset)
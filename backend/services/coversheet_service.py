@@ -7,8 +7,8 @@ import os
 import re
 import uuid
 
-from repositories.svp_plan_repository import get_svp_plan_by_id
 from repositories.coversheet_repository import update_svp_plan_coversheet as repo_update_coversheet
+from utils.cache import facet_cache
 
 logger = logging.getLogger(__name__)
 
@@ -65,14 +65,11 @@ def _list_attachments_in_dir(plan_dir):
     return result
 
 
-def get_plan(plan_id):
-    """Return plan by id (for coversheet page)."""
-    return get_svp_plan_by_id(plan_id)
-
-
 def update_coversheet(plan_id, plan_name=None, plan_description=None, action=None):
     """Update coversheet fields and optional section status. Returns updated plan dict or None."""
-    return repo_update_coversheet(plan_id, plan_name=plan_name, plan_description=plan_description, action=action)
+    result = repo_update_coversheet(plan_id, plan_name=plan_name, plan_description=plan_description, action=action)
+    facet_cache.invalidate("plan_facets")
+    return result
 
 
 def save_attachment(plan, file_storage):
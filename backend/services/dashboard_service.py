@@ -0,0 +1,52 @@
+"""SVP dashboard service: serve the materialized dashboard and refresh it in the background when stale."""
+import logging
+import os
+import threading
+
+from repositories.dashboard_repository import get_dashboard_summary, refresh_dashboard_views
+
+logger = logging.getLogger(__name__)
+
+# Views older than this are refreshed in the background on the next dashboard read (override via SVP_DASHBOARD_MAX_AGE_SECONDS)
+DASHBOARD_MAX_AGE_SECONDS = int(os.environ.get("SVP_DASHBOARD_MAX_AGE_SECONDS", "300"))
+
+_refresh_lock = threading.Lock()
+
+
+def _run_refresh():
+    try:
+        refresh_dashboard_views()
+    finally:
+        _refresh_lock.release()
+
+
+def refresh_dashboard_async():
+    """Start a background refresh unless one is already running in this process. Returns True if one was started."""
+    if not _refresh_lock.acquire(blocking=False):
+        return False
+    try:
+        threading.Thread(target=_run_refresh, name="svp-dashboard-refresh", daemon=True).start()
+    except Exception as e:
+        _refresh_lock.release()
+        logger.exception("refresh_dashboard_async: error %s", e)
+        return False
+    return True
+
+
+def get_dashboard(filters=None, months_ahead=3):
+    """Return the dashboard from the materialized views. When they are older than DASHBOARD_MAX_AGE_SECONDS a background
+    refresh is started and the current (stale) data is returned with freshness.stale / freshness.refreshing set."""
+    result = get_dashboard_summary(filters=filters, months_ahead=months_ahead)
+    if result is None:
+        return None
+    freshness = result["freshness"]
+    age = freshness.get("age_seconds")
+    freshness["max_age_seconds"] = DASHBOARD_MAX_AGE_SECONDS
+    freshness["stale"] = age is None or age > DASHBOARD_MAX_AGE_SECONDS
+    freshness["refreshing"] = refresh_dashboard_async() if freshness["stale"] else _refresh_lock.locked()
+    return result
+
+
+def refresh_dashboard():
+    """Refresh the dashboard views now (blocking). Returns {view: refreshed_at}, {} if another refresh holds the lock, None on error."""
+    return refresh_dashboard_views()
@@ -0,0 +1,15 @@
+"""Entity site visit history service: visit history per entity and entities not visited recently."""
+from repositories.entity_visit_repository import (
+    get_entity_site_visits as repo_get_entity_site_visits,
+    get_entities_not_visited as repo_get_entities_not_visited,
+)
+
+
+def get_entity_site_visits(entity_id):
+    """Return {"entity_id", "entity_number", "entity_name", "visits"} or None if the entity does not exist."""
+    return repo_get_entity_site_visits(entity_id)
+
+
+def get_entities_not_visited(years=None, limit=50, offset=0):
+    """Return one page of entities with no visit in the last `years` years (default from app_config)."""
+    return repo_get_entities_not_visited(years=years, limit=limit, offset=offset)
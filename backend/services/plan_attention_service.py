@@ -0,0 +1,47 @@
+"""Plan attention service: run the needs_attention deadline scan in the background at most once per interval."""
+import logging
+import os
+import threading
+import time
+
+from repositories.plan_attention_repository import scan_plan_attention
+
+logger = logging.getLogger(__name__)
+
+# Scan thresholds and interval (override via SVP_ATTENTION_MIDPOINT_DAYS, SVP_ATTENTION_STALLED_DAYS, SVP_ATTENTION_SCAN_SECONDS)
+ATTENTION_MIDPOINT_DAYS = int(os.environ.get("SVP_ATTENTION_MIDPOINT_DAYS", "30"))
+ATTENTION_STALLED_DAYS = int(os.environ.get("SVP_ATTENTION_STALLED_DAYS", "14"))
+ATTENTION_SCAN_SECONDS = int(os.environ.get("SVP_ATTENTION_SCAN_SECONDS", "900"))
+
+_scan_lock = threading.Lock()
+_last_scan = None
+
+
+def scan_attention():
+    """Run the scan now (blocking). Returns {"plans_updated", "plans_flagged"}, {} if another scan holds the lock, None on error."""
+    return scan_plan_attention(midpoint_days=ATTENTION_MIDPOINT_DAYS, stalled_days=ATTENTION_STALLED_DAYS)
+
+
+def _run_scan():
+    try:
+        scan_attention()
+    finally:
+        _scan_lock.release()
+
+
+def scan_attention_if_due():
+    """Start a background scan when the last one in this process started more than ATTENTION_SCAN_SECONDS ago
+    (or never) and none is running. Returns True if one was started."""
+    global _last_scan
+    if _last_scan is not None and time.monotonic() - _last_scan < ATTENTION_SCAN_SECONDS:
+        return False
+    if not _scan_lock.acquire(blocking=False):
+        return False
+    _last_scan = time.monotonic()
+    try:
+        threading.Thread(target=_run_scan, name="svp-attention-scan", daemon=True).start()
+    except Exception as e:
+        _scan_lock.release()
+        logger.exception("scan_attention_if_due: error %s", e)
+        return False
+    return True
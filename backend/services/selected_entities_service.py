@@ -1,17 +1,17 @@
 """Selected Entities page service: entities CRUD and available entities."""
-from repositories.svp_plan_repository import get_svp_plan_by_id
 from repositories.selected_entities_repository import (
     get_plan_entities as repo_get_plan_entities,
     get_available_entities as repo_get_available_entities,
     add_entity_to_plan as repo_add_entity,
     remove_entity_from_plan as repo_remove_entity,
+    batch_update_plan_entities as repo_batch_update_entities,
     update_entity_status as repo_update_entity_status,
+    bulk_update_entity_status as repo_bulk_update_entity_status,
+    get_plan_entity_facets as repo_get_plan_entity_facets,
+    get_plan_entity_groups as repo_get_plan_entity_groups,
+    get_plan_entity_group_rows as repo_get_plan_entity_group_rows,
 )
-
-
-def get_plan(plan_id):
-    """Return plan by id (for 404 check)."""
-    return get_svp_plan_by_id(plan_id)
+from utils.cache import facet_cache, filter_signature
 
 
 def get_entities(plan_id):
@@ -19,21 +19,59 @@ def get_entities(plan_id):
     return repo_get_plan_entities(plan_id)
 
 
+def get_entity_facets(plan_id, filters=None, facets=None):
+    """Return plan entity facet counts for the filter set; cached per plan and filter signature."""
+    key = ("entity_facets", str(plan_id), filter_signature(filters), tuple(facets or ()))
+    return facet_cache.get_or_compute(key, lambda: repo_get_plan_entity_facets(plan_id, filters=filters, facets=facets))
+
+
+def get_entity_groups(plan_id, group_by, aggregates=None, filters=None):
+    """Return entity group headers (key, count, aggregates) for the grouped grid view."""
+    return repo_get_plan_entity_groups(plan_id, group_by, aggregates=aggregates, filters=filters)
+
+
+def get_entity_group_rows(plan_id, group_by, group_value, filters=None, limit=50, offset=0):
+    """Return one page of entities in a group."""
+    return repo_get_plan_entity_group_rows(plan_id, group_by, group_value, filters=filters, limit=limit, offset=offset)
+
+
 def get_available(plan_id, search_params=None):
     """Get available entities not yet in plan."""
     return repo_get_available_entities(plan_id, search_params=search_params)
 
 
-def add_entity(plan_id, entity_id):
-    """Add an entity to a plan. Returns updated entities list or None."""
-    return repo_add_entity(plan_id, entity_id)
+def add_entity(plan_id, entity_id, delta=False):
+    """Add an entity to a plan. Returns updated entities list (or delta payload when delta=True) or None."""
+    result = repo_add_entity(plan_id, entity_id, delta=delta)
+    facet_cache.invalidate("entity_facets")
+    return result
 
 
 def remove_entity(plan_id, entity_id):
     """Remove an entity from a plan. Returns True if removed."""
-    return repo_remove_entity(plan_id, entity_id)
+    result = repo_remove_entity(plan_id, entity_id)
+    facet_cache.invalidate("entity_facets")
+    return result
+
+
+def batch_update_entities(plan_id, add_entity_ids=None, remove_plan_entity_ids=None):
+    """Add and/or remove many plan entities in one transaction. Returns per-id results or None."""
+    result = repo_batch_update_entities(plan_id, add_entity_ids=add_entity_ids, remove_plan_entity_ids=remove_plan_entity_ids)
+    facet_cache.invalidate("entity_facets")
+    return result
+
+
+def update_entity_status(plan_id, entity_id, status=None, visit_started=None, delta=False):
+    """Update entity status and/or visit_started. Returns updated entities list (or delta payload when delta=True) or None."""
+    result = repo_update_entity_status(plan_id, entity_id, status=status, visit_started=visit_started, delta=delta)
+    facet_cache.invalidate("entity_facets")
+    return result
 
 
-def update_entity_status(plan_id, entity_id, status=None, visit_started=None):
-    """Update entity status and/or visit_started. Returns updated entities list or None."""
-    return repo_update_entity_status(plan_id, entity_id, status=status, visit_started=visit_started)
+def bulk_update_entity_status(plan_id, plan_entity_ids=None, filters=None, status=None, visit_started=None):
+    """Apply status and/or visit_started to many plan entities. Returns only the changed rows, or None."""
+    result = repo_bulk_update_entity_status(
+        plan_id, plan_entity_ids=plan_entity_ids, filters=filters, status=status, visit_started=visit_started
+    )
+    facet_cache.invalidate("entity_facets")
+    return result
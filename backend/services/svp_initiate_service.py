@@ -3,6 +3,7 @@ from repositories.svp_initiate_repository import (
     get_svp_initiate_options as repo_get_initiate_options,
     create_svp_plan as repo_create_svp_plan,
 )
+from utils.cache import facet_cache
 
 
 def get_initiate_options():
@@ -12,4 +13,6 @@ def get_initiate_options():
 
 def create_plan(payload):
     """Create a new SVP plan from initiate form payload. Returns plan dict or None."""
-    return repo_create_svp_plan(payload)
+    result = repo_create_svp_plan(payload)
+    facet_cache.invalidate("plan_facets")
+    return result
@@ -1,14 +1,47 @@
 """SVP List page service: list plans, record access, config, cancel plan."""
-from repositories.svp_list_repository import get_svp_plans, record_plan_access
+from repositories.svp_list_repository import (
+    get_svp_plans,
+    record_plan_access,
+    get_svp_plan_facets,
+    get_svp_plan_groups,
+    get_svp_plan_group_rows,
+)
 from repositories.svp_initiate_repository import get_svp_config
 from repositories.svp_plan_repository import update_svp_plan_status as repo_update_plan_status
+from services.plan_attention_service import scan_attention_if_due
+from utils.cache import facet_cache, filter_signature
 
 
 def get_plans(username=None):
-    """Return SVP plans list, optionally with last_accessed_at for username."""
+    """Return SVP plans list, optionally with last_accessed_at for username.
+    needs_attention comes from the background deadline scan, started here when it is due."""
+    scan_attention_if_due()
     return get_svp_plans(username=username)
 
 
+def get_plans_by_ids(ids, username=None):
+    """Return {"plans", "not_found"} for the requested plan ids/plan codes (multi-get), plans in id order."""
+    plans = get_svp_plans(username=username, ids=ids)
+    found = {p["id"] for p in plans} | {p["plan_code"] for p in plans}
+    return {"plans": plans, "not_found": [i for i in ids if i not in found]}
+
+
+def get_plan_facets(filters=None, facets=None):
+    """Return plan facet counts for the filter set; cached per filter signature."""
+    key = ("plan_facets", filter_signature(filters), tuple(facets or ()))
+    return facet_cache.get_or_compute(key, lambda: get_svp_plan_facets(filters=filters, facets=facets))
+
+
+def get_plan_groups(group_by, aggregates=None, filters=None):
+    """Return plan group headers (key, count, aggregates) for the grouped list view."""
+    return get_svp_plan_groups(group_by, aggregates=aggregates, filters=filters)
+
+
+def get_plan_group_rows(group_by, group_value, filters=None, username=None, limit=50, offset=0):
+    """Return one page of plans in a group."""
+    return get_svp_plan_group_rows(group_by, group_value, filters=filters, username=username, limit=limit, offset=offset)
+
+
 def record_access(username, plan_id):
     """Record that the user accessed the plan. Returns True on success."""
     return record_plan_access(username, plan_id)
@@ -22,4 +55,5 @@ def get_config():
 def cancel_plan(plan_id):
     """Set a plan's status to 'Canceled' (soft cancel). Returns True if updated, False if not found or error."""
     updated = repo_update_plan_status(plan_id, "Canceled")
+    facet_cache.invalidate("plan_facets")
     return updated is not None
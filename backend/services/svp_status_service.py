@@ -1,11 +1,7 @@
-"""SVP Status page service: get plan, update section status, update plan status."""
-from repositories.svp_plan_repository import get_svp_plan_by_id, update_svp_plan_status
+"""SVP Status page service: update section status, update plan status (plans are loaded by utils.plan_loader)."""
+from repositories.svp_plan_repository import update_svp_plan_status
 from repositories.svp_status_repository import update_plan_section_status as repo_update_section_status
-
-
-def get_plan_by_id(plan_id):
-    """Return a single SVP plan by id, or None."""
-    return get_svp_plan_by_id(plan_id)
+from utils.cache import facet_cache
 
 
 def update_section_status(plan_id, section_id, status):
@@ -15,4 +11,6 @@ def update_section_status(plan_id, section_id, status):
 
 def update_plan_status(plan_id, status):
     """Update a plan's status (e.g. to 'Complete'). Returns updated plan dict or None."""
-    return update_svp_plan_status(plan_id, status)
+    result = update_svp_plan_status(plan_id, status)
+    facet_cache.invalidate("plan_facets")
+    return result
@@ -0,0 +1,16 @@
+"""Travel budget service: travel cost rollups for finance (per plan, per team, per plan entity)."""
+from repositories.travel_budget_repository import get_plan_travel_budget as repo_get_plan_travel_budget
+from repositories.travel_budget_repository import get_travel_budget_rollup
+
+
+def get_travel_budget(filters=None):
+    """Return {"totals", "by_team_name", "plans"} for plans matching filters, or None on error."""
+    return get_travel_budget_rollup(filters=filters)
+
+
+def get_plan_travel_budget(plan):
+    """Return one plan's travel budget with per-entity rows: {"plan_id", "plan_code", "totals", "entities"}, or None on error."""
+    result = repo_get_plan_travel_budget(plan["id"])
+    if result is None:
+        return None
+    return dict(result, plan_id=str(plan["id"]), plan_code=plan.get("plan_code") or "")
@@ -0,0 +1,80 @@
+"""
+Small in-process TTL cache for read-heavy, cheap-to-recompute API results (e.g. facet counts).
+"""
+import os
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+# Default time-to-live for cached entries, in seconds (override via SVP_CACHE_TTL_SECONDS)
+DEFAULT_TTL_SECONDS = int(os.environ.get("SVP_CACHE_TTL_SECONDS", "30"))
+
+
+class TTLCache:
+    """Thread-safe dict-backed cache whose entries expire after ttl_seconds.
+
+    Keys are tuples whose first element is a scope (e.g. "plan_facets") so related
+    entries can be dropped together with invalidate().
+    """
+
+    def __init__(self, ttl_seconds: int = DEFAULT_TTL_SECONDS, max_entries: int = 512):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return cached value for key, or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._entries.pop(key, None)
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key. When full, expired entries are purged first, then the oldest entry."""
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                now = time.monotonic()
+                for k in [k for k, (exp, _) in self._entries.items() if exp < now]:
+                    self._entries.pop(k, None)
+                if len(self._entries) >= self.max_entries:
+                    self._entries.pop(next(iter(self._entries)), None)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return cached value for key, computing and caching it on a miss. None results are not cached."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        value = compute()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def invalidate(self, *prefix: Hashable) -> None:
+        """Drop every entry whose key starts with prefix (all entries when prefix is empty)."""
+        with self._lock:
+            if not prefix:
+                self._entries.clear()
+                return
+            n = len(prefix)
+            for k in [k for k in self._entries if isinstance(k, tuple) and k[:n] == prefix]:
+                self._entries.pop(k, None)
+
+
+def filter_signature(filters) -> tuple:
+    """Return a hashable, order-independent signature of a filter dict (values may be scalars or lists)."""
+    items = []
+    for key, raw in (filters or {}).items():
+        values = raw if isinstance(raw, (list, tuple, set)) else [raw]
+        items.append((str(key), tuple(sorted(str(v) for v in values if v is not None))))
+    return tuple(sorted(items))
+
+
+# Shared cache for facet counts (keys: ("plan_facets", ...) and ("entity_facets", plan_id, ...))
+facet_cache = TTLCache()
@@ -0,0 +1,34 @@
+"""
+Route-level plan loader: resolve the <plan_id> URL segment (numeric id or plan_code) once per request.
+Views decorated with @with_plan receive plan= instead of plan_id= and pass plan["id"] (always numeric) downstream,
+so services and repositories never look the plan up again.
+"""
+from functools import wraps
+
+from flask import g, jsonify
+
+from repositories.svp_plan_repository import get_svp_plan_by_id, get_svp_plan_handle
+
+
+def load_plan(plan_id, full=False):
+    """Return the plan for plan_id, memoized on flask.g for the current request.
+    full=False returns a handle {"id", "plan_code", "version", "plan_for", "plan_period", "site_visits"}; full=True the API
+    plan dict with sections. None if not found."""
+    cache = g.setdefault("_svp_plans", {})
+    key = (str(plan_id).strip(), full)
+    if key not in cache:
+        cache[key] = get_svp_plan_by_id(plan_id) if full else get_svp_plan_handle(plan_id)
+    return cache[key]
+
+
+def with_plan(full=False):
+    """Decorator for views with a <plan_id> URL segment: load the plan once and call the view with plan=, or return 404."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, plan_id, **kwargs):
+            plan = load_plan(plan_id, full=full)
+            if plan is None:
+                return jsonify({"error": "Plan not found"}), 404
+            return view(*args, plan=plan, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,37 @@
+"""
+Helpers for reading grid query parameters from Flask request args.
+"""
+from typing import Dict, Iterable, List, Optional
+
+
+def csv_arg(args, name: str) -> List[str]:
+    """Return a list from a comma-separated and/or repeated query param (e.g. ?facets=a,b&facets=c)."""
+    out = []
+    for raw in args.getlist(name):
+        out.extend(part.strip() for part in str(raw).split(",") if part.strip())
+    return out
+
+
+def filters_from_args(args, keys: Iterable[str], exclude: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+    """Collect whitelisted filter params; repeated params become multi-value filters (?status=A&status=B)."""
+    skip = set(exclude or ())
+    filters = {}
+    for key in keys:
+        if key in skip:
+            continue
+        values = [v for v in args.getlist(key) if v is not None and str(v).strip()]
+        if values:
+            filters[key] = values
+    return filters
+
+
+def int_arg(args, name: str, default: int, minimum: int = 0, maximum: Optional[int] = None) -> int:
+    """Return an integer query param clamped to [minimum, maximum]; default when missing or not a number."""
+    try:
+        value = int(args.get(name, default))
+    except (TypeError, ValueError):
+        value = default
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
@@ -102,6 +102,10 @@ export interface DataGridProps {
   selectionCountLabel?: string | null;
   filterRowAction?: ((item: ActionCategoryItem, row: DataGridRow) => boolean | undefined) | null;
   getActionDisabled?: ((action: DataGridAction, row: DataGridRow) => boolean) | null;
+  /** Optional live counts per select filter option: { columnKey: { optionValue: count } }. */
+  facetCounts?: Record<string, Record<string, number>> | null;
+  /** Called with all column filter values ({ columnKey: value }) whenever one changes, e.g. to refetch facet counts. */
+  onFiltersChange?: ((filters: Record<string, string>) => void) | null;
 }
 
 export default function DataGrid({
@@ -125,6 +129,8 @@ export default function DataGrid({
   selectionCountLabel = null,
   filterRowAction = null,
   getActionDisabled = null,
+  facetCounts = null,
+  onFiltersChange = null,
 }: DataGridProps) {
   const [page, setPage] = useState(1);
   const [pageSize, setPageSize] = useState(defaultPageSize);
@@ -213,7 +219,9 @@ export default function DataGrid({
   };
 
   const handleFilterChange = (key: string, value: string) => {
-    setFilters((prev) => ({ ...prev, [key]: value }));
+    const next = { ...filters, [key]: value };
+    setFilters(next);
+    onFiltersChange?.(next);
   };
 
   const handlePageSizeChange = (e: React.ChangeEvent<HTMLSelectElement>) => {
@@ -572,7 +580,10 @@ export default function DataGrid({
                             onChange={(e) => handleFilterChange(col.key, e.target.value)}
                             aria-label={`Filter ${col.label}`}
                           >
-                            {col.filterOptions.map((opt) => <option key={opt} value={opt}>{opt}</option>)}
+                            {col.filterOptions.map((opt) => {
+                              const count = facetCounts?.[col.key]?.[opt];
+                              return <option key={opt} value={opt}>{count != null ? `${opt} (${count})` : opt}</option>;
+                            })}
                           </select>
                         ) : (
                           <input
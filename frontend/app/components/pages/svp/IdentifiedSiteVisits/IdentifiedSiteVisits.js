@@ -6,9 +6,11 @@ import { useRouter } from 'next/navigation';
 import DataGrid from '../../../core/DataGrid';
 import {
   getPlanEntities,
+  getBasicInfoSummary,
   removeEntityFromPlan,
   startEntityVisit,
   updateEntityStatus,
+  bulkUpdateEntityStatus,
 } from '../../../../services/svpService';
 import overviewStyles from '../SiteVisitPlanStatusOverview/SiteVisitPlanStatusOverview.module.css';
 import styles from './IdentifiedSiteVisits.module.css';
@@ -19,6 +21,7 @@ const IDENTIFIED_COLUMNS = [
   { key: 'state', label: 'State', sortable: true, filterable: true, filterType: 'select', filterOptions: ['All', 'TX', 'IL', 'CA', 'NY', 'FL'], minWidth: 55 },
   { key: 'site_visit_reason_types', label: 'Site Visit Reason Type(s)', sortable: true, filterable: true, minWidth: 180 },
   { key: 'site_visit_dates', label: 'Site Visit Dates', sortable: true, filterable: true, minWidth: 120 },
+  { key: 'assignee', label: 'Assignee', sortable: true, filterable: true, minWidth: 120 },
   { key: 'priority', label: 'Priority', sortable: true, filterable: true, filterType: 'select', filterOptions: ['All', 'High', 'Medium', 'Low'], minWidth: 90 },
   { key: 'travel_cost', label: 'Travel Cost', sortable: true, filterable: true, minWidth: 100 },
   { key: 'travel_flags', label: 'Travel Flag(s)', sortable: true, filterable: true, filterType: 'select', filterOptions: ['All', '0', '1'], minWidth: 100 },
@@ -39,11 +42,30 @@ const ROW_ACTIONS = [
   { id: 'plan_record_action_history', label: 'Plan Record Action History', category: 'View', iconRight: 'bi-box-arrow-up-right' },
 ];
 
-function mapEntityToRow(entity) {
-  const visitStarted = Boolean(entity.visit_started);
-  const status = entity.status || '';
+/** YYYY-MM-DD -> MM/DD/YYYY (same format as recent_site_visit_dates). */
+function formatDate(value) {
+  const [y, m, d] = String(value || '').split('-');
+  return y && m && d ? `${m}/${d}/${y}` : '';
+}
+
+/** Planned visit dates from basic info, e.g. "02/10/2026 - 02/12/2026"; '' when no start date. */
+function formatVisitDates(summary) {
+  const start = formatDate(summary?.start_date);
+  if (!start) return '';
+  const end = formatDate(summary?.end_date);
+  return end && end !== start ? `${start} - ${end}` : start;
+}
+
+function formatCost(value) {
+  return value == null ? 'N/A' : `$${Number(value).toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}`;
+}
+
+/** Build a grid row from a plan entity and its basic info summary row (getBasicInfoSummary), if any. */
+function mapEntityToRow(entity, summary) {
+  const visitStarted = Boolean(summary?.visit_started ?? entity.visit_started);
+  const complete = summary ? summary.complete : (entity.status || '') === 'Complete';
   const visitStatus =
-    status === 'Complete' ? 'Complete' : visitStarted ? 'In Progress' : 'Not Started';
+    complete ? 'Complete' : visitStarted ? 'In Progress' : 'Not Started';
   const reasonType = entity.active_new_grant === 'Yes' ? 'New Start/Initial/Newly Funded' : (entity.site_visit_reason_types || '—');
   return {
     id: entity.id,
@@ -52,10 +74,11 @@ function mapEntityToRow(entity) {
     entity_number: entity.entity_number || '',
     state: entity.state || '',
     site_visit_reason_types: reasonType,
-    site_visit_dates: entity.recent_site_visit_dates || 'N/A',
-    priority: entity.priority ?? 'Medium',
-    travel_cost: entity.travel_cost ?? 'N/A',
-    travel_flags: entity.travel_flags ?? '0',
+    site_visit_dates: formatVisitDates(summary) || entity.recent_site_visit_dates || 'N/A',
+    assignee: summary?.default_assignee || '—',
+    priority: summary?.prioritization || '—',
+    travel_cost: formatCost(summary?.travel_cost),
+    travel_flags: summary ? String(summary.travel_plan_count > 0 ? 1 : 0) : (entity.travel_flags ?? '0'),
     visit_status: visitStatus,
     visit_started: visitStarted,
   };
@@ -64,6 +87,7 @@ function mapEntityToRow(entity) {
 export default function IdentifiedSiteVisits({ plan, onSaveSuccess, viewMode = false }) {
   const router = useRouter();
   const [entities, setEntities] = useState([]);
+  const [summaryById, setSummaryById] = useState({});
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [detailsOpen, setDetailsOpen] = useState(true);
@@ -78,10 +102,15 @@ export default function IdentifiedSiteVisits({ plan, onSaveSuccess, viewMode = f
     if (!planId) return;
     setLoading(true);
     setError(null);
-    getPlanEntities(planId)
-      .then((data) => setEntities(data || []))
+    // Basic info for every entity in one request; the grid still loads if the summary fails
+    Promise.all([getPlanEntities(planId), getBasicInfoSummary(planId).catch(() => [])])
+      .then(([data, summary]) => {
+        setEntities(data || []);
+        setSummaryById(Object.fromEntries((summary || []).map((s) => [String(s.id), s])));
+      })
       .catch((err) => {
         setEntities([]);
+        setSummaryById({});
         setError(err.message || 'Failed to load entities.');
       })
       .finally(() => setLoading(false));
@@ -91,7 +120,10 @@ export default function IdentifiedSiteVisits({ plan, onSaveSuccess, viewMode = f
     loadEntities();
   }, [loadEntities]);
 
-  const rows = useMemo(() => entities.map(mapEntityToRow), [entities]);
+  const rows = useMemo(
+    () => entities.map((entity) => mapEntityToRow(entity, summaryById[String(entity.id)])),
+    [entities, summaryById]
+  );
 
   const planTitle = plan
     ? (plan.plan_code ? `${plan.plan_code}: ${plan.plan_name || ''}` : `Plan ${plan.id}: ${plan.plan_name || ''}`)
@@ -186,9 +218,7 @@ export default function IdentifiedSiteVisits({ plan, onSaveSuccess, viewMode = f
       setError(null);
       setActionInProgress(true);
       try {
-        for (const entityId of ids) {
-          await updateEntityStatus(planId, entityId, 'Complete');
-        }
+        await bulkUpdateEntityStatus(planId, { status: 'Complete' }, { ids });
         loadEntities();
         if (onSaveSuccess) onSaveSuccess();
         setSelectedRows(new Set());
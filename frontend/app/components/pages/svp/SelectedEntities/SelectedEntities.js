@@ -8,8 +8,8 @@ import AddGrantsModal from '../AddGrantsModal';
 import {
   getPlanEntities,
   getAvailableEntities,
-  addEntityToPlan,
   removeEntityFromPlan,
+  batchUpdatePlanEntities,
   updatePlanSectionStatus,
 } from '../../../../services/svpService';
 import overviewStyles from '../SiteVisitPlanStatusOverview/SiteVisitPlanStatusOverview.module.css';
@@ -146,9 +146,7 @@ export default function SelectedEntities({ plan, onSaveSuccess, viewMode = false
     try {
       setSaveStatus('saving');
       setError(null);
-      for (const entityId of selectedEntityIds) {
-        await addEntityToPlan(plan.id, entityId);
-      }
+      await batchUpdatePlanEntities(plan.id, { add: Array.from(selectedEntityIds) });
       await loadEntities();
       await onSaveSuccess?.();
       setAddGrantsModalOpen(false);
@@ -185,9 +183,7 @@ export default function SelectedEntities({ plan, onSaveSuccess, viewMode = false
           setSaveStatus(null);
           return;
         }
-        for (const entityId of ids) {
-          await removeEntityFromPlan(plan.id, entityId);
-        }
+        await batchUpdatePlanEntities(plan.id, { remove: ids });
         setSelectedRows(new Set());
         await loadEntities();
         await onSaveSuccess?.();
@@ -162,7 +162,9 @@ export default function SiteVisitPlanBasicInfo({ planId, entityId, plan, basicIn
     payload.prioritization = get('prioritization') || null;
     payload.additional_programs = additionalPrograms;
     payload.tracking_number = basicInfo?.tracking_number ?? null;
+    // id lets the backend skip unchanged rows and update edited ones in place ('new-…' ids are inserted)
     payload.travel_plans = travelPlans.map((row) => ({
+      id: row.id,
       number_of_travelers: row.number_of_travelers ?? '',
       travel_locations: row.travel_locations ?? '',
       travel_dates: row.travel_dates ?? '',
@@ -173,6 +175,20 @@ export default function SiteVisitPlanBasicInfo({ planId, entityId, plan, basicIn
     return payload;
   }, [justification, basicInfo?.default_assignee, basicInfo?.tracking_number, additionalPrograms, participants, travelPlans]);
 
+  // Give rows added since the last save the ids the backend assigned (new rows come back last, in order), so the next
+  // save updates them instead of inserting them again
+  const adoptSavedTravelPlanIds = (sentRows, savedRows) => {
+    if (!Array.isArray(sentRows) || !Array.isArray(savedRows)) return;
+    const isSavedId = (id) => /^\d+$/.test(String(id ?? ''));
+    const tempIds = sentRows.map((r) => r.id).filter((id) => !isSavedId(id));
+    if (tempIds.length === 0) return;
+    const sentSavedIds = new Set(sentRows.map((r) => String(r.id)).filter(isSavedId));
+    const createdIds = savedRows.map((r) => r.id).filter((id) => !sentSavedIds.has(String(id)));
+    if (createdIds.length !== tempIds.length) return;
+    const idMap = new Map(tempIds.map((id, i) => [id, createdIds[i]]));
+    setTravelPlans((prev) => prev.map((r) => (idMap.has(r.id) ? { ...r, id: idMap.get(r.id) } : r)));
+  };
+
   const handleSaveAction = (action) => {
     setSaveErrorMessage(null);
     setFailedValidationFields(new Set());
@@ -203,6 +219,7 @@ export default function SiteVisitPlanBasicInfo({ planId, entityId, plan, basicIn
         setFailedValidationFields(new Set());
         onSaveSuccess?.();
         if (updated?.justification !== undefined) setJustification(updated.justification ?? '');
+        adoptSavedTravelPlanIds(payload.travel_plans, updated?.travel_plans);
         setTimeout(() => setSaveStatus(null), 3000);
         if (action === 'save_and_continue' && planIdStr) {
           router.push(`/svp/status/${encodeURIComponent(planIdStr)}/identified-site-visits`);
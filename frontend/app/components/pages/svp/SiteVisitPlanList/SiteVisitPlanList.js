@@ -6,7 +6,7 @@ import AppLayout from '../../../core/Layout';
 import DataGrid from '../../../core/DataGrid';
 import SearchModal from '../../../core/SearchModal';
 import ConfirmModal from '../../../core/ConfirmModal';
-import { getMenu, getHeaderNav, getPlans, getConfig, cancelPlan } from '../../../../services';
+import { getMenu, getHeaderNav, getPlans, getConfig, cancelPlan, getPlanFacets, toFacetCountMap } from '../../../../services';
 import styles from './SiteVisitPlanList.module.css';
 
 const SAVED_SEARCHES_STORAGE_KEY = 'svp_saved_searches';
@@ -23,6 +23,9 @@ const DEFAULT_LIST_COLUMNS = [
   { key: 'needs_attention', label: 'Needs Attention', filterable: true },
 ];
 
+/** needs_attention holds the deadline scan summary (e.g. "Midpoint in 30d: 2; Overdue visits: 1"); wide enough to read it. */
+const NEEDS_ATTENTION_MIN_WIDTH = 220;
+
 /** Default row actions when backend config is empty. */
 const DEFAULT_ROW_ACTIONS = [
   { id: 'edit', label: 'Edit Plan', iconLeft: 'bi-pencil-square', category: 'Action' },
@@ -40,6 +43,41 @@ const DEFAULT_SEARCH_FIELDS = [
   { key: 'divisions', label: 'Plan For: Division', type: 'checkbox-group', options: ['All', 'DCHAP', 'DMHAP', 'DPD', 'DPSHB', 'DRHE'], filterable: true },
 ];
 
+/** Grid column filter -> /plans/facets param; text column filters match by substring like the grid does. */
+const COLUMN_FACET_PARAMS = {
+  plan_code: 'plan_code',
+  plan_for: 'plan_for_like',
+  plan_period: 'plan_period_like',
+  plan_name: 'plan_name',
+  site_visits: 'site_visits_like',
+  team_name: 'team_name_like',
+  needs_attention: 'needs_attention_like',
+};
+
+/** Without 'All' a checkbox group filters; with it (or empty) it does not, as in filteredPlans. */
+const activeGroup = (values) => (Array.isArray(values) && values.length > 0 && !values.includes('All') ? values : []);
+
+/**
+ * Facet filters for the status counts: the applied search, the needs-attention toggle and the grid column filters,
+ * mirroring filteredPlans and DataGrid. Status filters are left out so every status option keeps its count.
+ */
+function buildPlanFacetFilters(sf, needsAttention, columnFilters) {
+  const filters = {};
+  const add = (key, value) => {
+    const values = (Array.isArray(value) ? value : [value]).map((v) => (v ?? '').toString().trim()).filter(Boolean);
+    if (values.length > 0) filters[key] = [...(filters[key] ?? []), ...values];
+  };
+  add('plan_name', sf.planNameLike);
+  add('plan_period_like', sf.planPeriod);
+  add('plan_for_program', activeGroup(sf.programs));
+  add('plan_for_division', activeGroup(sf.divisions));
+  if (needsAttention) add('needs_attention', 'Yes');
+  Object.entries(columnFilters).forEach(([key, value]) => {
+    if (COLUMN_FACET_PARAMS[key]) add(COLUMN_FACET_PARAMS[key], value);
+  });
+  return filters;
+}
+
 function loadSavedSearches() {
   if (typeof window === 'undefined') return [];
   try {
@@ -86,6 +124,9 @@ export default function SiteVisitPlanList() {
   const [savedSearchDropdownOpen, setSavedSearchDropdownOpen] = useState(false);
   const savedSearchDropdownRef = useRef(null);
   const [cancelPlanId, setCancelPlanId] = useState(null);
+  const [facetCounts, setFacetCounts] = useState(null);
+  const [columnFilters, setColumnFilters] = useState({});
+  const [facetsVersion, setFacetsVersion] = useState(0);
 
   const fetchListData = useCallback(() => {
     setLoading(true);
@@ -112,6 +153,7 @@ export default function SiteVisitPlanList() {
       .finally(() => {
         setLoading(false);
       });
+    setFacetsVersion((v) => v + 1);
   }, []);
 
   // Refetch when user lands on list (pathname) so Coversheet/Status changes are reflected
@@ -158,6 +200,24 @@ export default function SiteVisitPlanList() {
     setFilterByNeedsAttention(needsAttention === 'true');
   }, [searchParams, defaultSearchValues]);
 
+  // Live status counts for the current filter set; the grid still works without them. Debounced for column filter typing.
+  const facetFiltersKey = useMemo(
+    () => JSON.stringify(buildPlanFacetFilters(appliedSearchFilters, filterByNeedsAttention, columnFilters)),
+    [appliedSearchFilters, filterByNeedsAttention, columnFilters]
+  );
+  useEffect(() => {
+    let cancelled = false;
+    const timer = setTimeout(() => {
+      getPlanFacets(JSON.parse(facetFiltersKey), ['status'])
+        .then((result) => { if (!cancelled) setFacetCounts(toFacetCountMap(result)); })
+        .catch(() => { if (!cancelled) setFacetCounts(null); });
+    }, 250);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [facetFiltersKey, facetsVersion]);
+
   const isSearchActive = useMemo(() => {
     const sf = appliedSearchFilters;
     return (
@@ -173,7 +233,9 @@ export default function SiteVisitPlanList() {
   // Use default columns/actions when config is empty (e.g. svp_column not seeded). Ensure Plan Code is first.
   const gridColumns = useMemo(() => {
     const cols = gridConfig.columns ?? [];
-    const useCols = cols.length > 0 ? cols : DEFAULT_LIST_COLUMNS;
+    const useCols = (cols.length > 0 ? cols : DEFAULT_LIST_COLUMNS).map((c) => (
+      c.key === 'needs_attention' && c.minWidth == null ? { ...c, minWidth: NEEDS_ATTENTION_MIN_WIDTH } : c
+    ));
     if (useCols[0]?.key === 'plan_code') return useCols;
     const planCodeCol = { key: 'plan_code', label: 'Plan Code', filterable: true };
     return [planCodeCol, ...useCols];
@@ -206,8 +268,8 @@ export default function SiteVisitPlanList() {
       const planStatus = plan.status || '';
 
       if (filterByNeedsAttention) {
-        const needsAtt = (plan.needs_attention || '').toString().trim().toLowerCase();
-        if (needsAtt !== 'yes') return false;
+        // Any non-empty summary from the deadline scan means the plan needs attention
+        if (!(plan.needs_attention || '').toString().trim()) return false;
       }
 
       if ((sf.planNameLike?.trim() ?? '') && !planName.includes((sf.planNameLike ?? '').trim().toLowerCase())) return false;
@@ -449,6 +511,8 @@ export default function SiteVisitPlanList() {
         centerAlignColumns={gridCenterAlignColumns}
         filterBanner={isSearchActive ? 'Search filters applied - showing filtered results' : null}
         onClearFilters={handleResetSearch}
+        facetCounts={facetCounts}
+        onFiltersChange={setColumnFilters}
       />
 
       <ConfirmModal
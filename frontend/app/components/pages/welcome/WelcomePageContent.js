@@ -107,7 +107,7 @@ export default function WelcomePageContent({ plans = [], welcomeMessage = null,
       else if (s === 'canceled') canceled += 1;
       else if (s === 'not started') {}
       else inProgress += 1; // In Progress, Not Complete
-      if (p.needs_attention && String(p.needs_attention).trim().toLowerCase() === 'yes') needsAttention += 1;
+      if (String(p.needs_attention || '').trim()) needsAttention += 1; // deadline scan summary; '' when nothing is due
     });
     return { total, completed, inProgress, canceled, needsAttention };
   }, [plans]);
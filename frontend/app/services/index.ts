@@ -3,6 +3,6 @@ export { getStoredUser, getStoredUsername, clearSession, logout } from './authSe
 export { getMenu } from './menuService';
 export type { MenuItem, MenuChild } from './menuService';
 export { getHeaderNav } from './layoutService';
-export { getPlans, getPlanById, createPlan, cancelPlan, completePlan, getConfig, getInitiateOptions, recordPlanAccess } from './svpService';
-export type { UpdateCoversheetPayload, AvailableEntitiesSearchParams } from './svpService';
+export { getPlans, getPlansByIds, getPlanById, createPlan, cancelPlan, completePlan, getConfig, getInitiateOptions, recordPlanAccess, getPlanFacets, getPlanEntityFacets, toFacetCountMap, getPlanGroups, getPlanGroupRows, getPlanEntityGroups, getPlanEntityGroupRows, getDashboard, getVisitCalendar, getAssigneeConflicts, searchSiteVisits, getEntitySiteVisits, getEntitiesNotVisited, getTravelBudget, getPlanTravelBudget, getBasicInfoSummary } from './svpService';
+export type { UpdateCoversheetPayload, AvailableEntitiesSearchParams, FacetCounts, FacetValueCount, GridFilters, GridGroup, GridGroupsResult, BatchEntitiesResult, BulkEntityStatusResult, EntityDeltaResult, PlanProgress, BasicInfoSummaryRow, BulkBasicInfoResult, DashboardBucket, DashboardResult, CalendarVisit, SiteVisitSearchResult, EntitySiteVisit, EntitySiteVisitHistory, EntitiesNotVisitedResult, TravelBudgetMeasures, TravelBudgetResult, PlanTravelBudget } from './svpService';
 export { getWelcomeMessage } from './welcomeService';
@@ -12,6 +12,135 @@ export async function getPlans(username: string | null = null): Promise<unknown[
   return data.plans ?? [];
 }
 
+/** Fetch several plans (ids or plan codes) with section statuses in one request (?ids=). */
+export async function getPlansByIds(
+  ids: string[],
+  username: string | null = null
+): Promise<{ plans: unknown[]; not_found: string[] }> {
+  let url = '/api/svp/plans?ids=' + ids.map(encodeURIComponent).join(',');
+  if (username) url += '&username=' + encodeURIComponent(username);
+  return (await apiGet(url)) as { plans: unknown[]; not_found: string[] };
+}
+
+export interface FacetValueCount {
+  value: string;
+  count: number;
+}
+
+export interface FacetCounts {
+  total: number;
+  facets: Record<string, FacetValueCount[]>;
+}
+
+/** Grid filters keyed by column; array values are sent as repeated query params. */
+export type GridFilters = Record<string, string | string[] | null | undefined>;
+
+function gridQueryString(filters: GridFilters = {}, extra: Record<string, string | string[] | undefined> = {}): string {
+  const params = new URLSearchParams();
+  const append = (key: string, value: string | string[] | null | undefined) => {
+    const values = Array.isArray(value) ? value : value != null ? [value] : [];
+    values.filter((v) => v !== '' && v !== 'All').forEach((v) => params.append(key, v));
+  };
+  Object.entries(filters).forEach(([key, value]) => append(key, value));
+  Object.entries(extra).forEach(([key, value]) => append(key, value));
+  const queryString = params.toString();
+  return queryString ? '?' + queryString : '';
+}
+
+/** Plan counts per facet value (status, team_name, plan_period, plan_for) for the given filters. */
+export async function getPlanFacets(filters: GridFilters = {}, facets: string[] = []): Promise<FacetCounts> {
+  return (await apiGet(
+    '/api/svp/plans/facets' + gridQueryString(filters, { facets: facets.length ? facets.join(',') : undefined })
+  )) as FacetCounts;
+}
+
+/** Plan entity counts per facet value (state, status, eligibility flags, visit_started) for the given filters. */
+export async function getPlanEntityFacets(planId: string, filters: GridFilters = {}, facets: string[] = []): Promise<FacetCounts> {
+  return (await apiGet(
+    '/api/svp/plans/' +
+      encodeURIComponent(planId) +
+      '/entities/facets' +
+      gridQueryString(filters, { facets: facets.length ? facets.join(',') : undefined })
+  )) as FacetCounts;
+}
+
+export interface GridGroup {
+  key: string;
+  count: number;
+  aggregates: Record<string, number | string | null>;
+}
+
+export interface GridGroupsResult {
+  group_by: string;
+  total: number;
+  groups: GridGroup[];
+}
+
+/** Plans grouped by a column (status, team_name, plan_period, plan_for) with counts and optional aggregates. */
+export async function getPlanGroups(groupBy: string, aggregates: string[] = [], filters: GridFilters = {}): Promise<GridGroupsResult> {
+  return (await apiGet(
+    '/api/svp/plans' +
+      gridQueryString(filters, { group_by: groupBy, aggregate: aggregates.length ? aggregates.join(',') : undefined })
+  )) as GridGroupsResult;
+}
+
+/** One page of plans in a group (lazy loading of an expanded group). */
+export async function getPlanGroupRows(
+  groupBy: string,
+  groupValue: string,
+  filters: GridFilters = {},
+  limit = 50,
+  offset = 0
+): Promise<{ total: number; plans: unknown[] }> {
+  const query = gridQueryString(filters, { group_by: groupBy, limit: String(limit), offset: String(offset) });
+  return (await apiGet(
+    '/api/svp/plans' + query + '&group_value=' + encodeURIComponent(groupValue)
+  )) as { total: number; plans: unknown[] };
+}
+
+/** Plan entities grouped by a column (state, status, flags, visit_started, assignee) with counts and optional aggregates. */
+export async function getPlanEntityGroups(
+  planId: string,
+  groupBy: string,
+  aggregates: string[] = [],
+  filters: GridFilters = {}
+): Promise<GridGroupsResult> {
+  return (await apiGet(
+    '/api/svp/plans/' +
+      encodeURIComponent(planId) +
+      '/entities' +
+      gridQueryString(filters, { group_by: groupBy, aggregate: aggregates.length ? aggregates.join(',') : undefined })
+  )) as GridGroupsResult;
+}
+
+/** One page of plan entities in a group (lazy loading of an expanded group). */
+export async function getPlanEntityGroupRows(
+  planId: string,
+  groupBy: string,
+  groupValue: string,
+  filters: GridFilters = {},
+  limit = 50,
+  offset = 0
+): Promise<{ total: number; entities: unknown[] }> {
+  const query = gridQueryString(filters, { group_by: groupBy, limit: String(limit), offset: String(offset) });
+  return (await apiGet(
+    '/api/svp/plans/' + encodeURIComponent(planId) + '/entities' + query + '&group_value=' + encodeURIComponent(groupValue)
+  )) as { total: number; entities: unknown[] };
+}
+
+/** Convert a facets response to the DataGrid facetCounts shape ({ column: { value: count } }). */
+export function toFacetCountMap(result: FacetCounts | null | undefined): Record<string, Record<string, number>> {
+  const out: Record<string, Record<string, number>> = {};
+  if (!result?.facets) return out;
+  Object.entries(result.facets).forEach(([key, values]) => {
+    out[key] = { All: result.total };
+    values.forEach((v) => {
+      out[key][v.value] = v.count;
+    });
+  });
+  return out;
+}
+
 /**
  * Record that the current user accessed a plan (for backend recent-plans ordering).
  */
@@ -126,6 +255,48 @@ export async function addEntityToPlan(planId: string, entityId: string): Promise
   return apiPost('/api/svp/plans/' + encodeURIComponent(planId) + '/entities', { entityId });
 }
 
+/** Per-plan entity counters (plan.progress on plan/list payloads, counts on delta responses). */
+export interface PlanProgress {
+  total: number;
+  complete: number;
+  visit_started: number;
+  with_basic_info: number;
+  by_status: Record<string, number>;
+}
+
+export interface EntityDeltaResult {
+  entity: Record<string, unknown> | null;
+  plan: { id: string; version: number; site_visits: string } | null;
+  counts: PlanProgress | null;
+  added?: boolean;
+  section_status?: string | null;
+}
+
+/** Add an entity and get back only the new row, plan version and counts (?response=delta). */
+export async function addEntityToPlanDelta(planId: string, entityId: string): Promise<EntityDeltaResult> {
+  return (await apiPost(
+    '/api/svp/plans/' + encodeURIComponent(planId) + '/entities?response=delta',
+    { entityId }
+  )) as EntityDeltaResult;
+}
+
+export interface BatchEntitiesResult {
+  add: { entity_id: string; result: 'added' | 'already_in_plan' | 'not_found' | 'invalid'; plan_entity_id?: string }[];
+  remove: { id: string; result: 'removed' | 'not_found' | 'invalid' }[];
+  site_visits: string;
+}
+
+/** Add entities (by entity id) and/or remove plan entities (by plan entity id) in one request/transaction. */
+export async function batchUpdatePlanEntities(
+  planId: string,
+  changes: { add?: string[]; remove?: string[] }
+): Promise<BatchEntitiesResult> {
+  return (await apiPost('/api/svp/plans/' + encodeURIComponent(planId) + '/entities/batch', {
+    add: changes.add ?? [],
+    remove: changes.remove ?? [],
+  })) as BatchEntitiesResult;
+}
+
 export async function removeEntityFromPlan(planId: string, entityId: string): Promise<unknown> {
   return apiDelete('/api/svp/plans/' + encodeURIComponent(planId) + '/entities/' + encodeURIComponent(entityId));
 }
@@ -134,6 +305,39 @@ export async function updateEntityStatus(planId: string, entityId: string, statu
   return apiPatch('/api/svp/plans/' + encodeURIComponent(planId) + '/entities/' + encodeURIComponent(entityId), { status });
 }
 
+/** Update one entity's status/visit_started and get back only the changed row, plan version and counts. */
+export async function updateEntityStatusDelta(
+  planId: string,
+  entityId: string,
+  changes: { status?: string; visit_started?: boolean }
+): Promise<EntityDeltaResult> {
+  return (await apiPatch(
+    '/api/svp/plans/' + encodeURIComponent(planId) + '/entities/' + encodeURIComponent(entityId) + '?response=delta',
+    changes
+  )) as EntityDeltaResult;
+}
+
+export interface BulkEntityStatusResult {
+  updated: number;
+  entities: unknown[];
+  section_status: string | null;
+}
+
+/**
+ * Set status and/or visit_started on many plan entities in one request.
+ * Target either explicit plan entity ids or a grid filter ({} = every entity in the plan). Returns only the changed rows.
+ */
+export async function bulkUpdateEntityStatus(
+  planId: string,
+  changes: { status?: string; visit_started?: boolean },
+  target: { ids?: string[]; filter?: GridFilters }
+): Promise<BulkEntityStatusResult> {
+  return (await apiPatch('/api/svp/plans/' + encodeURIComponent(planId) + '/entities', {
+    ...changes,
+    ...target,
+  })) as BulkEntityStatusResult;
+}
+
 /** Start an identified site visit for an entity (sets visit_started). */
 export async function startEntityVisit(planId: string, entityId: string): Promise<unknown> {
   const data = (await apiPatch(
@@ -158,6 +362,52 @@ export async function getBasicInfo(planId: string, entityId: string): Promise<un
   );
 }
 
+export interface BasicInfoSummaryRow {
+  id: string;
+  entity_number: string;
+  entity_name: string;
+  status: string;
+  complete: boolean;
+  visit_started: boolean;
+  has_basic_info: boolean;
+  start_date: string | null;
+  end_date: string | null;
+  default_assignee: string | null;
+  prioritization: string | null;
+  tracking_number: string | null;
+  travel_plan_count: number;
+  travel_cost: number | null;
+}
+
+/** Basic Information: compact summary row for every entity in the plan (one request). */
+export async function getBasicInfoSummary(planId: string): Promise<BasicInfoSummaryRow[]> {
+  const data = (await apiGet('/api/svp/plans/' + encodeURIComponent(planId) + '/basic-info/summary')) as {
+    entities?: BasicInfoSummaryRow[];
+  };
+  return data.entities ?? [];
+}
+
+export interface BulkBasicInfoResult {
+  results: { id: string; result: 'inserted' | 'updated' | 'not_in_plan' | 'invalid' }[];
+  applied: number;
+  completed: number;
+  section_status: string | null;
+}
+
+/** Basic Information: apply the same fields to many plan entities, optionally marking them all Complete. */
+export async function bulkApplyBasicInfo(
+  planId: string,
+  ids: string[],
+  fields: Record<string, unknown>,
+  markComplete = false
+): Promise<BulkBasicInfoResult> {
+  return (await apiPost('/api/svp/plans/' + encodeURIComponent(planId) + '/basic-info/bulk', {
+    ids,
+    fields,
+    mark_complete: markComplete,
+  })) as BulkBasicInfoResult;
+}
+
 /** Basic Information: get option lists for dropdowns/checkboxes. */
 export async function getBasicInfoOptions(): Promise<unknown> {
   return apiGet('/api/svp/basic-info/options');
@@ -170,3 +420,186 @@ export async function updateBasicInfo(planId: string, entityId: string, payload:
     payload
   );
 }
+
+export interface DashboardBucket {
+  plans: number;
+  entities: number;
+  complete_entities: number;
+  visit_started_entities: number;
+  with_basic_info_entities: number;
+  completion_rate: number | null;
+  value?: string;
+}
+
+export interface DashboardResult {
+  totals: DashboardBucket;
+  by_status: DashboardBucket[];
+  by_team_name: DashboardBucket[];
+  by_plan_period: DashboardBucket[];
+  by_plan_for: DashboardBucket[];
+  upcoming_visits: { months_ahead: number; total: number; months: { month: string; visits: number }[] };
+  freshness: {
+    refreshed_at: string | null;
+    age_seconds: number | null;
+    max_age_seconds: number;
+    stale: boolean;
+    refreshing: boolean;
+  };
+}
+
+/** Dashboard aggregates from the materialized views, with freshness info. */
+export async function getDashboard(filters: GridFilters = {}, monthsAhead = 3): Promise<DashboardResult> {
+  return (await apiGet('/api/svp/dashboard' + gridQueryString(filters, { months_ahead: String(monthsAhead) }))) as DashboardResult;
+}
+
+export interface CalendarVisit {
+  plan_id: string;
+  plan_code: string;
+  plan_name: string;
+  team_name: string;
+  plan_status: string;
+  plan_entity_id: string;
+  entity_number: string;
+  entity_name: string;
+  entity_status: string;
+  start_date: string | null;
+  end_date: string | null;
+  default_assignee: string | null;
+  optional_assignee_assignee: string | null;
+  location: string | null;
+  site_visit_type_primary: string | null;
+  prioritization: string | null;
+  assignee?: string;
+}
+
+/** Site visits overlapping [from, to] (YYYY-MM-DD, inclusive) across plans. */
+export async function getVisitCalendar(
+  from: string,
+  to: string,
+  filters: GridFilters = {},
+  assignee?: string
+): Promise<CalendarVisit[]> {
+  const data = (await apiGet(
+    '/api/svp/calendar' + gridQueryString(filters, { from, to, assignee })
+  )) as { visits?: CalendarVisit[] };
+  return data.visits ?? [];
+}
+
+/** Other visits that overlap the dates for the same assignee(s); excludePlanEntityId skips the visit being edited. */
+export async function getAssigneeConflicts(
+  startDate: string,
+  endDate: string | null,
+  assignees: string[],
+  excludePlanEntityId?: string
+): Promise<CalendarVisit[]> {
+  const data = (await apiGet(
+    '/api/svp/calendar/conflicts' +
+      gridQueryString({}, { start_date: startDate, end_date: endDate ?? undefined, assignee: assignees, exclude: excludePlanEntityId })
+  )) as { conflicts?: CalendarVisit[] };
+  return data.conflicts ?? [];
+}
+
+export interface SiteVisitSearchResult {
+  total: number;
+  limit: number;
+  offset: number;
+  visits: (CalendarVisit & {
+    conducted_by: string[];
+    reason_types: string[];
+    areas_of_review: string[];
+    participants: string[];
+    additional_programs: string[];
+  })[];
+}
+
+/** Search visits across plans; contains maps a list field (areas_of_review, participants, ...) to values that must all be present. */
+export async function searchSiteVisits(
+  contains: GridFilters,
+  options: { from?: string; to?: string; filters?: GridFilters; limit?: number; offset?: number } = {}
+): Promise<SiteVisitSearchResult> {
+  const { from, to, filters = {}, limit = 50, offset = 0 } = options;
+  return (await apiGet(
+    '/api/svp/site-visits/search' +
+      gridQueryString({ ...filters, ...contains }, { from, to, limit: String(limit), offset: String(offset) })
+  )) as SiteVisitSearchResult;
+}
+
+export interface EntitySiteVisit {
+  id: string;
+  start_date: string;
+  end_date: string;
+  visit_type: string | null;
+  source: 'legacy_text' | 'basic_info';
+  plan_entity_id: string | null;
+  plan_id: string | null;
+  plan_code: string | null;
+}
+
+export interface EntitySiteVisitHistory {
+  entity_id: string;
+  entity_number: string;
+  entity_name: string;
+  visits: EntitySiteVisit[];
+}
+
+/** Structured site visit history of an entity, newest first. */
+export async function getEntitySiteVisits(entityId: string): Promise<EntitySiteVisitHistory> {
+  return (await apiGet(`/api/svp/entities/${encodeURIComponent(entityId)}/site-visits`)) as EntitySiteVisitHistory;
+}
+
+export interface EntitiesNotVisitedResult {
+  years: number;
+  total: number;
+  limit: number;
+  offset: number;
+  entities: {
+    id: string;
+    entity_number: string;
+    entity_name: string;
+    city: string;
+    state: string;
+    last_visit_date: string | null;
+  }[];
+}
+
+/** Entities with no site visit in the last `years` years (server default when omitted), least recently visited first. */
+export async function getEntitiesNotVisited(
+  options: { years?: number; limit?: number; offset?: number } = {}
+): Promise<EntitiesNotVisitedResult> {
+  const { years, limit = 50, offset = 0 } = options;
+  return (await apiGet(
+    '/api/svp/entities/not-visited' +
+      gridQueryString({}, { years: years === undefined ? undefined : String(years), limit: String(limit), offset: String(offset) })
+  )) as EntitiesNotVisitedResult;
+}
+
+export interface TravelBudgetMeasures {
+  entities_with_travel: number;
+  travel_plans: number;
+  travelers: number;
+  total_cost: number;
+  unpriced_travel_plans: number;
+}
+
+export interface TravelBudgetResult {
+  totals: TravelBudgetMeasures;
+  by_team_name: (TravelBudgetMeasures & { team_name: string })[];
+  plans: (TravelBudgetMeasures & { plan_id: string; plan_code: string; plan_name: string; team_name: string; status: string })[];
+}
+
+export interface PlanTravelBudget {
+  plan_id: string;
+  plan_code: string;
+  totals: TravelBudgetMeasures;
+  entities: (TravelBudgetMeasures & { id: string; entity_number: string; entity_name: string })[];
+}
+
+/** Travel budget totals per team and per plan; filters: status, team_name, plan_period, plan_for, travel_status. */
+export async function getTravelBudget(filters: GridFilters = {}): Promise<TravelBudgetResult> {
+  return (await apiGet('/api/svp/travel-budget' + gridQueryString(filters))) as TravelBudgetResult;
+}
+
+/** One plan's travel budget with a row per plan entity. */
+export async function getPlanTravelBudget(planId: string): Promise<PlanTravelBudget> {
+  return (await apiGet(`/api/svp/plans/${encodeURIComponent(planId)}/travel-budget`)) as PlanTravelBudget;
+}